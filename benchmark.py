@@ -0,0 +1,354 @@
+import os
+import json
+import time
+import random
+import argparse
+import platform
+from typing import Any, Callable, Dict, List, Text
+
+import neat
+import numpy as np
+
+import main
+from game import Game
+from simulation.compiler import compile_genome
+from simulation.course import Course
+from simulation.engine import Simulation
+from simulation.network import BatchedNetwork
+from sprites.score import Score
+from sprites.utils import load_shapes
+from config import SCREEN_HEIGHT, SCREEN_WIDTH
+
+
+def measure(function: Callable[[], Any], repeat: int) -> float:
+    """
+    Função responsável por medir o tempo médio de uma chamada.
+
+    Parâmetros
+    ----------
+        function: Callable[[], Any]
+            função que será medida
+        repeat: int
+            quantidade de chamadas
+
+    Retorno
+    -------
+        Tempo médio de cada chamada em segundos
+    """
+
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        function()
+
+    return (time.perf_counter() - start) / repeat
+
+
+def measure_steps(simulation: Simulation, size: int, repeat: int) -> float:
+    """
+    Função responsável por medir o tempo médio do `Simulation.step`. Cada
+    pássaro voa quando passa de uma altura própria em torno do centro da
+    abertura, então as mortes acontecem aos poucos. A simulação é reiniciada
+    quando todos morrem, fora da medição.
+
+    Parâmetros
+    ----------
+        simulation: Simulation
+            simulação medida, no modo de colisão desejado
+        size: int
+            quantidade de pássaros
+        repeat: int
+            quantidade de quadros medidos
+
+    Retorno
+    -------
+        Tempo médio de cada quadro em segundos
+    """
+
+    offsets = np.random.default_rng(0).integers(-80, 80, size)
+    policy = lambda indices, inputs: simulation.bird_ypos[indices] > (
+        simulation.gap_center(simulation.next_pipe())[simulation.bird_lane[indices]]
+        + offsets[indices]
+    )
+
+    elapsed = 0.0
+    steps = 0
+
+    while steps < repeat:
+        simulation.reset(size, Course(steps))
+
+        while not simulation.is_over() and steps < repeat:
+            start = time.perf_counter()
+            simulation.step(policy)
+            elapsed += time.perf_counter() - start
+            steps += 1
+
+    return elapsed / steps
+
+
+def measure_collide(simulation: Simulation, size: int, repeat: int) -> float:
+    """
+    Função responsável por medir o tempo médio do `Simulation.collide` no
+    pior caso: um par de pipes sobre a coluna dos pássaros e os pássaros
+    espalhados por toda a altura da tela.
+
+    Parâmetros
+    ----------
+        simulation: Simulation
+            simulação medida, no modo de colisão desejado
+        size: int
+            quantidade de pássaros
+        repeat: int
+            quantidade de chamadas
+
+    Retorno
+    -------
+        Tempo médio de cada chamada em segundos
+    """
+
+    simulation.reset(size, Course(0))
+    simulation.bird_ypos[:] = np.linspace(0, SCREEN_HEIGHT, size).astype(np.int64)
+    simulation.pipe_xpos[simulation.next_pipe()] = simulation.BIRD_XPOS
+
+    indices = np.arange(size)
+
+    return measure(lambda: simulation.collide(indices), repeat)
+
+
+def create_genomes(config: neat.Config, size: int) -> List[tuple]:
+    """
+    Função responsável por criar uma população inicial com o tamanho
+    informado, sem alterar o arquivo de configuração.
+
+    Parâmetros
+    ----------
+        config: neat.Config
+            variável contendo a configuração do algoritimo
+        size: int
+            quantidade de genomas
+
+    Retorno
+    -------
+        Lista de tuplas (id, genoma)
+    """
+
+    reproduction = config.reproduction_type(
+        config.reproduction_config, neat.reporting.ReporterSet(), None,
+    )
+    population = reproduction.create_new(config.genome_type, config.genome_config, size)
+
+    return list(population.items())
+
+
+def bench_loop(config: neat.Config, genomes: List[tuple],
+               headless: bool) -> Dict[Text, float]:
+    """
+    Função responsável por medir o `Game.loop` completo, sem limite de FPS.
+
+    Parâmetros
+    ----------
+        config: neat.Config
+            variável contendo a configuração do algoritimo
+        genomes: List[tuple]
+            genomas que serão utilizados
+        headless: bool
+            executa sem desenhar os sprites
+
+    Retorno
+    -------
+        Dicionário com os quadros e os passos de pássaros por segundo
+    """
+
+    game = Game()
+    game.set_headless(headless)
+    game.GAME_FRAMERATE = 0
+
+    brains = [
+        {"genome": genome, "net": compile_genome(genome, config)}
+        for _, genome in genomes
+    ]
+
+    game.reset(brains, Course(0))
+
+    start = time.perf_counter()
+    game.loop()
+    elapsed = time.perf_counter() - start
+
+    # Cada pássaro vivo acumula o mesmo fitness por quadro
+    bird_steps = sum(
+        brain["genome"].fitness for brain in brains
+    ) / game.simulation.FITNESS_PER_FRAME
+
+    return {
+        "frames": game.simulation.frame,
+        "seconds": elapsed,
+        "frames_per_second": game.simulation.frame / elapsed,
+        "bird_steps_per_second": bird_steps / elapsed,
+    }
+
+
+def bench_calls(config: neat.Config, size: int, repeat: int) -> Dict[Text, float]:
+    """
+    Função responsável por medir o custo das principais funções do quadro.
+
+    Parâmetros
+    ----------
+        config: neat.Config
+            variável contendo a configuração do algoritimo
+        size: int
+            quantidade de pássaros
+        repeat: int
+            quantidade de chamadas de cada função
+
+    Retorno
+    -------
+        Dicionário com o tempo médio, em segundos, de cada chamada
+    """
+
+    genomes = create_genomes(config, size)
+    compiled = [compile_genome(genome, config) for _, genome in genomes]
+    networks = [neat.nn.FeedForwardNetwork.create(genome, config) for _, genome in genomes]
+
+    simulations = {
+        mode: Simulation(size, collision=mode, **load_shapes())
+        for mode in ("analytic", "mask")
+    }
+
+    score = Score(0, SCREEN_WIDTH / 2, 50)
+    values = iter(range(repeat * 2))
+
+    rows = np.arange(size)
+    inputs = np.random.default_rng(0).integers(0, 800, (size, 2)).astype(np.float64)
+    batched = BatchedNetwork(compiled)
+
+    return {
+        "simulation_step_analytic": measure_steps(simulations["analytic"], size, repeat),
+        "simulation_step_mask": measure_steps(simulations["mask"], size, repeat),
+        "collide_analytic": measure_collide(simulations["analytic"], size, repeat),
+        "collide_mask": measure_collide(simulations["mask"], size, repeat),
+        "score_update_same_value": measure(lambda: score.update_score(7), repeat),
+        "score_update_new_value": measure(lambda: score.update_score(next(values)), repeat),
+        "feed_forward_activate": measure(
+            lambda: networks[0].activate([400, 300]), repeat,
+        ),
+        "feed_forward_activate_population": measure(
+            lambda: [net.activate(x) for net, x in zip(networks, inputs.tolist())],
+            max(1, repeat // size),
+        ),
+        "batched_activate_population": measure(
+            lambda: batched.activate(rows, inputs), max(1, repeat // size),
+        ),
+    }
+
+
+def bench_generation(config: neat.Config, genomes: List[tuple]) -> Dict[Text, float]:
+    """
+    Função responsável por medir o tempo de uma geração do `eval_genomes`.
+
+    Parâmetros
+    ----------
+        config: neat.Config
+            variável contendo a configuração do algoritimo
+        genomes: List[tuple]
+            genomas da geração
+
+    Retorno
+    -------
+        Dicionário com o tempo da geração e os passos de pássaros por segundo
+    """
+
+    game = Game()
+    game.set_headless(True)
+    main.course_seeds.seed(0)
+    main.network_cache.clear()
+
+    start = time.perf_counter()
+    main.eval_genomes(genomes, config)
+    elapsed = time.perf_counter() - start
+
+    bird_steps = sum(
+        genome.fitness for _, genome in genomes
+    ) / game.simulation.FITNESS_PER_FRAME
+
+    return {
+        "seconds": elapsed,
+        "bird_steps_per_second": bird_steps / elapsed,
+    }
+
+
+def run(config_file: Text, sizes: List[int], repeat: int) -> Dict[Text, Any]:
+    """
+    Função responsável por executar todos os benchmarks.
+
+    Parâmetros
+    ----------
+        config_file: Text
+            caminho do arquivo de configuração do NEAT
+        sizes: List[int]
+            tamanhos de população avaliados
+        repeat: int
+            quantidade de chamadas nas medições de funções
+
+    Retorno
+    -------
+        Dicionário com todos os resultados
+    """
+
+    config = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                         neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                         config_file)
+
+    random.seed(0)
+    Game(headless=True)
+
+    populations = {size: create_genomes(config, size) for size in sizes}
+
+    return {
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpus": os.cpu_count(),
+        },
+        "loop": {
+            str(size): {
+                "headless": bench_loop(config, genomes, True),
+                "rendered": bench_loop(config, genomes, False),
+            }
+            for size, genomes in populations.items()
+        },
+        "calls": bench_calls(config, sizes[0], repeat),
+        "generation": {
+            str(size): bench_generation(config, genomes)
+            for size, genomes in populations.items()
+        },
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmarks do NEAT Flappy Bird")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[50, 500, 5000],
+        help="tamanhos de população avaliados",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1000,
+        help="quantidade de chamadas nas medições de funções",
+    )
+    parser.add_argument(
+        "--output", default=None,
+        help="arquivo JSON onde os resultados serão salvos",
+    )
+    args = parser.parse_args()
+
+    local_dir = os.path.dirname(__file__)
+    config_path = os.path.join(local_dir, 'config-feedforward')
+
+    results = run(config_path, args.sizes, args.repeat)
+    report = json.dumps(results, indent=4)
+
+    if args.output is None:
+        print(report)
+    else:
+        with open(args.output, "w") as output:
+            output.write(report)
@@ -18,3 +18,111 @@ GAME_SPEED = 10
 SCORE_TEXT_SCALE = 1.5
 
 MAX_GENERATIONS = 200
+
+HEADLESS = False
+
+EVAL_WORKERS = 1
+
+# "analytic" compara apenas retângulos, "mask" compara as máscaras pixel a pixel
+COLLISION_MODE = "analytic"
+
+# Entradas das redes neurais: "classic" (as duas entradas originais) ou
+# "rich". O num_inputs do config-feedforward é ajustado ao conjunto escolhido
+SENSORS = "classic"
+
+COURSE_LENGTH = 512
+
+COURSE_SEED = None
+
+# Todas as gerações jogam o mesmo percurso, permitindo reaproveitar o
+# fitness dos genomas que não mudaram
+FIXED_COURSE = False
+
+# Percursos jogados ao mesmo tempo por cada genoma em uma geração, e a forma
+# de combinar o fitness deles: "mean" ou "min"
+EVAL_COURSES = 1
+
+FITNESS_AGGREGATION = "mean"
+
+# Currículo: as gerações começam em percursos fáceis (aberturas maiores,
+# pipes mais lentos e alturas próximas do centro) e com uma população menor,
+# e avançam um nível sempre que o melhor genoma alcança CURRICULUM_PROMOTION.
+# O último nível usa PIPE_GAP, GAME_SPEED e o pop_size do config-feedforward
+CURRICULUM = False
+
+CURRICULUM_LEVELS = 4
+
+CURRICULUM_START_GAP = 300
+
+CURRICULUM_START_SPEED = 6
+
+CURRICULUM_START_SPREAD = 0.3
+
+CURRICULUM_PROMOTION = 200
+
+CURRICULUM_MIN_POPULATION = 20
+
+# No último nível, o limite de quadros é CURRICULUM_BUDGET_GROWTH vezes a
+# duração do melhor pássaro da geração anterior, nunca menor que
+# CURRICULUM_MIN_FRAMES
+CURRICULUM_MIN_FRAMES = 1000
+
+CURRICULUM_BUDGET_GROWTH = 2.0
+
+NETWORK_CACHE_SIZE = 1024
+
+# Evolução em ilhas: populações independentes em processos separados, que
+# trocam os MIGRANTS melhores genomas a cada MIGRATION_INTERVAL gerações
+ISLANDS = 1
+
+MIGRATION_INTERVAL = 10
+
+MIGRANTS = 2
+
+PROFILE = False
+
+# Arquivo JSON onde o tempo das fases de todas as gerações é salvo, None
+# para apenas mostrá-lo no terminal
+PROFILE_OUTPUT = None
+
+# Pássaros desenhados com a janela aberta: "all", "top", "sample" ou "best".
+# "top" e "best" escolhem os pássaros mais próximos do centro da próxima
+# abertura. Todos continuam sendo simulados
+RENDER_MODE = "all"
+
+RENDER_COUNT = 20
+
+# Quadros simulados a cada quadro desenhado, alterado pelas setas do teclado
+RENDER_STRIDE = 1
+
+MAX_RENDER_STRIDE = 128
+
+# Checkpoints incrementais, salvas a cada CHECKPOINT_INTERVAL gerações
+CHECKPOINT_DIR = "checkpoints"
+
+CHECKPOINT_INTERVAL = 5
+
+CHECKPOINT_KEEP = 3
+
+# Diretório onde as ações de cada geração são gravadas, None para não gravar
+RECORD_DIR = None
+
+# Arquivo .npz onde a rede do vencedor é exportada, None para não exportar
+EXPORT_POLICY = None
+
+# Limite de quadros das partidas do play.py sem janela, quando nenhum limite
+# é informado, pois uma política forte pode jogar para sempre
+PLAY_HEADLESS_MAX_FRAMES = 100000
+
+# Limites de cada avaliação, None para jogar até o último pássaro morrer
+MAX_FRAMES = None
+
+MAX_PIPES = None
+
+# Encerra a avaliação quando restarem essa quantidade de pássaros ou menos.
+# Exige MAX_FRAMES, até onde o fitness dos sobreviventes é extrapolado
+ELITE_STOP = 0
+
+# Encerra a avaliação assim que o fitness de algum genoma alcança o
+# fitness_threshold. Desativa o reaproveitamento do fitness entre gerações
+STOP_AT_THRESHOLD = False
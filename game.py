@@ -1,17 +1,35 @@
-from typing import Dict, List, Text, Any, Tuple
+import os
+from typing import Callable, Dict, List, Optional, Sequence, Text, Any, Tuple, Union
 
+import numpy as np
 import pygame
 from pygame.locals import *
 
-from sprites.utils import is_horizontal_off_screen
+from simulation.course import Course
+from simulation.engine import Simulation
+from simulation.network import BatchedNetwork
+from simulation.policy import Policy
+from simulation.profiling import PhaseProfiler
+from simulation.recording import ActionRecorder, Episode
+from simulation.termination import TerminationPolicy
+from sprites.assets import get_image, invalidate
+from sprites.utils import load_shapes
 from sprites.bird import Bird
 from sprites.ground import Ground
+from sprites.label import Label
 from sprites.pipe import Pipe
 from sprites.score import Score
 from config import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
-    FPS
+    FPS,
+    HEADLESS,
+    PROFILE,
+    RENDER_MODE,
+    RENDER_COUNT,
+    RENDER_STRIDE,
+    MAX_RENDER_STRIDE,
+    FITNESS_AGGREGATION,
 )
 
 
@@ -40,116 +58,336 @@ class SingletonMeta(type):
 class Game(metaclass=SingletonMeta):
     """
     Classe responsável pode criar toda a interface do jogo, manter o loop de
-    execução e atualizar os sprites.
+    execução e atualizar os sprites. As regras do jogo são executadas pela
+    `Simulation` e a classe Game apenas desenha o estado simulado. Quando a
+    população joga vários percursos, apenas a primeira faixa é desenhada.
 
     Atributos
     ---------
+        RENDER_MODES : tuple
+            modos de desenho aceitos em `render_mode`
+        LAYERS : dict
+            camada de cada grupo de sprites, da mais ao fundo para a mais
+            à frente
         SCREEN_SHAPE : tuple
             dimensões da tela do jogo
         GAME_FRAMERATE : int
             taxa de atualização de quadros
         SCORE : int
             score que será mostrado na tela do jogo
+        headless : bool
+            indica se o jogo está rodando sem janela, sem desenho e sem
+            limite de quadros por segundo
         screen : Surface
             superficie onde o jogo será desenhado
+        simulation : Simulation
+            estado do jogo, lido pela interface a cada quadro
+        profiler : PhaseProfiler
+            mede o tempo de cada fase do loop quando habilitado. É
+            compartilhado com a simulação, então a fase "simulation" inclui
+            as fases "physics", "sensors", "inference", "movement" e
+            "collision"
         groups : Dict[Text, Any]
             grupos de sprites utilizadas no jogo
+        render_mode : Text
+            pássaros desenhados: todos os vivos ("all"), os mais próximos
+            do centro da abertura ("top"), uma amostra aleatória ("sample")
+            ou apenas o mais próximo ("best")
+        render_count : int
+            quantidade de pássaros desenhados nos modos "top" e "sample"
+        render_stride : int
+            quantidade de quadros simulados a cada quadro desenhado. Pode
+            ser alterada pelo teclado durante o jogo
+        dump_dir : Text, optional
+            diretório onde cada quadro desenhado é salvo como imagem, mesmo
+            no modo headless
+        episode : Episode, optional
+            ações da última partida, quando ela foi gravada
 
     Métodos
     -------
-        reset(brains: List[Dict[Text, Any]]) -> None:
+        set_headless(headless: bool) -> None:
+            Alterna entre o modo com janela e o modo sem interface.
+        reset(brains: List[Dict[Text, Any]],
+              course: Union[Course, Sequence[Course], None] = None,
+              termination: Optional[TerminationPolicy] = None,
+              record: bool = False, aggregation: Text = FITNESS_AGGREGATION) -> None:
             Volta o jogo ao estado inicial.
+        load_episode(episode: Episode, birds: Optional[Sequence[int]] = None) -> None:
+            Prepara o jogo para reproduzir uma partida gravada.
+        load_policy(policy: Policy,
+                    course: Union[Course, Sequence[Course], None] = None,
+                    termination: Optional[TerminationPolicy] = None) -> None:
+            Prepara o jogo para uma partida com uma política exportada.
         loop() -> None:
             Executa o loop do jogo.
     """
 
+    RENDER_MODES: Tuple[Text, ...] = ("all", "top", "sample", "best")
+    LAYERS: Dict[Text, int] = {"birds": 0, "ground": 1, "pipes": 2, "score": 3, "overlay": 4}
     SCREEN_SHAPE: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT)
     GAME_FRAMERATE: int = FPS
     SCORE: int = 0
 
-    def __init__(self):
+    def __init__(self, headless: bool = HEADLESS):
         """
         Método de inicialização da classe Game, iniciando a interface completa.
         A interface não será reconstruida ao longo da execução.
+
+        Parâmetros
+        ----------
+            headless : bool, optional
+                executa o jogo sem janela, sem desenhar os sprites e sem
+                limitar a taxa de quadros, ideal para o treinamento
         """
 
+        self.headless = headless
+
+        # Driver de vídeo do ambiente antes do modo headless, restaurado ao
+        # voltar para o modo com janela
+        self.__previous_driver = None
+        self.__driver_replaced = False
+        self.__set_video_driver()
+
         pygame.init()
 
         self.screen = pygame.display.set_mode(self.SCREEN_SHAPE)
-        self.__background = pygame.transform.scale(
-            pygame.image.load("assets/background-day.png"),
-            self.SCREEN_SHAPE,
-        )
-
-        self.__pipe_gap_centers = []
+        self.__background = get_image("background-day", self.SCREEN_SHAPE, convert=True)
+
+        self.profiler = PhaseProfiler(PROFILE)
+        self.render_mode = RENDER_MODE
+        self.render_count = RENDER_COUNT
+        self.render_stride = RENDER_STRIDE
+        self.dump_dir = None
+        self.episode = None
+
+        self.__brains = []
+        self.__render_priority = np.zeros(0, dtype=np.int64)
+        self.__termination = TerminationPolicy()
+        self.__aggregation = FITNESS_AGGREGATION
+        self.__policy = self.__decide
+        self.__recorder = None
+        self.__network = BatchedNetwork([])
+        self.__bird_sprites = {}
+        self.__pipe_sprites = []
+        self.simulation = self.__create_simulation()
         self.groups = self.__initialize_groups()
 
-    def __initialize_groups(self, brains: List[Dict[Text, Any]]=[]) -> Dict[Text, Any]:
+    def __set_video_driver(self) -> None:
         """
-        Método responsável por criar o conjunto de sprites que serão utilizadas
-        ao longo da execução do jogo.
+        Método responsável por escolher o driver de vídeo do SDL. No modo
+        headless é utilizado o driver `dummy`, que não abre nenhuma janela,
+        mas ainda permite a conversão das imagens dos sprites. Ao sair do
+        modo headless, apenas o valor definido pela própria classe é
+        desfeito, preservando o driver escolhido pelo usuário.
+        """
+
+        if self.headless and not self.__driver_replaced:
+            self.__previous_driver = os.environ.get("SDL_VIDEODRIVER")
+            self.__driver_replaced = True
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+        elif not self.headless and self.__driver_replaced:
+            self.__driver_replaced = False
+
+            if self.__previous_driver is None:
+                os.environ.pop("SDL_VIDEODRIVER", None)
+            else:
+                os.environ["SDL_VIDEODRIVER"] = self.__previous_driver
+
+    def set_headless(self, headless: bool) -> None:
+        """
+        Método responsável por alternar entre o modo com janela e o modo
+        headless, reiniciando apenas o módulo de display do pygame.
 
         Parâmetros
         ----------
-            brains : list, optional
-                conjunto de genomas que serão utilizados na instância
+            headless : bool
+                indica se o jogo deve rodar sem interface
+        """
+
+        if headless == self.headless:
+            return
+
+        self.headless = headless
+        self.__set_video_driver()
+
+        pygame.display.quit()
+        pygame.display.init()
+
+        self.screen = pygame.display.set_mode(self.SCREEN_SHAPE)
+
+        # Descarta as imagens convertidas para o display anterior e recria os
+        # sprites com as novas
+        invalidate()
+        self.__background = get_image("background-day", self.SCREEN_SHAPE, convert=True)
+        self.groups = self.__initialize_groups()
+
+    def __create_simulation(self) -> Simulation:
+        """
+        Método responsável por criar a simulação utilizando as mesmas
+        máscaras de colisão dos sprites.
+
+        Retorno
+        -------
+            Instância da simulação sem nenhum pássaro
+        """
+
+        # As máscaras são geradas uma única vez a partir dos sprites, e as
+        # fases da simulação são medidas pelo mesmo profiler do jogo
+        return Simulation(0, profiler=self.profiler, **load_shapes())
+
+    def __initialize_groups(self) -> Dict[Text, Any]:
+        """
+        Método responsável por criar o conjunto de sprites que serão utilizadas
+        ao longo da execução do jogo, a partir do estado da simulação.
 
         Retorno
         -------
             Dicionário contendo todos os grupos de sprites utilizados no jogo
         """
 
+        simulation = self.simulation
+
         # Inicializa os grupos de sprites
         bird_group = pygame.sprite.Group()
         ground_group = pygame.sprite.Group()
         pipe_group = pygame.sprite.Group()
-        score = Score(self.SCORE, SCREEN_WIDTH / 2, 50)
-
-        # Cria os sprites dos pássaros em conjunto com as redes neurais
-        for brain in brains:
-            bird_group.add(Bird(brain))
-
-        # Adiciona os sprites do solo
-        ground_group.add(Ground(0))
-        ground_group.add(Ground(SCREEN_WIDTH))
-
-        # Inicia os sprites dos Pipes
-        for i in range(2):
-            pipes = Pipe.get_random_pipes(SCREEN_WIDTH * i + 800)
+        score = Score(self.SCORE, SCREEN_WIDTH / 2, 50, composed=True)
+        overlay = Label(10, 10)
+
+        # Os sprites dos pássaros são criados apenas quando desenhados
+        self.__bird_sprites = {}
+
+        # Adiciona a faixa do solo
+        ground_group.add(Ground())
+
+        # Inicia um par de sprites dos Pipes para cada slot da simulação,
+        # com as aberturas da primeira faixa. Os pares são reaproveitados
+        # junto com os slots
+        self.__pipe_sprites = [
+            Pipe.get_pipes(
+                int(simulation.pipe_xpos[slot]),
+                int(simulation.pipe_gap_top[slot, 0]),
+                int(simulation.pipe_gap_bottom[slot, 0]),
+            )
+            for slot in range(simulation.PIPE_SLOTS)
+        ]
 
-            parallel_pipes = pygame.sprite.Group()
-            parallel_pipes.add(pipes[0])
-            parallel_pipes.add(pipes[1])
+        for pipes in self.__pipe_sprites:
+            pipe_group.add(*pipes)
 
-            pipe_group.add(parallel_pipes)
+        # Todos os sprites são desenhados por um único grupo, em camadas, que
+        # atualiza na tela apenas as regiões alteradas
+        overlay.visible = int(self.render_mode != "all")
 
-            self.__pipe_gap_centers.append(
-                (pipes[0].rect[1] + (pipes[1].rect[1] + pipes[1].rect[3])) // 2
-            )
+        self.__layers = pygame.sprite.LayeredDirty()
+        self.__layers.add(ground_group.sprites(), layer=self.LAYERS["ground"])
+        self.__layers.add(pipe_group.sprites(), layer=self.LAYERS["pipes"])
+        self.__layers.add(score.sprite, layer=self.LAYERS["score"])
+        self.__layers.add(overlay, layer=self.LAYERS["overlay"])
+        self.__layers.clear(self.screen, self.__background)
 
         return {
             "birds": bird_group,
             "ground": ground_group,
             "pipes": pipe_group,
             "score": score,
+            "overlay": overlay,
         }
 
-    def __update_sprites(self) -> None:
+    def __update_sprites(self) -> List[pygame.Rect]:
         """
-        Método responsável por atualizar o estado de todos os sprites do
-        jogo.
+        Método responsável por copiar o estado da simulação para todos os
+        sprites do jogo e desenhá-los na tela.
+
+        Retorno
+        -------
+            Regiões da tela que foram alteradas
         """
 
-        next_pipe_center_pos = self.__pipe_gap_centers[0]
+        simulation = self.simulation
+        bird_group = self.groups["birds"]
 
-        # Chama o método de atualização dos grupos
-        for key, group in self.groups.items():
-            if key == "birds":
-                group.update(next_pipe_center_pos)
-            else:
-                group.update()
+        visible = self.__visible_birds().tolist()
+
+        # Cria os sprites dos pássaros que passaram a ser desenhados
+        for index in visible:
+            if index not in self.__bird_sprites:
+                self.__bird_sprites[index] = Bird(index)
+                bird_group.add(self.__bird_sprites[index])
+                self.__layers.add(self.__bird_sprites[index], layer=self.LAYERS["birds"])
+
+        # Descarta os pássaros vivos que deixaram de ser desenhados. Os
+        # mortos ainda aparecem neste quadro, na posição da colisão
+        if len(self.__bird_sprites) > len(visible):
+            hidden = set(self.__bird_sprites).difference(visible)
+
+            for index in hidden:
+                if simulation.alive[index]:
+                    self.__bird_sprites.pop(index).kill()
+
+        for bird in bird_group.sprites():
+            bird.update(simulation.bird_ypos[bird.index], simulation.frame)
+
+        self.groups["ground"].update(simulation.frame * simulation.speed)
+
+        # Cada par de sprites acompanha o seu slot da simulação
+        for (pipe, inverted_pipe), xpos in zip(self.__pipe_sprites,
+                                               simulation.pipe_xpos.tolist()):
+            pipe.update(xpos)
+            inverted_pipe.update(xpos)
+
+        if self.render_mode != "all":
+            alive = int(simulation.alive[:simulation.population_size].sum())
+            self.groups["overlay"].set_text(f"{len(visible)} / {alive}")
+
+        return self.__layers.draw(self.screen)
+
+    def __visible_birds(self) -> np.ndarray:
+        """
+        Método responsável por escolher os pássaros que serão desenhados,
+        de acordo com o `render_mode`, entre os vivos da primeira faixa. Um
+        pássaro escolhido continua sendo desenhado até morrer. No modo
+        "sample" os mortos são substituídos pelos próximos de uma fila
+        aleatória. Nos modos "top" e "best" as vagas vão para os pássaros
+        mais próximos do centro da próxima abertura, já que todos os vivos
+        têm o mesmo fitness.
+
+        Retorno
+        -------
+            Índices dos pássaros desenhados no quadro
+        """
 
-            group.draw(self.screen)
+        simulation = self.simulation
+        alive = np.flatnonzero(simulation.alive[:simulation.population_size])
+
+        if self.render_mode == "all":
+            return alive
+
+        if self.render_mode == "sample":
+            order = np.argsort(self.__render_priority[alive], kind="stable")
+
+            return alive[order[:self.render_count]]
+
+        count = 1 if self.render_mode == "best" else self.render_count
+
+        # Os pássaros já desenhados que continuam vivos mantêm o seu lugar
+        kept = np.array(
+            [index for index in self.__bird_sprites if simulation.alive[index]],
+            dtype=np.int64,
+        )[:count]
+
+        if len(kept) == count:
+            return kept
+
+        candidates = np.setdiff1d(alive, kept, assume_unique=True)
+        center = simulation.gap_center(simulation.next_pipe())[0]
+        distance = np.abs(
+            simulation.bird_ypos[candidates] + simulation.bird_shape.height / 2 - center
+        )
+        order = np.argsort(distance, kind="stable")
+
+        return np.concatenate((kept, candidates[order[:count - len(kept)]]))
 
     def __handle_events(self) -> None:
         """
@@ -159,72 +397,265 @@ class Game(metaclass=SingletonMeta):
         for event in pygame.event.get():
             if event.type == QUIT:
                 pygame.quit()
+            elif event.type == KEYDOWN:
+                self.__change_stride(event.key)
 
-    def __replace_pipes(self) -> None:
+    def __change_stride(self, key: int) -> None:
         """
-        Método responsável por substituir um pipe quando ele sai da tela,
-        colocando o novo na posição inicial.
+        Método responsável por alterar o salto de quadros pelo teclado. As
+        setas para cima e para baixo dobram e dividem pela metade a
+        quantidade de quadros simulados a cada quadro desenhado, e a tecla
+        1 volta para a velocidade normal.
+
+        Parâmetros
+        ----------
+            key: int
+                tecla pressionada
         """
 
-        pipe_group = self.groups["pipes"]
+        if key in (K_UP, K_RIGHT):
+            stride = self.render_stride * 2
+        elif key in (K_DOWN, K_LEFT):
+            stride = self.render_stride // 2
+        elif key == K_1:
+            stride = 1
+        else:
+            return
 
-        # Remove o Pipe antigo do grupo de pipes
-        pipe_group.remove(pipe_group.sprites()[0])
-        pipe_group.remove(pipe_group.sprites()[0])
-        self.__pipe_gap_centers.pop(0)
+        self.render_stride = min(max(stride, 1), MAX_RENDER_STRIDE)
+        pygame.display.set_caption(f"Flappy Bird x{self.render_stride}")
 
-        # Gera novos pipes com a abertura em um ponto aleatório
-        pipes = Pipe.get_random_pipes(SCREEN_WIDTH * 2)
+    def __replace_pipes(self) -> None:
+        """
+        Método responsável por reposicionar o par de sprites do slot que a
+        simulação acabou de reaproveitar, com a nova abertura, sem criar
+        nem remover sprites.
+        """
 
-        # Cria um novo subgrupo com os pipes gerados
-        parallel_pipes = pygame.sprite.Group()
-        parallel_pipes.add(pipes[0])
-        parallel_pipes.add(pipes[1])
+        simulation = self.simulation
+        slot = (simulation.pipe_head - 1) % simulation.PIPE_SLOTS
+        xpos = int(simulation.pipe_xpos[slot])
 
-        pipe_group.add(parallel_pipes)
+        pipe, inverted_pipe = self.__pipe_sprites[slot]
 
-        # Atualiza a variável que guarda o centro do gap dos pipes
-        self.__pipe_gap_centers.append(
-            (pipes[0].rect[1] + (pipes[1].rect[1] + pipes[1].rect[3])) // 2
-        )
+        pipe.place(xpos, SCREEN_HEIGHT - int(simulation.pipe_gap_bottom[slot, 0]))
+        inverted_pipe.place(xpos, int(simulation.pipe_gap_top[slot, 0]))
 
     def __remove_when_collide(self) -> None:
         """
-        Método responsável por lidar com as colisões dos pássaros com o
-        chão e com os pipes, além de uma eventual saida da tela pela parte
-        de cima do cenário.
+        Método responsável por remover os sprites dos pássaros que a
+        simulação marcou como mortos, seja por colisão com o chão, com os
+        pipes ou por saírem da tela.
         """
 
-        bird_group = self.groups["birds"]
-        ground_group = self.groups["ground"]
-        pipe_group = self.groups["pipes"]
+        alive = self.simulation.alive
 
-        # Remove os pássaros que colidiram com os pipes ou o chão
-        collide = lambda group1, group2: pygame.sprite.groupcollide(
-            group1, group2, True, False, pygame.sprite.collide_mask,
-        )
+        for bird in self.groups["birds"].sprites():
+            if not alive[bird.index]:
+                bird.kill()
+                del self.__bird_sprites[bird.index]
 
-        collide(bird_group, ground_group)
-        collide(bird_group, pipe_group)
+    def __decide(self, indices: np.ndarray, inputs: np.ndarray) -> np.ndarray:
+        """
+        Método que avalia de uma só vez as redes neurais dos pássaros vivos
+        para decidir quais devem voar.
 
-        # Remove os pássaros que sairam da tela pela parte de cima
-        for bird in bird_group.sprites():
-            if bird.rect[1] < 0 or bird.rect[1] > SCREEN_HEIGHT:
-                bird.kill()
+        Parâmetros
+        ----------
+            indices: np.ndarray
+                índices dos pássaros vivos na simulação
+            inputs: np.ndarray
+                entradas das redes neurais, uma linha por pássaro
+
+        Retorno
+        -------
+            Array booleano indicando os pássaros que devem voar
+        """
 
-    def reset(self, brains: List[Dict[Text, Any]]) -> None:
+        # Cada faixa repete as mesmas redes, na mesma ordem
+        rows = indices % self.simulation.population_size
+
+        with self.profiler.phase("inference"):
+            output = self.__network.activate(rows, inputs)
+
+        # Voa se a saida for maior que o threshold
+        return output[:, 0] > 0.5
+
+    def __start(self, population_size: int,
+                course: Union[Course, Sequence[Course], None],
+                termination: Optional[TerminationPolicy],
+                policy: Callable[[np.ndarray, np.ndarray], np.ndarray]) -> None:
+        """
+        Método responsável por reiniciar a simulação e os sprites para uma
+        nova partida.
+
+        Parâmetros
+        ----------
+            population_size : int
+                quantidade de pássaros de cada faixa da partida
+            course : Union[Course, Sequence[Course]], optional
+                percurso com as aberturas dos pipes, ou um percurso por faixa
+            termination : TerminationPolicy, optional
+                regras para encerrar a partida antes do último pássaro morrer
+            policy : Callable[[np.ndarray, np.ndarray], np.ndarray]
+                função que decide quais pássaros voam
+        """
+
+        if self.render_mode not in self.RENDER_MODES:
+            raise ValueError(f"Modo de desenho desconhecido: {self.render_mode}")
+
+        self.SCORE = 0
+        self.episode = None
+        self.__render_priority = np.random.default_rng().permutation(population_size)
+        self.__termination = termination or TerminationPolicy()
+        self.__policy = policy
+        self.__recorder = None
+        self.simulation.reset(population_size, course)
+        self.groups = self.__initialize_groups()
+
+    def reset(self, brains: List[Dict[Text, Any]],
+              course: Union[Course, Sequence[Course], None] = None,
+              termination: Optional[TerminationPolicy] = None,
+              record: bool = False, aggregation: Text = FITNESS_AGGREGATION) -> None:
         """
         Método responsável por voltar o jogo ao estado inicial.
 
         Parâmetros
         ----------
             brains : list
-                conjunto de genomas que serão utilizados na instância
+                conjunto de genomas e redes compiladas que serão utilizados
+                na instância
+            course : Union[Course, Sequence[Course]], optional
+                percurso com as aberturas dos pipes, ou uma lista de
+                percursos jogados ao mesmo tempo por todos os genomas
+            termination : TerminationPolicy, optional
+                regras para encerrar a partida antes do último pássaro morrer
+            record : bool, optional
+                grava as ações dos pássaros, disponíveis em `episode` ao fim
+                do loop. Disponível apenas com um único percurso
+            aggregation : Text, optional
+                forma de combinar o fitness dos percursos, "mean" ou "min"
         """
 
-        self.SCORE = 0
-        self.__pipe_gap_centers = []
-        self.groups = self.__initialize_groups(brains)
+        self.__brains = brains
+        self.__network = BatchedNetwork([brain["net"] for brain in brains])
+        self.__start(len(brains), course, termination, self.__decide)
+        self.__aggregation = aggregation
+
+        if record:
+            if self.simulation.lanes > 1:
+                raise ValueError("A gravação só é possível com um único percurso")
+
+            self.__recorder = ActionRecorder(self.simulation, self.__decide)
+            self.__policy = self.__recorder
+
+    def load_episode(self, episode: Episode, birds: Optional[Sequence[int]] = None) -> None:
+        """
+        Método responsável por preparar o jogo para reproduzir uma partida
+        gravada, repetindo as ações registradas sem executar as redes
+        neurais.
+
+        Parâmetros
+        ----------
+            episode : Episode
+                partida gravada
+            birds : Sequence[int], optional
+                pássaros reproduzidos. Quando omitido, todos são reproduzidos
+        """
+
+        size = len(episode) if birds is None else len(birds)
+
+        self.__brains = []
+        self.__network = BatchedNetwork([])
+        self.__aggregation = FITNESS_AGGREGATION
+        self.__start(
+            size, episode.course(), TerminationPolicy(max_frames=episode.frames),
+            episode.policy(self.simulation, birds),
+        )
+
+    def load_policy(self, policy: Policy,
+                    course: Union[Course, Sequence[Course], None] = None,
+                    termination: Optional[TerminationPolicy] = None) -> None:
+        """
+        Método responsável por preparar o jogo para uma partida com uma
+        política exportada, sem genoma e sem a biblioteca NEAT. Os sensores
+        da simulação passam a ser os da política, e o fitness fica apenas na
+        simulação.
+
+        Parâmetros
+        ----------
+            policy : Policy
+                política exportada do vencedor de um treinamento
+            course : Union[Course, Sequence[Course]], optional
+                percurso com as aberturas dos pipes, ou uma lista de
+                percursos jogados ao mesmo tempo pela política
+            termination : TerminationPolicy, optional
+                regras para encerrar a partida antes do pássaro morrer
+        """
+
+        self.simulation.set_sensors(policy.sensors)
+
+        self.__brains = []
+        self.__network = BatchedNetwork([policy.network])
+        self.__aggregation = FITNESS_AGGREGATION
+        self.__start(1, course, termination, self.__decide)
+
+    def __advance(self, steps: int) -> bool:
+        """
+        Método responsável por avançar a simulação alguns quadros sem
+        desenhá-los, atualizando os pipes a cada novo par criado.
+
+        Parâmetros
+        ----------
+            steps: int
+                quantidade máxima de quadros simulados
+
+        Retorno
+        -------
+            True se a partida terminou
+        """
+
+        profiler = self.profiler
+
+        for _ in range(steps):
+            with profiler.phase("simulation"):
+                self.simulation.step(self.__policy)
+
+            # Verifica se um novo par de pipes foi criado
+            if self.simulation.score != self.SCORE:
+                self.SCORE = self.simulation.score
+
+                if self.__is_drawing():
+                    with profiler.phase("pipes"):
+                        self.__replace_pipes()
+
+            if self.__termination.should_stop(self.simulation, self.__aggregation):
+                return True
+
+        return False
+
+    def __is_drawing(self) -> bool:
+        """
+        Método que indica se os quadros precisam ser desenhados, seja para
+        mostrá-los na janela ou para salvá-los em arquivos.
+
+        Retorno
+        -------
+            True se os sprites devem ser atualizados e desenhados
+        """
+
+        return not self.headless or self.dump_dir is not None
+
+    def __dump_frame(self) -> None:
+        """
+        Método responsável por salvar a tela atual em uma imagem no
+        diretório `dump_dir`, nomeada pelo quadro da simulação.
+        """
+
+        os.makedirs(self.dump_dir, exist_ok=True)
+        filename = "frame-{0:06d}.png".format(self.simulation.frame)
+
+        pygame.image.save(self.screen, os.path.join(self.dump_dir, filename))
 
     def loop(self) -> None:
         """
@@ -234,30 +665,63 @@ class Game(metaclass=SingletonMeta):
         # Define o clock do jogo
         clock = pygame.time.Clock()
 
-        while True:
-            clock.tick(self.GAME_FRAMERATE)
-            self.groups["score"].update_score(self.SCORE)
-
-            # Verifica os eventos emitidos durante o jogo
-            self.__handle_events()
-
-            self.screen.blit(self.__background, (0, 0))
+        profiler = self.profiler
 
-            # Verifica se o pipe saiu da tela pela esquerda
-            if is_horizontal_off_screen(self.groups["pipes"].sprites()[0]):
-                self.SCORE += 1
-                self.__replace_pipes()
+        # Os quadros também são desenhados no modo headless quando salvos
+        # em arquivos
+        drawing = self.__is_drawing()
 
-            # Atualiza todos os sprites do jogo
-            self.__update_sprites()
+        while True:
+            # No modo headless o jogo roda o mais rápido possível
+            if not self.headless:
+                clock.tick(self.GAME_FRAMERATE)
+
+            with profiler.phase("frame"):
+                if drawing:
+                    with profiler.phase("score"):
+                        self.groups["score"].update_score(self.SCORE)
+
+                # Verifica os eventos emitidos durante o jogo
+                with profiler.phase("events"):
+                    self.__handle_events()
+
+                # Avança a simulação, várias vezes por quadro desenhado
+                # quando há um salto de quadros
+                steps = 1 if self.headless else self.render_stride
+                stop = self.__advance(steps)
+
+                # Atualiza e desenha todos os sprites do jogo
+                if drawing:
+                    with profiler.phase("sprites"):
+                        rects = self.__update_sprites()
+
+                    with profiler.phase("display"):
+                        pygame.display.update(rects)
+
+                    if self.dump_dir is not None:
+                        with profiler.phase("dump"):
+                            self.__dump_frame()
+
+                    # Remove os sprites dos pássaros que colidiram ou sairam
+                    # da tela. A colisão é medida dentro da simulação
+                    with profiler.phase("cleanup"):
+                        self.__remove_when_collide()
+
+            # Finaliza o loop quando não restar nenhum pássaro ou quando a
+            # política de término permitir
+            if stop:
+                break
 
-            pygame.display.update()
+        self.__termination.finalize(self.simulation)
 
-            # Remove os pássaros que colidiram ou sairam da tela
-            self.__remove_when_collide()
+        if self.__recorder is not None:
+            self.episode = self.__recorder.episode(
+                [brain["genome"].key for brain in self.__brains]
+            )
 
-            # Finaliza o loop quando não restar nenhum pássaro
-            bird_group = self.groups["birds"]
+        # Copia o fitness acumulado na simulação para os genomas, combinando
+        # as faixas quando há mais de um percurso
+        genome_fitness = self.simulation.genome_fitness(self.__aggregation)
 
-            if len(bird_group.sprites()) == 0:
-                break
+        for brain, fitness in zip(self.__brains, genome_fitness.tolist()):
+            brain["genome"].fitness = fitness
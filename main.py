@@ -1,17 +1,111 @@
 import os
-from typing import List, Tuple, Text
+import random
+import argparse
+from functools import partial
+from itertools import count
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Text
 
 import neat
 
 from game import Game
-from config import MAX_GENERATIONS
+from simulation.cache import NetworkCache
+from simulation.checkpoint import StreamingCheckpointer
+from simulation.compiler import compile_genome, configure_genome
+from simulation.course import Course
+from simulation.curriculum import Curriculum
+from simulation.engine import AGGREGATIONS
+from simulation.islands import IslandModel
+from simulation.parallel import ParallelEvaluator
+from simulation.policy import Policy
+from simulation.recording import Episode
+from simulation.reporting import ProfilingReporter
+from simulation.sensors import SENSOR_SETS
+from simulation.termination import TerminationPolicy
+from sprites.utils import load_shapes
+from config import MAX_GENERATIONS, HEADLESS, EVAL_WORKERS, COURSE_SEED, PROFILE
+from config import MAX_FRAMES, MAX_PIPES, ELITE_STOP, STOP_AT_THRESHOLD, FIXED_COURSE
+from config import RENDER_MODE, RENDER_COUNT, RENDER_STRIDE, RECORD_DIR, CHECKPOINT_DIR
+from config import EXPORT_POLICY, PROFILE_OUTPUT
+from config import SENSORS, EVAL_COURSES, FITNESS_AGGREGATION
+from config import ISLANDS, MIGRATION_INTERVAL, MIGRANTS, CURRICULUM
+
+
+# Gerador das sementes dos percursos de cada geração
+course_seeds = random.Random(COURSE_SEED)
+
+
+def next_courses(count: int = EVAL_COURSES) -> List[Course]:
+    """
+    Função responsável por gerar os percursos da próxima geração. Com uma
+    semente definida, a sequência de percursos se repete entre execuções.
+
+    Parâmetros
+    ----------
+        count: int, optional
+            quantidade de percursos jogados por cada genoma
+
+    Retorno
+    -------
+        Lista com os percursos que serão jogados por toda a geração
+    """
+
+    return [Course(course_seeds.randrange(2 ** 32)) for _ in range(count)]
+
+
+def generation_plan(courses: Optional[List[Course]], count: int,
+                    termination: TerminationPolicy,
+                    curriculum: Optional[Curriculum] = None) -> Dict[Text, Any]:
+    """
+    Função responsável por definir os percursos e as regras de término da
+    próxima geração. Com um currículo, os percursos são recriados na
+    dificuldade do nível atual e a partida recebe o limite de quadros dele.
+
+    Parâmetros
+    ----------
+        courses: List[Course], optional
+            percursos fixos de todas as gerações. Quando omitidos, os
+            próximos percursos da sequência são utilizados
+        count: int
+            quantidade de percursos jogados por cada genoma
+        termination: TerminationPolicy
+            regras de término configuradas para o treinamento
+        curriculum: Curriculum, optional
+            currículo que ajusta a dificuldade a cada geração
+
+    Retorno
+    -------
+        Dicionário com os argumentos `courses` e `termination` da avaliação
+    """
+
+    courses = courses or next_courses(count)
+
+    if curriculum is not None:
+        courses = curriculum.courses(courses)
+        termination = curriculum.termination(termination)
+
+    return {"courses": courses, "termination": termination}
+
+
+# Redes compiladas e resultados reaproveitados entre as gerações
+network_cache = NetworkCache()
+
+# Numeração das partidas gravadas e localização da melhor delas
+episode_numbers = count()
+best_episode: Dict[Text, Any] = {}
 
 
 def eval_genomes(genomes: List[Tuple[int, neat.DefaultGenome]],
-                 config: neat.Config) -> None:
+                 config: neat.Config,
+                 termination: Optional[TerminationPolicy] = None,
+                 courses: Optional[List[Course]] = None,
+                 record_dir: Optional[Text] = None,
+                 course_count: int = EVAL_COURSES,
+                 aggregation: Text = FITNESS_AGGREGATION) -> None:
     """
     Função responsável por executar o jogo e calcular o fitness da
-    população.
+    população. Com vários percursos, cada genoma joga todos ao mesmo tempo,
+    em faixas da mesma partida, e o fitness final combina os percursos,
+    reduzindo a influência da sorte de um único sorteio de pipes.
 
     Parâmetros
     ----------
@@ -19,28 +113,113 @@ def eval_genomes(genomes: List[Tuple[int, neat.DefaultGenome]],
             genomas que serão testados na geração corrente
         config: neat.Config
             variável contendo a configuração do algoritimo
+        termination: TerminationPolicy, optional
+            regras para encerrar a partida antes do último pássaro morrer
+        courses: List[Course], optional
+            percursos da geração. Quando omitidos, os próximos percursos da
+            sequência são utilizados
+        record_dir: Text, optional
+            diretório onde as ações de cada partida são gravadas
+        course_count: int, optional
+            quantidade de percursos gerados quando `courses` é omitido
+        aggregation: Text, optional
+            forma de combinar o fitness dos percursos: a média ("mean") ou
+            o pior resultado ("min")
     """
 
+    courses = courses or next_courses(course_count)
+    termination = termination or TerminationPolicy()
+
+    # O fitness só pode ser reaproveitado quando não depende dos outros
+    # pássaros da partida
+    reuse = termination.independent()
     brains = []
 
     # itera sobre os genomas zerando o fitness e montando a estrutura
     # para o jogo
     for _, genome in genomes:
+        genome.fitness = network_cache.combined_fitness(
+            genome, courses, aggregation, termination,
+        ) if reuse else None
+
+        if genome.fitness is not None:
+            continue
+
         genome.fitness = 0
 
         brains.append({
             "genome": genome,
-            "net": neat.nn.FeedForwardNetwork.create(genome, config),
+            "net": network_cache.network(genome, config),
         })
 
+    if not brains:
+        return
+
     # Recupera a instância do jogo e executa com as redes neurais
     flappy_bird = Game()
 
-    flappy_bird.reset(brains)
+    flappy_bird.reset(brains, courses, termination, record=record_dir is not None,
+                      aggregation=aggregation)
     flappy_bird.loop()
 
+    if record_dir is not None:
+        save_episode(flappy_bird.episode, record_dir)
+
+    # Guarda o resultado de cada percurso separadamente
+    if reuse:
+        lanes = flappy_bird.simulation.lane_fitness().tolist()
+
+        for course, lane in zip(courses, lanes):
+            for brain, fitness in zip(brains, lane):
+                network_cache.store(brain["genome"], course, fitness, termination)
+
+
+def save_episode(episode: Episode, record_dir: Text) -> None:
+    """
+    Função responsável por salvar uma partida gravada e guardar a
+    localização do melhor pássaro já gravado, usada para reproduzir o
+    vencedor sem executar a rede neural.
+
+    Parâmetros
+    ----------
+        episode: Episode
+            partida gravada
+        record_dir: Text
+            diretório onde a partida será salva
+    """
+
+    os.makedirs(record_dir, exist_ok=True)
+    filename = os.path.join(record_dir, "episode-{0:05d}.npz".format(next(episode_numbers)))
+
+    episode.save(filename)
+
+    bird = int(episode.fitness.argmax())
+
+    if episode.fitness[bird] > best_episode.get("fitness", float("-inf")):
+        best_episode.update({
+            "fitness": float(episode.fitness[bird]),
+            "key": int(episode.genome_keys[bird]),
+            "filename": filename,
+            "bird": bird,
+        })
+
 
-def run(config_file: Text) -> None:
+def run(config_file: Text, headless: bool = HEADLESS,
+        workers: int = EVAL_WORKERS, seed: Optional[int] = COURSE_SEED,
+        profile: bool = PROFILE, profile_output: Optional[Text] = PROFILE_OUTPUT,
+        max_frames: Optional[int] = MAX_FRAMES,
+        max_pipes: Optional[int] = MAX_PIPES, elite_stop: int = ELITE_STOP,
+        stop_at_threshold: bool = STOP_AT_THRESHOLD,
+        fixed_course: bool = FIXED_COURSE, render_mode: Text = RENDER_MODE,
+        render_count: int = RENDER_COUNT, render_stride: int = RENDER_STRIDE,
+        record_dir: Optional[Text] = RECORD_DIR,
+        checkpoint_dir: Text = CHECKPOINT_DIR, resume: bool = False,
+        sensors: Text = SENSORS, eval_courses: int = EVAL_COURSES,
+        aggregation: Text = FITNESS_AGGREGATION, islands: int = ISLANDS,
+        migration_interval: int = MIGRATION_INTERVAL,
+        migrants: int = MIGRANTS, config_files: Sequence[Text] = (),
+        curriculum: bool = CURRICULUM,
+        export: Optional[Text] = EXPORT_POLICY) -> None:
     """
     Função responsável por configurar a execução do NEAT.
 
@@ -48,33 +227,273 @@ def run(config_file: Text) -> None:
     ----------
         config_file: Text
             caminho do arquivo de configuração do NEAT
+        headless: bool
+            treina as gerações sem janela e sem limite de quadros por
+            segundo. O vencedor continua sendo exibido ao final.
+        workers: int
+            quantidade de processos usados para avaliar cada geração. Com
+            mais de um processo a avaliação é sempre feita sem interface
+        seed: int, optional
+            semente da sequência de percursos das gerações
+        profile: bool
+            mede o tempo de cada fase do loop e mostra o resultado ao fim
+            de cada geração. Disponível apenas na avaliação com um único
+            processo
+        profile_output: Text, optional
+            arquivo JSON onde o histórico das fases é salvo ao fim do
+            treinamento, quando `profile` está ativo
+        max_frames: int, optional
+            quantidade máxima de quadros de cada avaliação
+        max_pipes: int, optional
+            quantidade máxima de pipes ultrapassados em cada avaliação
+        elite_stop: int
+            encerra a avaliação quando restarem essa quantidade de pássaros
+            ou menos, extrapolando o fitness dos sobreviventes até
+            `max_frames`, que se torna obrigatório
+        stop_at_threshold: bool
+            encerra a avaliação assim que algum genoma alcança o
+            fitness_threshold. O fitness deixa de ser reaproveitado entre as
+            gerações
+        fixed_course: bool
+            todas as gerações jogam os mesmos percursos, e os genomas que
+            não mudaram reaproveitam o fitness da geração anterior
+        render_mode: Text
+            pássaros desenhados durante o treinamento com a janela aberta
+        render_count: int
+            quantidade de pássaros desenhados nos modos "top" e "sample"
+        render_stride: int
+            quantidade de quadros simulados a cada quadro desenhado durante
+            o treinamento. Pode ser alterada pelas setas do teclado
+        record_dir: Text, optional
+            diretório onde as ações de cada geração são gravadas. O vencedor
+            é reproduzido a partir da gravação, sem executar a rede neural.
+            Disponível apenas na avaliação com um único processo e um único
+            percurso
+        checkpoint_dir: Text
+            diretório onde as checkpoints de cada execução são salvas
+        resume: bool
+            continua o treinamento da última checkpoint da execução mais
+            recente
+        sensors: Text
+            conjunto de sensores que forma as entradas das redes neurais. A
+            quantidade de entradas do arquivo de configuração é ajustada a ele
+        eval_courses: int
+            quantidade de percursos jogados ao mesmo tempo por cada genoma
+        aggregation: Text
+            forma de combinar o fitness dos percursos, "mean" ou "min"
+        islands: int
+            quantidade de populações evoluídas em processos separados. Com
+            mais de uma ilha, cada uma avalia os seus genomas sem interface,
+            sem checkpoints e sem gravação
+        migration_interval: int
+            quantidade de gerações entre as migrações das ilhas
+        migrants: int
+            quantidade de genomas enviados por cada ilha em cada migração
+        config_files: Sequence[Text]
+            arquivos de configuração do NEAT das ilhas, repetidos em ordem
+            quando há mais ilhas do que arquivos. Quando vazio, todas as
+            ilhas usam o `config_file`
+        curriculum: bool
+            começa com percursos fáceis e uma população menor, aumentando a
+            dificuldade, o limite de quadros e a população conforme o melhor
+            fitness evolui. Não disponível com ilhas
+        export: Text, optional
+            arquivo `.npz` onde a rede do vencedor é exportada, para jogar
+            depois com o `play.py` sem a biblioteca NEAT
     """
 
+    if record_dir is not None and eval_courses > 1:
+        raise ValueError("A gravação só é possível com um único percurso por geração")
+
+    if workers > 1 and (record_dir is not None or profile):
+        raise ValueError("A avaliação em vários processos não permite gravação nem profiling")
+
+    if islands > 1 and (resume or record_dir is not None):
+        raise ValueError("A evolução em ilhas não permite gravação nem checkpoints")
+
+    if islands <= 1 and config_files:
+        raise ValueError("Os arquivos de configuração das ilhas exigem mais de uma ilha")
+
+    if islands > 1 and curriculum:
+        raise ValueError("A evolução em ilhas não permite o currículo")
+
+    course_seeds.seed(seed)
+    network_cache.clear()
+    best_episode.clear()
+
     # Cria as configurações do NEAT
     config = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
                          neat.DefaultSpeciesSet, neat.DefaultStagnation,
                          config_file)
 
-    # Gera o relatório do terminal e a população inicial
+    # As entradas dos genomas seguem o conjunto de sensores escolhido
+    configure_genome(config, sensors)
+
+    # Regras para encerrar cada avaliação antes do último pássaro morrer
+    termination = TerminationPolicy(
+        max_frames, max_pipes,
+        config.fitness_threshold if stop_at_threshold else None,
+        elite_stop,
+    )
+
+    # Evolui várias populações em paralelo, uma por processo
+    if islands > 1:
+        model = IslandModel(
+            list(config_files) or [config_file], load_shapes(), islands, seed,
+            migration_interval, migrants, sensors, termination, eval_courses,
+            aggregation, fixed_course,
+        )
+
+        winner = model.run(MAX_GENERATIONS)
+
+        if export is not None:
+            export_winner(winner, config, export, sensors)
+
+        show_winner(winner, config, sensors)
+        return
+
+    # Percursos fixos de todas as gerações, quando solicitado
+    courses = next_courses(eval_courses) if fixed_course else None
+
+    # Gera o relatório do terminal
     stats = neat.StatisticsReporter()
-    population = neat.Population(config)
+
+    # Ajusta a dificuldade, o limite de quadros e a população a cada
+    # geração. Criado antes da população inicial, que já começa reduzida.
+    # Ao continuar uma execução, o currículo recomeça do primeiro nível
+    schedule = Curriculum(config, stats) if curriculum else None
+
+    # Gera a população inicial ou continua a última execução salva
+    checkpointer = StreamingCheckpointer(
+        checkpoint_dir, generators=(course_seeds,), resume=resume,
+    )
+    population = checkpointer.restore(config) if resume else neat.Population(config)
 
     population.add_reporter(stats)
-    population.add_reporter(neat.Checkpointer(5))
+
+    if schedule is not None:
+        population.add_reporter(schedule)
+
+    population.add_reporter(checkpointer)
     population.add_reporter(neat.StdOutReporter(True))
 
+    # Percursos e regras de término de cada geração
+    plan = partial(generation_plan, courses, eval_courses, termination, schedule)
+
+    # Divide a avaliação entre os processos quando solicitado
+    evaluator = None
+    fitness_function = lambda genomes, config: eval_genomes(
+        genomes, config, record_dir=record_dir, aggregation=aggregation, **plan(),
+    )
+
+    if workers > 1:
+        evaluator = ParallelEvaluator(workers, config, load_shapes(), sensors)
+        fitness_function = lambda genomes, config: evaluator.evaluate(
+            genomes, config, aggregation=aggregation, **plan(),
+        )
+
+    # Cria a instância única do jogo no modo de execução escolhido
+    flappy_bird = Game(headless=headless)
+    flappy_bird.simulation.set_sensors(sensors)
+    flappy_bird.render_mode = render_mode
+    flappy_bird.render_count = render_count
+    flappy_bird.render_stride = render_stride
+
+    # Mostra o tempo de cada fase do loop junto com as estatísticas
+    profiling = None
+
+    if profile:
+        flappy_bird.profiler.enabled = True
+        profiling = ProfilingReporter(flappy_bird.profiler)
+        population.add_reporter(profiling)
+
     # Executa uma quantidade definida de gerações e recupera o vencedor
-    winner = population.run(eval_genomes, MAX_GENERATIONS)
-    winner_net = neat.nn.FeedForwardNetwork.create(winner, config)
+    try:
+        winner = population.run(
+            fitness_function, max(MAX_GENERATIONS - population.generation, 1),
+        )
+    finally:
+        checkpointer.close()
+
+        if evaluator is not None:
+            evaluator.close()
+
+        # Salva as gerações medidas, mesmo quando o treinamento é
+        # interrompido
+        if profiling is not None and profile_output is not None:
+            profiling.save(profile_output)
+
+    if export is not None:
+        export_winner(winner, config, export, sensors)
+
+    show_winner(winner, config, sensors)
+
+
+def export_winner(winner: neat.DefaultGenome, config: neat.Config,
+                  filename: Text, sensors: Text = SENSORS) -> None:
+    """
+    Função responsável por exportar a rede do vencedor em um arquivo
+    `.npz`, que pode ser carregado sem a biblioteca NEAT.
+
+    Parâmetros
+    ----------
+        winner: neat.DefaultGenome
+            melhor genoma do treinamento
+        config: neat.Config
+            variável contendo a configuração do algoritimo
+        filename: Text
+            caminho do arquivo
+        sensors: Text
+            conjunto de sensores que forma as entradas da rede neural
+    """
+
+    directory = os.path.dirname(filename)
+
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    Policy(compile_genome(winner, config), sensors, winner.key, winner.fitness).save(filename)
+
+    print("Policy exported to {0}".format(filename))
+
+
+def show_winner(winner: neat.DefaultGenome, config: neat.Config,
+                sensors: Text = SENSORS) -> None:
+    """
+    Função responsável por mostrar o vencedor do treinamento jogando com a
+    janela aberta. Quando a partida do vencedor foi gravada, ela é
+    reproduzida sem executar a rede neural.
+
+    Parâmetros
+    ----------
+        winner: neat.DefaultGenome
+            melhor genoma do treinamento
+        config: neat.Config
+            variável contendo a configuração do algoritimo
+        sensors: Text
+            conjunto de sensores que forma as entradas da rede neural
+    """
+
+    winner_net = compile_genome(winner, config)
 
     print('\nBest genome:\n{!s}'.format(winner))
 
-    # Executa o jogo apenas com o vencedor
+    # Executa o jogo apenas com o vencedor, sempre com a janela aberta e
+    # na velocidade normal
     flappy_bird = Game()
-    flappy_bird.reset([{
-        "genome": winner,
-        "net": winner_net,
-    }])
+    flappy_bird.simulation.set_sensors(sensors)
+    flappy_bird.set_headless(False)
+    flappy_bird.render_stride = 1
+
+    if best_episode.get("key") == winner.key:
+        flappy_bird.load_episode(
+            Episode.load(best_episode["filename"]), [best_episode["bird"]],
+        )
+    else:
+        flappy_bird.reset([{
+            "genome": winner,
+            "net": winner_net,
+        }])
 
     flappy_bird.loop()
 
@@ -82,7 +501,121 @@ def run(config_file: Text) -> None:
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="NEAT Flappy Bird")
+    parser.add_argument(
+        "--headless", action="store_true", default=HEADLESS,
+        help="treina sem janela e sem limite de FPS",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=EVAL_WORKERS,
+        help="quantidade de processos usados na avaliação dos genomas",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=COURSE_SEED,
+        help="semente da sequência de percursos, para execuções reproduzíveis",
+    )
+    parser.add_argument(
+        "--profile", action="store_true", default=PROFILE,
+        help="mostra o tempo de cada fase do loop a cada geração",
+    )
+    parser.add_argument(
+        "--profile-out", default=PROFILE_OUTPUT,
+        help="arquivo JSON onde o tempo das fases de todas as gerações é salvo",
+    )
+    parser.add_argument(
+        "--max-frames", type=int, default=MAX_FRAMES,
+        help="quantidade máxima de quadros de cada avaliação",
+    )
+    parser.add_argument(
+        "--max-pipes", type=int, default=MAX_PIPES,
+        help="quantidade máxima de pipes ultrapassados em cada avaliação",
+    )
+    parser.add_argument(
+        "--elite-stop", type=int, default=ELITE_STOP,
+        help="encerra a avaliação quando restarem essa quantidade de pássaros "
+             "(exige --max-frames)",
+    )
+    parser.add_argument(
+        "--stop-at-threshold", action="store_true", default=STOP_AT_THRESHOLD,
+        help="encerra a avaliação assim que algum genoma alcança o fitness_threshold",
+    )
+    parser.add_argument(
+        "--fixed-course", action="store_true", default=FIXED_COURSE,
+        help="todas as gerações jogam o mesmo percurso",
+    )
+    parser.add_argument(
+        "--render", choices=Game.RENDER_MODES, default=RENDER_MODE,
+        help="pássaros desenhados durante o treinamento",
+    )
+    parser.add_argument(
+        "--render-count", type=int, default=RENDER_COUNT,
+        help="quantidade de pássaros desenhados nos modos top e sample",
+    )
+    parser.add_argument(
+        "--render-stride", type=int, default=RENDER_STRIDE,
+        help="quadros simulados a cada quadro desenhado",
+    )
+    parser.add_argument(
+        "--record", default=RECORD_DIR,
+        help="diretório onde as ações de cada geração são gravadas",
+    )
+    parser.add_argument(
+        "--checkpoint-dir", default=CHECKPOINT_DIR,
+        help="diretório onde as checkpoints são salvas",
+    )
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="continua o treinamento da última checkpoint salva",
+    )
+    parser.add_argument(
+        "--sensors", choices=SENSOR_SETS, default=SENSORS,
+        help="conjunto de sensores usado como entrada das redes neurais",
+    )
+    parser.add_argument(
+        "--courses", type=int, default=EVAL_COURSES,
+        help="quantidade de percursos jogados por cada genoma em uma geração",
+    )
+    parser.add_argument(
+        "--aggregation", choices=AGGREGATIONS, default=FITNESS_AGGREGATION,
+        help="forma de combinar o fitness dos percursos",
+    )
+    parser.add_argument(
+        "--islands", type=int, default=ISLANDS,
+        help="quantidade de populações evoluídas em processos separados",
+    )
+    parser.add_argument(
+        "--migration-interval", type=int, default=MIGRATION_INTERVAL,
+        help="gerações entre as migrações de genomas entre as ilhas",
+    )
+    parser.add_argument(
+        "--migrants", type=int, default=MIGRANTS,
+        help="genomas enviados por cada ilha em cada migração",
+    )
+    parser.add_argument(
+        "--island-config", action="append", default=[],
+        help="arquivo de configuração do NEAT de uma ilha, pode ser repetido",
+    )
+    parser.add_argument(
+        "--curriculum", action="store_true", default=CURRICULUM,
+        help="aumenta a dificuldade dos percursos e a população ao longo do treinamento",
+    )
+    parser.add_argument(
+        "--export", default=EXPORT_POLICY,
+        help="arquivo .npz onde a rede do vencedor é exportada",
+    )
+    args = parser.parse_args()
+
     local_dir = os.path.dirname(__file__)
     config_path = os.path.join(local_dir, 'config-feedforward')
 
-    run(config_path)
+    run(config_path, headless=args.headless, workers=args.workers, seed=args.seed,
+        profile=args.profile, profile_output=args.profile_out,
+        max_frames=args.max_frames, max_pipes=args.max_pipes,
+        elite_stop=args.elite_stop, stop_at_threshold=args.stop_at_threshold,
+        fixed_course=args.fixed_course, render_mode=args.render,
+        render_count=args.render_count, render_stride=args.render_stride,
+        record_dir=args.record,
+        checkpoint_dir=args.checkpoint_dir, resume=args.resume, sensors=args.sensors,
+        eval_courses=args.courses, aggregation=args.aggregation, islands=args.islands,
+        migration_interval=args.migration_interval, migrants=args.migrants,
+        config_files=args.island_config, curriculum=args.curriculum, export=args.export)
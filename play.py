@@ -0,0 +1,108 @@
+import argparse
+from typing import Optional, Text
+
+from game import Game
+from simulation.course import Course
+from simulation.policy import Policy
+from simulation.termination import TerminationPolicy
+from config import PLAY_HEADLESS_MAX_FRAMES, RENDER_STRIDE
+
+
+def play(filename: Text, seed: Optional[int] = None, courses: int = 1,
+         max_frames: Optional[int] = None, max_pipes: Optional[int] = None,
+         dump_dir: Optional[Text] = None, headless: bool = False,
+         render_stride: int = RENDER_STRIDE) -> None:
+    """
+    Função responsável por jogar com uma política exportada pelo
+    treinamento, sem a biblioteca NEAT e sem checkpoints.
+
+    Parâmetros
+    ----------
+        filename: Text
+            arquivo `.npz` da política
+        seed: int, optional
+            semente do primeiro percurso. Quando omitida, os percursos são
+            sorteados
+        courses: int
+            quantidade de percursos jogados ao mesmo tempo. Com a janela
+            aberta, apenas o primeiro é desenhado
+        max_frames: int, optional
+            quantidade máxima de quadros da partida. Sem janela e sem limite
+            de pipes, o padrão é `PLAY_HEADLESS_MAX_FRAMES`
+        max_pipes: int, optional
+            quantidade máxima de pipes ultrapassados na partida
+        dump_dir: Text, optional
+            diretório onde cada quadro é salvo como imagem
+        headless: bool
+            joga sem janela e sem limite de quadros por segundo
+        render_stride: int
+            quantidade de quadros simulados a cada quadro desenhado
+    """
+
+    policy = Policy.load(filename)
+
+    # Sem janela não há como encerrar a partida, que precisa de um limite
+    if headless and max_frames is None and max_pipes is None:
+        max_frames = PLAY_HEADLESS_MAX_FRAMES
+
+    # Percursos consecutivos a partir da semente, para partidas reproduzíveis
+    seeds = [None] * courses if seed is None else range(seed, seed + courses)
+
+    flappy_bird = Game(headless=headless)
+    flappy_bird.render_stride = render_stride
+    flappy_bird.dump_dir = dump_dir
+
+    flappy_bird.load_policy(
+        policy, [Course(course_seed) for course_seed in seeds],
+        TerminationPolicy(max_frames, max_pipes),
+    )
+    flappy_bird.loop()
+
+    simulation = flappy_bird.simulation
+
+    print("Genome: {0}, sensors: {1}, training fitness: {2:.1f}".format(
+        policy.genome_key, policy.sensors, policy.fitness,
+    ))
+
+    for course, fitness in zip(simulation.courses, simulation.lane_fitness()[:, 0].tolist()):
+        print("Course {0}: fitness {1:.1f}".format(course.seed, fitness))
+
+    print("Frames: {0}, score: {1}".format(simulation.frame, simulation.score))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Partida com uma política exportada")
+    parser.add_argument("policy", help="arquivo .npz exportado com --export")
+    parser.add_argument(
+        "--seed", type=int, default=None,
+        help="semente do primeiro percurso, para partidas reproduzíveis",
+    )
+    parser.add_argument(
+        "--courses", type=int, default=1,
+        help="quantidade de percursos jogados ao mesmo tempo",
+    )
+    parser.add_argument(
+        "--max-frames", type=int, default=None,
+        help="quantidade máxima de quadros da partida "
+             f"(padrão sem janela: {PLAY_HEADLESS_MAX_FRAMES})",
+    )
+    parser.add_argument(
+        "--max-pipes", type=int, default=None,
+        help="quantidade máxima de pipes ultrapassados na partida",
+    )
+    parser.add_argument(
+        "--dump", default=None,
+        help="diretório onde cada quadro é salvo como imagem",
+    )
+    parser.add_argument(
+        "--headless", action="store_true",
+        help="joga sem janela e sem limite de FPS",
+    )
+    parser.add_argument(
+        "--render-stride", type=int, default=RENDER_STRIDE,
+        help="quadros simulados a cada quadro desenhado",
+    )
+    args = parser.parse_args()
+
+    play(args.policy, args.seed, args.courses, args.max_frames, args.max_pipes,
+         args.dump, args.headless, args.render_stride)
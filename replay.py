@@ -0,0 +1,91 @@
+import argparse
+from typing import List, Optional, Text
+
+from game import Game
+from simulation.recording import Episode
+from config import RENDER_MODE, RENDER_COUNT, RENDER_STRIDE
+
+
+def replay(filename: Text, birds: Optional[List[int]] = None, best: int = 0,
+           dump_dir: Optional[Text] = None, headless: bool = False,
+           render_mode: Text = RENDER_MODE, render_count: int = RENDER_COUNT,
+           render_stride: int = RENDER_STRIDE) -> None:
+    """
+    Função responsável por reproduzir uma partida gravada durante o
+    treinamento, sem executar as redes neurais.
+
+    Parâmetros
+    ----------
+        filename: Text
+            arquivo `.npz` da partida
+        birds: List[int], optional
+            pássaros reproduzidos. Quando omitido, todos são reproduzidos
+        best: int
+            reproduz apenas os pássaros com os maiores fitness, quando maior
+            que zero
+        dump_dir: Text, optional
+            diretório onde cada quadro é salvo como imagem
+        headless: bool
+            reproduz sem janela, útil para apenas salvar os quadros
+        render_mode: Text
+            pássaros desenhados durante a reprodução
+        render_count: int
+            quantidade de pássaros desenhados nos modos "top" e "sample"
+        render_stride: int
+            quantidade de quadros simulados a cada quadro desenhado
+    """
+
+    episode = Episode.load(filename)
+
+    if best > 0:
+        birds = episode.fitness.argsort(kind="stable")[::-1][:best].tolist()
+
+    flappy_bird = Game(headless=headless)
+    flappy_bird.render_mode = render_mode
+    flappy_bird.render_count = render_count
+    flappy_bird.render_stride = render_stride
+    flappy_bird.dump_dir = dump_dir
+
+    flappy_bird.load_episode(episode, birds)
+    flappy_bird.loop()
+
+    print("Frames: {0}, score: {1}".format(
+        flappy_bird.simulation.frame, flappy_bird.simulation.score,
+    ))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Reprodução de partidas gravadas")
+    parser.add_argument("episode", help="arquivo .npz gravado com --record")
+    parser.add_argument(
+        "--birds", type=int, nargs="+", default=None,
+        help="índices dos pássaros reproduzidos",
+    )
+    parser.add_argument(
+        "--best", type=int, default=0,
+        help="reproduz apenas os N pássaros com maior fitness",
+    )
+    parser.add_argument(
+        "--dump", default=None,
+        help="diretório onde cada quadro é salvo como imagem",
+    )
+    parser.add_argument(
+        "--headless", action="store_true",
+        help="reproduz sem janela, apenas salvando os quadros",
+    )
+    parser.add_argument(
+        "--render", choices=Game.RENDER_MODES, default=RENDER_MODE,
+        help="pássaros desenhados durante a reprodução",
+    )
+    parser.add_argument(
+        "--render-count", type=int, default=RENDER_COUNT,
+        help="quantidade de pássaros desenhados nos modos top e sample",
+    )
+    parser.add_argument(
+        "--render-stride", type=int, default=RENDER_STRIDE,
+        help="quadros simulados a cada quadro desenhado",
+    )
+    args = parser.parse_args()
+
+    replay(args.episode, args.birds, args.best, args.dump, args.headless,
+           args.render, args.render_count, args.render_stride)
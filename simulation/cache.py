@@ -0,0 +1,260 @@
+from collections import OrderedDict
+from typing import Hashable, Optional, Sequence, Text
+
+import neat
+import numpy as np
+
+from simulation.compiler import compile_genome
+from simulation.course import Course
+from simulation.engine import aggregate_fitness
+from simulation.termination import TerminationPolicy
+from simulation.network import CompiledNetwork
+from config import NETWORK_CACHE_SIZE
+
+
+class NetworkCache:
+    """
+    Classe responsável por guardar as redes compiladas e os resultados das
+    avaliações entre as gerações. Os genomas são identificados pelos seus
+    genes, então os elites copiados sem alteração, e os filhos idênticos a
+    algum genoma já visto, não são compilados novamente. Os itens menos
+    utilizados são descartados quando a capacidade é atingida.
+
+    Atributos
+    ---------
+        capacity: int
+            quantidade máxima de genomas guardados
+        hits: int
+            quantidade de redes reaproveitadas
+        misses: int
+            quantidade de redes compiladas
+
+    Métodos
+    -------
+        key(genome: neat.DefaultGenome) -> Hashable:
+            gera a chave do genoma a partir dos seus genes
+        network(genome: neat.DefaultGenome, config: neat.Config) -> CompiledNetwork:
+            recupera ou compila a rede do genoma
+        fitness(genome: neat.DefaultGenome, course: Course,
+                termination: Optional[TerminationPolicy] = None) -> Optional[float]:
+            recupera o fitness de uma avaliação anterior no mesmo percurso
+        combined_fitness(genome: neat.DefaultGenome, courses: Sequence[Course],
+                         aggregation: Text,
+                         termination: Optional[TerminationPolicy] = None) -> Optional[float]:
+            combina o fitness das avaliações anteriores em vários percursos
+        store(genome: neat.DefaultGenome, course: Course, fitness: float,
+              termination: Optional[TerminationPolicy] = None) -> None:
+            guarda o fitness de uma avaliação
+        clear() -> None:
+            descarta todos os itens guardados
+    """
+
+    def __init__(self, capacity: int = NETWORK_CACHE_SIZE) -> None:
+        """
+        Método de inicialização da classe NetworkCache.
+
+        Parâmetros
+        ----------
+            capacity: int, optional
+                quantidade máxima de genomas guardados
+        """
+
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+
+        self.__networks = OrderedDict()
+        self.__results = OrderedDict()
+
+    @staticmethod
+    def key(genome: neat.DefaultGenome) -> Hashable:
+        """
+        Método responsável por gerar a chave do genoma. As conexões mantêm
+        a ordem do genoma, pois ela define a ordem das somas da rede.
+
+        Parâmetros
+        ----------
+            genome: neat.DefaultGenome
+                genoma avaliado
+
+        Retorno
+        -------
+            Tupla com os genes que definem a rede
+        """
+
+        nodes = tuple(
+            (key, ng.bias, ng.response, ng.activation, ng.aggregation)
+            for key, ng in sorted(genome.nodes.items())
+        )
+        connections = tuple(
+            (cg.key, cg.weight) for cg in genome.connections.values() if cg.enabled
+        )
+
+        return nodes, connections
+
+    def __remember(self, items: OrderedDict, key: Hashable, value: object) -> None:
+        """
+        Método responsável por guardar um item e descartar o menos utilizado
+        quando a capacidade é ultrapassada.
+
+        Parâmetros
+        ----------
+            items: OrderedDict
+                itens guardados, do menos para o mais utilizado
+            key: Hashable
+                chave do item
+            value: object
+                valor guardado
+        """
+
+        items[key] = value
+        items.move_to_end(key)
+
+        if len(items) > self.capacity:
+            items.popitem(last=False)
+
+    def network(self, genome: neat.DefaultGenome, config: neat.Config) -> CompiledNetwork:
+        """
+        Método responsável por recuperar a rede compilada do genoma,
+        compilando-a apenas quando ela ainda não foi vista.
+
+        Parâmetros
+        ----------
+            genome: neat.DefaultGenome
+                genoma avaliado
+            config: neat.Config
+                variável contendo a configuração do algoritimo
+
+        Retorno
+        -------
+            Rede compilada do genoma
+        """
+
+        key = self.key(genome)
+        network = self.__networks.get(key)
+
+        if network is None:
+            self.misses += 1
+            network = compile_genome(genome, config)
+        else:
+            self.hits += 1
+
+        self.__remember(self.__networks, key, network)
+
+        return network
+
+    def __result_key(self, genome: neat.DefaultGenome, course: Course,
+                     termination: Optional[TerminationPolicy]) -> Hashable:
+        """
+        Método responsável por gerar a chave de um resultado: o genoma, o
+        percurso com a sua dificuldade e os limites da avaliação.
+
+        Parâmetros
+        ----------
+            genome: neat.DefaultGenome
+                genoma avaliado
+            course: Course
+                percurso da avaliação
+            termination: TerminationPolicy, optional
+                regras de término da avaliação
+
+        Retorno
+        -------
+            Chave do resultado
+        """
+
+        limits = termination.key() if termination is not None else None
+
+        return self.key(genome), course.key(), limits
+
+    def fitness(self, genome: neat.DefaultGenome, course: Course,
+                termination: Optional[TerminationPolicy] = None) -> Optional[float]:
+        """
+        Método responsável por recuperar o fitness de uma avaliação anterior
+        do mesmo genoma no mesmo percurso, com os mesmos limites.
+
+        Parâmetros
+        ----------
+            genome: neat.DefaultGenome
+                genoma avaliado
+            course: Course
+                percurso da avaliação
+            termination: TerminationPolicy, optional
+                regras de término da avaliação
+
+        Retorno
+        -------
+            Fitness guardado ou None quando o genoma ainda não jogou o percurso
+        """
+
+        key = self.__result_key(genome, course, termination)
+        fitness = self.__results.get(key)
+
+        if fitness is not None:
+            self.__results.move_to_end(key)
+
+        return fitness
+
+    def combined_fitness(self, genome: neat.DefaultGenome, courses: Sequence[Course],
+                         aggregation: Text,
+                         termination: Optional[TerminationPolicy] = None) -> Optional[float]:
+        """
+        Método responsável por combinar o fitness das avaliações anteriores
+        do mesmo genoma em vários percursos, guardados separadamente pelo
+        `store`, da mesma forma que a simulação combina as faixas.
+
+        Parâmetros
+        ----------
+            genome: neat.DefaultGenome
+                genoma avaliado
+            courses: Sequence[Course]
+                percursos da avaliação
+            aggregation: Text
+                forma de combinar o fitness dos percursos, "mean" ou "min"
+            termination: TerminationPolicy, optional
+                regras de término da avaliação
+
+        Retorno
+        -------
+            Fitness combinado ou None quando falta algum percurso
+        """
+
+        lanes = []
+
+        for course in courses:
+            fitness = self.fitness(genome, course, termination)
+
+            if fitness is None:
+                return None
+
+            lanes.append([fitness])
+
+        return float(aggregate_fitness(np.array(lanes), aggregation)[0])
+
+    def store(self, genome: neat.DefaultGenome, course: Course, fitness: float,
+              termination: Optional[TerminationPolicy] = None) -> None:
+        """
+        Método responsável por guardar o fitness de uma avaliação.
+
+        Parâmetros
+        ----------
+            genome: neat.DefaultGenome
+                genoma avaliado
+            course: Course
+                percurso da avaliação
+            fitness: float
+                fitness alcançado
+            termination: TerminationPolicy, optional
+                regras de término da avaliação
+        """
+
+        self.__remember(self.__results, self.__result_key(genome, course, termination),
+                        fitness)
+
+    def clear(self) -> None:
+        """
+        Método responsável por descartar todos os itens guardados.
+        """
+
+        self.__networks.clear()
+        self.__results.clear()
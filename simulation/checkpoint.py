@@ -0,0 +1,452 @@
+import io
+import os
+import glob
+import gzip
+import time
+import pickle
+import random
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import count
+from typing import Any, Container, Dict, List, Optional, Sequence, Set, Text, Tuple
+
+import neat
+
+from config import CHECKPOINT_DIR, CHECKPOINT_INTERVAL, CHECKPOINT_KEEP
+
+
+class _StatePickler(pickle.Pickler):
+    """
+    Pickler que troca os genomas por referências, para que cada genoma seja
+    gravado uma única vez, e descarta os reporters, que são recriados com a
+    população.
+
+    Atributos
+    ---------
+        genome_type: type
+            classe dos genomas
+        written: Container[int]
+            chaves dos genomas que já estão em algum arquivo de genomas
+        genomes: Dict[int, Any]
+            genomas que ainda não foram gravados, por chave
+        referenced: Set[int]
+            chaves de todos os genomas referenciados pelo estado
+    """
+
+    def __init__(self, file: io.BytesIO, genome_type: type,
+                 written: Container[int]) -> None:
+        """
+        Método de inicialização da classe _StatePickler.
+
+        Parâmetros
+        ----------
+            file: io.BytesIO
+                arquivo onde o estado é serializado
+            genome_type: type
+                classe dos genomas
+            written: Container[int]
+                chaves dos genomas que já estão em algum arquivo de genomas
+        """
+
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.genome_type = genome_type
+        self.written = written
+        self.genomes: Dict[int, Any] = {}
+        self.referenced: Set[int] = set()
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple[Any, ...]]:
+        """
+        Método chamado pelo `pickle` para cada objeto serializado, trocando
+        os genomas e os reporters por referências.
+
+        Parâmetros
+        ----------
+            obj: Any
+                objeto que será serializado
+
+        Retorno
+        -------
+            Referência do objeto, ou None para serializá-lo normalmente
+        """
+
+        if isinstance(obj, self.genome_type):
+            if obj.key not in self.written:
+                self.genomes[obj.key] = obj
+
+            self.referenced.add(obj.key)
+
+            return ("genome", obj.key, obj.fitness)
+
+        if isinstance(obj, neat.reporting.ReporterSet):
+            return ("reporters",)
+
+        return None
+
+
+class _StateUnpickler(pickle.Unpickler):
+    """
+    Unpickler que resolve as referências gravadas pelo `_StatePickler`.
+
+    Atributos
+    ---------
+        genomes: Dict[int, Any]
+            genomas carregados dos arquivos de genomas, por chave
+    """
+
+    def __init__(self, file: io.BytesIO, genomes: Dict[int, Any]) -> None:
+        """
+        Método de inicialização da classe _StateUnpickler.
+
+        Parâmetros
+        ----------
+            file: io.BytesIO
+                arquivo com o estado serializado
+            genomes: Dict[int, Any]
+                genomas carregados dos arquivos de genomas, por chave
+        """
+
+        super().__init__(file)
+
+        self.genomes = genomes
+
+    def persistent_load(self, pid: Tuple[Any, ...]) -> Any:
+        """
+        Método chamado pelo `pickle` para cada referência gravada pelo
+        `_StatePickler`, devolvendo o genoma com o fitness da checkpoint.
+
+        Parâmetros
+        ----------
+            pid: Tuple[Any, ...]
+                referência gravada
+
+        Retorno
+        -------
+            Genoma referenciado, ou None no lugar dos reporters
+        """
+
+        if pid[0] == "reporters":
+            return None
+
+        genome = self.genomes[pid[1]]
+        genome.fitness = pid[2]
+
+        return genome
+
+
+class StreamingCheckpointer(neat.reporting.BaseReporter):
+    """
+    Reporter do NEAT que salva o estado do treinamento de forma incremental.
+    Cada genoma é gravado uma única vez, no arquivo da primeira checkpoint
+    em que aparece, e cada checkpoint guarda apenas as referências da
+    população e das espécies. A compressão e a escrita acontecem em uma
+    thread separada, então a próxima geração começa imediatamente.
+
+    Cada execução grava em um subdiretório próprio, `run-<data>`, com os
+    arquivos `genomes-<geração>.pkl.gz` e `checkpoint-<geração>.pkl.gz`.
+    Cada checkpoint começa com a lista dos arquivos de genomas que ela
+    referencia. Apenas as últimas checkpoints são mantidas, junto com os
+    arquivos de genomas referenciados por elas. Um genoma cujo arquivo foi
+    removido volta a ser gravado caso apareça novamente.
+
+    Atributos
+    ---------
+        directory: Text
+            diretório da execução
+        interval: int
+            quantidade de gerações entre as checkpoints
+        keep: int
+            quantidade de checkpoints mantidas
+        generators: Sequence[random.Random]
+            geradores aleatórios salvos junto com o módulo `random`
+
+    Métodos
+    -------
+        restore(config: neat.Config) -> neat.Population:
+            recria a população da última checkpoint
+        close() -> None:
+            espera as gravações pendentes
+        latest_run(directory: Text) -> Text:
+            encontra o diretório da execução mais recente
+    """
+
+    def __init__(self, directory: Text = CHECKPOINT_DIR,
+                 interval: int = CHECKPOINT_INTERVAL, keep: int = CHECKPOINT_KEEP,
+                 generators: Sequence[random.Random] = (), resume: bool = False) -> None:
+        """
+        Método de inicialização da classe StreamingCheckpointer.
+
+        Parâmetros
+        ----------
+            directory: Text, optional
+                diretório onde as execuções são gravadas
+            interval: int, optional
+                quantidade de gerações entre as checkpoints
+            keep: int, optional
+                quantidade de checkpoints mantidas
+            generators: Sequence[random.Random], optional
+                geradores aleatórios salvos junto com o módulo `random`
+            resume: bool, optional
+                continua a execução mais recente em vez de iniciar uma nova
+        """
+
+        if resume:
+            self.directory = self.latest_run(directory)
+        else:
+            self.directory = os.path.join(directory, time.strftime("run-%Y%m%d-%H%M%S"))
+
+        self.interval = interval
+        self.keep = keep
+        self.generators = generators
+
+        self.__generation = 0
+
+        # Arquivo de genomas de cada genoma gravado, e os arquivos
+        # referenciados por cada checkpoint mantida
+        self.__chunks: Dict[int, int] = {}
+        self.__references: deque = deque(maxlen=keep)
+        self.__futures: List[Future] = []
+        self.__executor = ThreadPoolExecutor(max_workers=1)
+
+    @staticmethod
+    def latest_run(directory: Text) -> Text:
+        """
+        Método responsável por encontrar o diretório da execução mais
+        recente.
+
+        Parâmetros
+        ----------
+            directory: Text
+                diretório onde as execuções são gravadas
+
+        Retorno
+        -------
+            Caminho do diretório da execução
+        """
+
+        runs = sorted(glob.glob(os.path.join(directory, "run-*")))
+
+        if not runs:
+            raise FileNotFoundError(f"Nenhuma execução encontrada em {directory}")
+
+        return runs[-1]
+
+    def __files(self, prefix: Text) -> List[Tuple[int, Text]]:
+        """
+        Método responsável por listar os arquivos da execução, ordenados
+        pela geração.
+
+        Parâmetros
+        ----------
+            prefix: Text
+                prefixo dos arquivos, "genomes" ou "checkpoint"
+
+        Retorno
+        -------
+            Lista de tuplas (geração, caminho)
+        """
+
+        pattern = os.path.join(self.directory, f"{prefix}-*.pkl.gz")
+        files = [
+            (int(os.path.basename(path)[len(prefix) + 1:-len(".pkl.gz")]), path)
+            for path in glob.glob(pattern)
+        ]
+
+        return sorted(files)
+
+    def start_generation(self, generation: int) -> None:
+        """
+        Método chamado pelo NEAT no início de cada geração.
+
+        Parâmetros
+        ----------
+            generation: int
+                número da geração
+        """
+
+        self.__generation = generation
+
+    def end_generation(self, config: neat.Config, population: Dict[int, Any],
+                       species_set: neat.DefaultSpeciesSet) -> None:
+        """
+        Método chamado pelo NEAT ao fim de cada geração, com a população da
+        próxima geração já criada. A serialização é feita aqui, para que o
+        estado não mude durante a gravação, e o restante é enviado para a
+        thread de escrita.
+
+        Parâmetros
+        ----------
+            config: neat.Config
+                variável contendo a configuração do algoritimo
+            population: Dict[int, Any]
+                população da próxima geração
+            species_set: neat.DefaultSpeciesSet
+                espécies da próxima geração
+        """
+
+        generation = self.__generation + 1
+
+        if generation % self.interval:
+            return
+
+        buffer = io.BytesIO()
+        pickler = _StatePickler(buffer, config.genome_type, self.__chunks)
+        pickler.dump((
+            generation, population, species_set, random.getstate(),
+            [generator.getstate() for generator in self.generators],
+        ))
+
+        genomes = None
+
+        if pickler.genomes:
+            genomes = pickle.dumps(pickler.genomes, protocol=pickle.HIGHEST_PROTOCOL)
+            self.__chunks.update(dict.fromkeys(pickler.genomes, generation))
+
+        references = sorted({self.__chunks[key] for key in pickler.referenced})
+        self.__references.append(references)
+
+        # Esquece os genomas dos arquivos que serão removidos
+        live = set().union(*self.__references)
+        self.__chunks = {key: chunk for key, chunk in self.__chunks.items() if chunk in live}
+
+        header = pickle.dumps(references, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.__futures.append(self.__executor.submit(
+            self.__write, generation, header + buffer.getvalue(), genomes, live,
+        ))
+
+    def __write(self, generation: int, state: bytes, genomes: Optional[bytes],
+                live: Set[int]) -> None:
+        """
+        Método executado na thread de escrita, responsável por comprimir e
+        gravar os arquivos da checkpoint e remover as checkpoints antigas e
+        os arquivos de genomas que nenhuma checkpoint mantida referencia.
+
+        Parâmetros
+        ----------
+            generation: int
+                geração da checkpoint
+            state: bytes
+                arquivos de genomas referenciados, seguidos da população e
+                das espécies serializadas
+            genomes: bytes, optional
+                genomas gravados pela primeira vez, quando existem
+            live: Set[int]
+                gerações dos arquivos de genomas referenciados pelas
+                checkpoints mantidas
+        """
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Os genomas são gravados antes, então uma checkpoint nunca
+        # referencia um genoma que ainda não está no disco
+        for prefix, data in (("genomes", genomes), ("checkpoint", state)):
+            if data is None:
+                continue
+
+            path = os.path.join(self.directory, f"{prefix}-{generation:05d}.pkl.gz")
+
+            with open(path + ".tmp", "wb") as output:
+                output.write(gzip.compress(data, compresslevel=5))
+
+            os.replace(path + ".tmp", path)
+
+        for _, path in self.__files("checkpoint")[:-self.keep]:
+            os.remove(path)
+
+        for chunk, path in self.__files("genomes"):
+            if chunk not in live:
+                os.remove(path)
+
+    @staticmethod
+    def __references_of(path: Text) -> List[int]:
+        """
+        Método responsável por ler apenas a lista de arquivos de genomas
+        referenciados por uma checkpoint, sem carregar o estado.
+
+        Parâmetros
+        ----------
+            path: Text
+                caminho da checkpoint
+
+        Retorno
+        -------
+            Gerações dos arquivos de genomas referenciados
+        """
+
+        with gzip.open(path) as data:
+            return pickle.load(data)
+
+    def restore(self, config: neat.Config) -> neat.Population:
+        """
+        Método responsável por recriar a população da última checkpoint da
+        execução, restaurando também os geradores aleatórios.
+
+        Parâmetros
+        ----------
+            config: neat.Config
+                variável contendo a configuração do algoritimo
+
+        Retorno
+        -------
+            População pronta para continuar o treinamento
+        """
+
+        checkpoints = self.__files("checkpoint")
+
+        if not checkpoints:
+            raise FileNotFoundError(f"Nenhuma checkpoint encontrada em {self.directory}")
+
+        _, path = checkpoints[-1]
+        genomes = {}
+        chunks = {}
+
+        with gzip.open(path) as data:
+            stream = io.BytesIO(data.read())
+
+        # Carrega apenas os arquivos de genomas referenciados
+        for chunk in pickle.load(stream):
+            chunk_path = os.path.join(self.directory, f"genomes-{chunk:05d}.pkl.gz")
+
+            with gzip.open(chunk_path) as data:
+                loaded = pickle.load(data)
+
+            genomes.update(loaded)
+            chunks.update(dict.fromkeys(loaded, chunk))
+
+        state = _StateUnpickler(stream, genomes).load()
+
+        generation, population, species_set, random_state, generator_states = state
+
+        random.setstate(random_state)
+
+        for generator, generator_state in zip(self.generators, generator_states):
+            generator.setstate(generator_state)
+
+        restored = neat.Population(config, (population, species_set, generation))
+        restored.species.reporters = restored.reporters
+
+        # Continua a numeração dos genomas de onde ela parou
+        restored.reproduction.genome_indexer = count(max(genomes) + 1)
+
+        self.__generation = generation
+        self.__chunks = chunks
+        self.__references = deque(
+            [self.__references_of(kept) for _, kept in checkpoints[-self.keep:]],
+            maxlen=self.keep,
+        )
+
+        return restored
+
+    def close(self) -> None:
+        """
+        Método responsável por esperar as gravações pendentes, repassando
+        qualquer erro ocorrido na thread de escrita.
+        """
+
+        self.__executor.shutdown(wait=True)
+
+        for future in self.__futures:
+            future.result()
+
+        self.__futures = []
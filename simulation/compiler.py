@@ -0,0 +1,109 @@
+from typing import Text
+
+import neat
+import numpy as np
+from neat.graphs import feed_forward_layers
+
+from simulation.network import ACTIVATIONS, CompiledNetwork
+from simulation.sensors import SENSOR_SETS, validate_sensors
+
+
+def compile_genome(genome: neat.DefaultGenome, config: neat.Config) -> CompiledNetwork:
+    """
+    Função responsável por converter um genoma em uma rede compilada,
+    seguindo exatamente a ordem de avaliação do
+    `neat.nn.FeedForwardNetwork.create`.
+
+    Parâmetros
+    ----------
+        genome: neat.DefaultGenome
+            genoma que será convertido
+        config: neat.Config
+            variável contendo a configuração do algoritimo
+
+    Retorno
+    -------
+        Rede compilada em arrays
+    """
+
+    genome_config = config.genome_config
+    input_keys = genome_config.input_keys
+    output_keys = genome_config.output_keys
+
+    # Recupera as conexões habilitadas, na ordem em que aparecem no genoma
+    connections = [cg.key for cg in genome.connections.values() if cg.enabled]
+    layers = feed_forward_layers(input_keys, output_keys, connections)
+
+    # Entradas e saídas ocupam os primeiros slots, os ocultos vêm em seguida
+    slots = {key: i for i, key in enumerate(input_keys + output_keys)}
+
+    for layer in layers:
+        for node in layer:
+            slots.setdefault(node, len(slots))
+
+    compiled_layers = []
+
+    for layer in layers:
+        nodes = sorted(layer, key=slots.get)
+        links = [
+            [(slots[i], genome.connections[(i, o)].weight)
+             for i, o in connections if o == node]
+            for node in nodes
+        ]
+
+        fan_in = max(len(node_links) for node_links in links)
+        sources = np.zeros((len(nodes), fan_in), dtype=np.int64)
+        weights = np.zeros((len(nodes), fan_in), dtype=np.float64)
+
+        for j, node_links in enumerate(links):
+            for k, (source, weight) in enumerate(node_links):
+                sources[j, k] = source
+                weights[j, k] = weight
+
+        node_genes = [genome.nodes[node] for node in nodes]
+
+        for ng in node_genes:
+            if ng.aggregation != "sum" or ng.activation not in ACTIVATIONS:
+                raise ValueError(
+                    "Função não suportada pela rede compilada: "
+                    f"{ng.aggregation}/{ng.activation}"
+                )
+
+        compiled_layers.append({
+            "nodes": np.array([slots[node] for node in nodes], dtype=np.int64),
+            "bias": np.array([ng.bias for ng in node_genes], dtype=np.float64),
+            "response": np.array([ng.response for ng in node_genes], dtype=np.float64),
+            "activation": np.array(
+                [ACTIVATIONS.index(ng.activation) for ng in node_genes], dtype=np.int64,
+            ),
+            "sources": sources,
+            "weights": weights,
+        })
+
+    return CompiledNetwork(
+        len(input_keys),
+        len(slots),
+        [slots[key] for key in output_keys],
+        compiled_layers,
+    )
+
+
+def configure_genome(config: neat.Config, name: Text) -> None:
+    """
+    Função responsável por ajustar a quantidade de entradas dos genomas ao
+    conjunto de sensores escolhido, substituindo o `num_inputs` do arquivo
+    de configuração. Deve ser chamada antes da criação da população.
+
+    Parâmetros
+    ----------
+        config: neat.Config
+            variável contendo a configuração do algoritimo
+        name: Text
+            nome do conjunto de sensores
+    """
+
+    validate_sensors(name)
+
+    genome_config = config.genome_config
+    genome_config.num_inputs = len(SENSOR_SETS[name])
+    genome_config.input_keys = [-i - 1 for i in range(genome_config.num_inputs)]
@@ -0,0 +1,168 @@
+import random
+from typing import Any, Dict, Hashable, List, Optional, Text
+
+import numpy as np
+
+from config import COURSE_LENGTH, GAME_SPEED, PIPE_GAP
+
+
+class Course:
+    """
+    Classe que representa um percurso, ou seja, a sequência de aberturas
+    dos pipes de uma partida e a sua dificuldade. As aberturas são geradas
+    de uma só vez a partir de uma semente, então dois percursos com a mesma
+    semente e a mesma dificuldade são idênticos, independente do processo
+    que os gerou.
+
+    Atributos
+    ---------
+        MIN_SIZE: int
+            altura mínima do pipe de baixo
+        MAX_SIZE: int
+            altura máxima do pipe de baixo
+        seed: int
+            semente utilizada para gerar o percurso
+        gap: int
+            altura da abertura entre os pipes
+        speed: int
+            deslocamento dos pipes e do chão por quadro
+        spread: float
+            fração da faixa entre MIN_SIZE e MAX_SIZE em que as aberturas
+            são sorteadas, em torno do centro
+        sizes: np.ndarray
+            altura do pipe de baixo de cada par de pipes do percurso
+
+    Métodos
+    -------
+        size(index: int) -> int:
+            recupera a altura do pipe de baixo de um par de pipes
+        settings() -> Dict[Text, Any]:
+            parâmetros que recriam o percurso
+        key() -> Hashable:
+            identifica o percurso e a sua dificuldade
+        suite(count: int, seed: int) -> List[Course]:
+            gera um conjunto fixo de percursos
+    """
+
+    MIN_SIZE: int = 100
+    MAX_SIZE: int = 400
+
+    def __init__(self, seed: Optional[int] = None, length: int = COURSE_LENGTH,
+                 gap: int = PIPE_GAP, speed: int = GAME_SPEED,
+                 spread: float = 1.0) -> None:
+        """
+        Método de inicialização da classe Course.
+
+        Parâmetros
+        ----------
+            seed: int, optional
+                semente do percurso. Quando omitida, uma semente é sorteada
+                pelo módulo `random`
+            length: int, optional
+                quantidade de pares de pipes gerados antecipadamente
+            gap: int, optional
+                altura da abertura entre os pipes
+            speed: int, optional
+                deslocamento dos pipes e do chão por quadro
+            spread: float, optional
+                fração da faixa de alturas em que as aberturas são sorteadas
+        """
+
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.gap = int(gap)
+        self.speed = int(speed)
+        self.spread = float(spread)
+
+        # Com a faixa completa, o sorteio é o mesmo do jogo original
+        half = (self.MAX_SIZE - self.MIN_SIZE) * self.spread / 2
+        center = (self.MAX_SIZE + self.MIN_SIZE) / 2
+
+        self.__low = int(round(center - half))
+        self.__high = int(round(center + half))
+
+        self.__generator = np.random.default_rng(self.seed)
+        self.sizes = self.__draw(length)
+
+    def __draw(self, count: int) -> np.ndarray:
+        """
+        Método responsável por sortear as próximas aberturas do percurso.
+
+        Parâmetros
+        ----------
+            count: int
+                quantidade de aberturas sorteadas
+
+        Retorno
+        -------
+            Array com as alturas sorteadas
+        """
+
+        return self.__generator.integers(self.__low, self.__high + 1, count)
+
+    def size(self, index: int) -> int:
+        """
+        Método responsável por recuperar a altura do pipe de baixo de um par
+        de pipes. O percurso é estendido, de forma determinística, quando a
+        partida passa do tamanho gerado inicialmente.
+
+        Parâmetros
+        ----------
+            index: int
+                posição do par de pipes no percurso
+
+        Retorno
+        -------
+            Altura do pipe de baixo
+        """
+
+        while index >= len(self.sizes):
+            self.sizes = np.concatenate((self.sizes, self.__draw(len(self.sizes))))
+
+        return int(self.sizes[index])
+
+    def settings(self) -> Dict[Text, Any]:
+        """
+        Método responsável por listar os parâmetros que recriam o percurso,
+        usados para enviá-lo a outros processos sem as aberturas geradas.
+
+        Retorno
+        -------
+            Dicionário com os argumentos do construtor
+        """
+
+        return {"seed": self.seed, "gap": self.gap, "speed": self.speed,
+                "spread": self.spread}
+
+    def key(self) -> Hashable:
+        """
+        Método responsável por identificar o percurso e a sua dificuldade,
+        já que a mesma semente gera partidas diferentes em outra dificuldade.
+
+        Retorno
+        -------
+            Tupla com a semente e a dificuldade
+        """
+
+        return self.seed, self.gap, self.speed, self.spread
+
+    @classmethod
+    def suite(cls, count: int, seed: int = 0) -> List["Course"]:
+        """
+        Método responsável por gerar um conjunto fixo de percursos, útil
+        para comparar resultados e medir desempenho.
+
+        Parâmetros
+        ----------
+            count: int
+                quantidade de percursos
+            seed: int, optional
+                semente do conjunto
+
+        Retorno
+        -------
+            Lista com os percursos gerados
+        """
+
+        seeds = random.Random(seed)
+
+        return [cls(seeds.randrange(2 ** 32)) for _ in range(count)]
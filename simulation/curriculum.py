@@ -0,0 +1,276 @@
+from typing import Any, Dict, List, Optional, Sequence, Text
+
+import neat
+
+from simulation.course import Course
+from simulation.engine import Simulation
+from simulation.termination import TerminationPolicy
+from config import GAME_SPEED, PIPE_GAP
+from config import CURRICULUM_LEVELS, CURRICULUM_START_GAP, CURRICULUM_START_SPEED
+from config import CURRICULUM_START_SPREAD, CURRICULUM_PROMOTION
+from config import CURRICULUM_MIN_POPULATION, CURRICULUM_MIN_FRAMES, CURRICULUM_BUDGET_GROWTH
+
+
+class Curriculum(neat.reporting.BaseReporter):
+    """
+    Reporter do NEAT que aumenta a dificuldade dos percursos ao longo do
+    treinamento. As primeiras gerações jogam percursos fáceis, com aberturas
+    maiores, pipes mais lentos e alturas próximas do centro, e uma população
+    menor. Sempre que o melhor genoma da geração, segundo o
+    `neat.StatisticsReporter`, alcança o fitness de promoção, o próximo nível
+    é liberado, até chegar à dificuldade do `config.py` e à população do
+    arquivo de configuração.
+
+    Nos níveis intermediários a partida é limitada aos quadros necessários
+    para a promoção, então o fitness_threshold só pode ser alcançado no nível
+    final. Nele, o limite de quadros cresce junto com o melhor fitness, até
+    o primeiro quadro em que um sobrevivente ultrapassa o fitness_threshold.
+
+    Atributos
+    ---------
+        stats: neat.StatisticsReporter
+            estatísticas das gerações, de onde vem o melhor fitness
+        levels: int
+            quantidade de níveis de dificuldade
+        level: int
+            nível atual, de 0 até `levels - 1`
+        promotion: float
+            fitness que libera o próximo nível
+        population_size: int
+            tamanho da população no nível final
+        min_population: int
+            tamanho da população no primeiro nível
+        min_frames: int
+            menor limite de quadros do nível final
+        growth: float
+            quantas vezes o limite de quadros do nível final supera a duração
+            do melhor pássaro da geração anterior
+        max_frames: int
+            limite de quadros da próxima geração
+
+    Métodos
+    -------
+        final() -> bool:
+            indica se o nível atual é o último
+        difficulty() -> Dict[Text, Any]:
+            parâmetros dos percursos do nível atual
+        courses(courses: Sequence[Course]) -> List[Course]:
+            recria os percursos na dificuldade atual
+        termination(base: TerminationPolicy) -> TerminationPolicy:
+            aplica o limite de quadros atual às regras de término
+    """
+
+    def __init__(self, config: neat.Config, stats: neat.StatisticsReporter,
+                 levels: int = CURRICULUM_LEVELS,
+                 promotion: float = CURRICULUM_PROMOTION,
+                 min_population: int = CURRICULUM_MIN_POPULATION,
+                 min_frames: int = CURRICULUM_MIN_FRAMES,
+                 growth: float = CURRICULUM_BUDGET_GROWTH) -> None:
+        """
+        Método de inicialização da classe Curriculum. O tamanho da população
+        do `config` é reduzido ao do primeiro nível, então o reporter deve
+        ser criado antes da população inicial.
+
+        Parâmetros
+        ----------
+            config: neat.Config
+                variável contendo a configuração do algoritimo
+            stats: neat.StatisticsReporter
+                estatísticas das gerações, adicionadas antes deste reporter
+            levels: int, optional
+                quantidade de níveis de dificuldade
+            promotion: float, optional
+                fitness que libera o próximo nível
+            min_population: int, optional
+                tamanho da população no primeiro nível
+            min_frames: int, optional
+                menor limite de quadros do nível final
+            growth: float, optional
+                crescimento do limite de quadros do nível final
+        """
+
+        if levels < 1:
+            raise ValueError("O currículo precisa de pelo menos um nível")
+
+        if levels > 1 and promotion >= config.fitness_threshold:
+            raise ValueError("O fitness de promoção deve ser menor que o fitness_threshold")
+
+        self.stats = stats
+        self.levels = levels
+        self.level = 0
+        self.promotion = promotion
+        self.population_size = config.pop_size
+        self.min_population = min(min_population, config.pop_size)
+        self.min_frames = min_frames
+        self.growth = growth
+
+        self.__config = config
+        self.__threshold_frames = self.__frames(config.fitness_threshold)
+
+        self.__update(None)
+
+    @staticmethod
+    def __frames(fitness: float) -> int:
+        """
+        Método responsável por converter um fitness na quantidade de quadros
+        sobrevividos. O arredondamento absorve o erro da soma do fitness
+        quadro a quadro.
+
+        Parâmetros
+        ----------
+            fitness: float
+                fitness de um pássaro
+
+        Retorno
+        -------
+            Quantidade de quadros
+        """
+
+        return int(round(fitness / Simulation.FITNESS_PER_FRAME))
+
+    def final(self) -> bool:
+        """
+        Método responsável por indicar se o nível atual é o último, com a
+        dificuldade do `config.py`.
+
+        Retorno
+        -------
+            True se o nível atual é o último
+        """
+
+        return self.level == self.levels - 1
+
+    def __progress(self) -> float:
+        """
+        Método responsável por calcular o avanço no currículo.
+
+        Retorno
+        -------
+            Valor entre 0 (primeiro nível) e 1 (nível final)
+        """
+
+        return self.level / (self.levels - 1) if self.levels > 1 else 1.0
+
+    def difficulty(self) -> Dict[Text, Any]:
+        """
+        Método responsável por interpolar os parâmetros dos percursos entre
+        a dificuldade inicial e a do `config.py`.
+
+        Retorno
+        -------
+            Dicionário com os argumentos de dificuldade do `Course`
+        """
+
+        progress = self.__progress()
+        interpolate = lambda start, end: start + (end - start) * progress
+
+        return {
+            "gap": int(round(interpolate(CURRICULUM_START_GAP, PIPE_GAP))),
+            "speed": int(round(interpolate(CURRICULUM_START_SPEED, GAME_SPEED))),
+            "spread": round(interpolate(CURRICULUM_START_SPREAD, 1.0), 3),
+        }
+
+    def courses(self, courses: Sequence[Course]) -> List[Course]:
+        """
+        Método responsável por recriar os percursos com as mesmas sementes e
+        a dificuldade do nível atual.
+
+        Parâmetros
+        ----------
+            courses: Sequence[Course]
+                percursos da geração
+
+        Retorno
+        -------
+            Lista com os percursos na dificuldade atual
+        """
+
+        difficulty = self.difficulty()
+
+        return [Course(course.seed, **difficulty) for course in courses]
+
+    def termination(self, base: TerminationPolicy) -> TerminationPolicy:
+        """
+        Método responsável por aplicar o limite de quadros do nível atual às
+        regras de término, sem ultrapassar o limite já configurado.
+
+        Parâmetros
+        ----------
+            base: TerminationPolicy
+                regras de término configuradas para o treinamento
+
+        Retorno
+        -------
+            Regras de término da próxima geração
+        """
+
+        max_frames = self.max_frames
+
+        if base.max_frames is not None:
+            max_frames = min(max_frames, base.max_frames)
+
+        return TerminationPolicy(
+            max_frames, base.max_pipes,
+            base.fitness_threshold, base.elite_count,
+        )
+
+    def __update(self, best: Optional[float]) -> None:
+        """
+        Método responsável por ajustar o limite de quadros e o tamanho da
+        população ao nível atual.
+
+        Parâmetros
+        ----------
+            best: float, optional
+                melhor fitness da última geração
+        """
+
+        promotion_frames = self.__frames(self.promotion)
+
+        if not self.final():
+            # Sobreviver até o fim da partida já garante a promoção
+            self.max_frames = promotion_frames
+        else:
+            budget = max(self.min_frames, int(self.growth * self.__frames(best or 0.0)))
+
+            # O limite para logo depois do fitness_threshold, então um
+            # pássaro que sobrevive até ele encerra o treinamento mesmo sem
+            # o critério de término do threshold
+            self.max_frames = min(budget, self.__threshold_frames + 1)
+
+        self.__config.pop_size = int(round(
+            self.min_population
+            + (self.population_size - self.min_population) * self.__progress()
+        ))
+
+    def post_evaluate(self, config: neat.Config, population: Dict[int, Any],
+                      species: Any, best_genome: neat.DefaultGenome) -> None:
+        """
+        Método chamado pelo NEAT após a avaliação e antes da reprodução,
+        quando a promoção é decidida e a próxima geração é configurada.
+
+        Parâmetros
+        ----------
+            config: neat.Config
+                variável contendo a configuração do algoritimo
+            population: Dict[int, Any]
+                genomas da geração
+            species: Any
+                conjunto de espécies
+            best_genome: neat.DefaultGenome
+                melhor genoma da geração
+        """
+
+        best = self.stats.most_fit_genomes[-1].fitness
+
+        if not self.final() and self.__frames(best) >= self.__frames(self.promotion):
+            self.level += 1
+
+        self.__update(best)
+
+        difficulty = self.difficulty()
+
+        print("Curriculum level {0}/{1}: gap {2}, speed {3}, spread {4:.2f}, budget {5} frames, "
+              "population {6}".format(self.level + 1, self.levels, difficulty["gap"],
+                                      difficulty["speed"], difficulty["spread"], self.max_frames,
+                                      config.pop_size))
@@ -0,0 +1,718 @@
+from typing import Callable, Dict, List, Optional, Sequence, Text, Tuple, Union
+
+import numpy as np
+
+from simulation.course import Course
+from simulation.profiling import PhaseProfiler
+from simulation.sensors import read_sensors, validate_sensors
+from config import (
+    COLLISION_MODE,
+    SENSORS,
+    GRAVITY_CONSTANT,
+    GROUND_HEIGHT,
+    GROUND_WIDTH,
+    PIPE_HEIGHT,
+    PIPE_WIDTH,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+
+
+# Formas de combinar o fitness de um genoma nos vários percursos jogados
+AGGREGATIONS: Dict[Text, Callable[..., np.ndarray]] = {
+    "mean": np.mean,
+    "min": np.min,
+}
+
+
+def aggregate_fitness(lane_fitness: np.ndarray, aggregation: Text) -> np.ndarray:
+    """
+    Função responsável por combinar o fitness que cada genoma alcançou em
+    cada percurso em um único valor por genoma.
+
+    Parâmetros
+    ----------
+        lane_fitness: np.ndarray
+            matriz com o fitness de cada genoma, uma linha por percurso
+        aggregation: Text
+            forma de combinação, "mean" ou "min"
+
+    Retorno
+    -------
+        Array com o fitness combinado de cada genoma
+    """
+
+    if aggregation not in AGGREGATIONS:
+        raise ValueError(f"Agregação de fitness desconhecida: {aggregation}")
+
+    return AGGREGATIONS[aggregation](lane_fitness, axis=0)
+
+
+class Shape:
+    """
+    Classe que representa a máscara de colisão de um objeto do jogo sem
+    depender do pygame. Cada linha da máscara é guardada como um inteiro,
+    onde o bit `x` indica se o pixel da coluna `x` é sólido.
+
+    Atributos
+    ---------
+        width: int
+            largura da máscara em pixels
+        height: int
+            altura da máscara em pixels
+        rows: List[int]
+            bits de cada uma das linhas da máscara
+
+    Métodos
+    -------
+        rectangle(width: int, height: int) -> Shape:
+            cria uma máscara totalmente sólida
+        bounding_box() -> Tuple[int, int, int, int]:
+            calcula o retângulo que envolve os pixels sólidos
+        overlap(xpos: int, ypos: int, other: Shape, other_xpos: int,
+                other_ypos: int) -> bool:
+            verifica se existe algum pixel sólido em comum entre as máscaras
+    """
+
+    __slots__ = ("width", "height", "rows")
+
+    def __init__(self, width: int, height: int, rows: List[int]) -> None:
+        """
+        Método de inicialização da classe Shape.
+
+        Parâmetros
+        ----------
+            width: int
+                largura da máscara em pixels
+            height: int
+                altura da máscara em pixels
+            rows: List[int]
+                bits de cada uma das linhas da máscara
+        """
+
+        self.width = width
+        self.height = height
+        self.rows = rows
+
+    @classmethod
+    def rectangle(cls, width: int, height: int) -> "Shape":
+        """
+        Método responsável por criar uma máscara totalmente sólida.
+
+        Parâmetros
+        ----------
+            width: int
+                largura da máscara em pixels
+            height: int
+                altura da máscara em pixels
+
+        Retorno
+        -------
+            Instância da classe Shape com todos os bits ligados
+        """
+
+        return cls(width, height, [(1 << width) - 1] * height)
+
+    def bounding_box(self) -> Tuple[int, int, int, int]:
+        """
+        Método responsável por calcular o menor retângulo que envolve todos
+        os pixels sólidos da máscara.
+
+        Retorno
+        -------
+            Tupla (esquerda, topo, direita, base), com direita e base
+            exclusivas
+        """
+
+        filled = [y for y, bits in enumerate(self.rows) if bits]
+
+        if not filled:
+            return 0, 0, 0, 0
+
+        left = min((bits & -bits).bit_length() - 1 for bits in self.rows if bits)
+        right = max(bits.bit_length() for bits in self.rows)
+
+        return left, filled[0], right, filled[-1] + 1
+
+    def overlap(self, xpos: int, ypos: int, other: "Shape",
+                other_xpos: int, other_ypos: int) -> bool:
+        """
+        Método que reproduz o `pygame.sprite.collide_mask`, verificando se
+        as duas máscaras possuem algum pixel sólido na mesma posição.
+
+        Parâmetros
+        ----------
+            xpos: int
+                coordenada x desta máscara
+            ypos: int
+                coordenada y desta máscara
+            other: Shape
+                máscara que será comparada
+            other_xpos: int
+                coordenada x da outra máscara
+            other_ypos: int
+                coordenada y da outra máscara
+
+        Retorno
+        -------
+            True se as máscaras colidirem
+        """
+
+        # Descarta rapidamente as máscaras cujos retângulos não se tocam
+        if (xpos >= other_xpos + other.width or other_xpos >= xpos + self.width
+                or ypos >= other_ypos + other.height
+                or other_ypos >= ypos + self.height):
+            return False
+
+        offset = other_xpos - xpos
+
+        for row in range(max(ypos, other_ypos),
+                         min(ypos + self.height, other_ypos + other.height)):
+            bits = self.rows[row - ypos]
+            other_bits = other.rows[row - other_ypos]
+
+            if offset >= 0:
+                other_bits <<= offset
+            else:
+                bits <<= -offset
+
+            if bits & other_bits:
+                return True
+
+        return False
+
+
+class Simulation:
+    """
+    Classe responsável por simular o jogo sem nenhum objeto do pygame. O
+    estado dos pássaros é guardado em arrays do NumPy, uma posição por
+    pássaro, e toda a população é avançada com poucas operações vetoriais
+    por quadro, seguindo as mesmas regras dos sprites.
+
+    A população pode jogar vários percursos ao mesmo tempo, em faixas. Cada
+    faixa tem uma cópia de todos os pássaros e as suas próprias aberturas
+    dos pipes, enquanto a posição dos pipes é a mesma em todas, já que ela
+    não depende do percurso. Os pássaros são numerados faixa a faixa: o
+    pássaro `i` da faixa `k` ocupa a posição `k * population_size + i`.
+
+    Atributos
+    ---------
+        BIRD_XPOS: int
+            posição x fixa de todos os pássaros
+        BIRD_START_YPOS: int
+            posição y inicial dos pássaros
+        FLY_VELOCITY: float
+            velocidade aplicada quando o pássaro bate as asas
+        FITNESS_PER_FRAME: float
+            fitness acumulado por quadro sobrevivido
+        PIPE_SPAWN_XPOS: int
+            posição x em que os novos pipes são criados
+        PIPE_SLOTS: int
+            quantidade de pares de pipes existentes ao mesmo tempo
+
+        collision: str
+            modo de colisão, "analytic" para comparar apenas os retângulos
+            com o par de pipes mais próximo ou "mask" para a comparação
+            exata pixel a pixel
+        sensors: str
+            conjunto de sensores que forma as entradas das redes neurais
+        profiler: PhaseProfiler
+            profiler das fases de cada quadro: física, sensores, movimento
+            e colisão
+        population_size: int
+            quantidade de pássaros de cada faixa
+        lanes: int
+            quantidade de percursos jogados ao mesmo tempo
+        bird_lane: np.ndarray
+            faixa de cada pássaro
+        bird_ypos: np.ndarray
+            posição y de cada pássaro
+        bird_velocity: np.ndarray
+            velocidade vertical de cada pássaro
+        alive: np.ndarray
+            indica se cada pássaro ainda está vivo
+        fitness: np.ndarray
+            fitness acumulado de cada pássaro
+        death_frame: np.ndarray
+            quadro em que cada pássaro morreu, -1 enquanto estiver vivo
+        pipe_xpos: np.ndarray
+            posição x do par de pipes de cada slot
+        pipe_gap_top: np.ndarray
+            coordenada y do início da abertura do par de pipes de cada slot,
+            uma coluna por faixa
+        pipe_gap_bottom: np.ndarray
+            coordenada y do fim da abertura do par de pipes de cada slot,
+            uma coluna por faixa
+        pipe_head: int
+            slot do par de pipes mais antigo, o próximo a ser substituído
+        ground_xpos: np.ndarray
+            posição x de cada bloco do chão
+        courses: List[Course]
+            percurso de cada faixa
+        course: Course
+            percurso da primeira faixa, desenhado pelo jogo
+        speed: int
+            deslocamento dos pipes e do chão por quadro, o mesmo em todas as
+            faixas
+        score: int
+            quantidade de pipes ultrapassados
+        frame: int
+            quantidade de quadros simulados
+
+    Métodos
+    -------
+        reset(population_size: int,
+              course: Union[Course, Sequence[Course], None] = None) -> None:
+            volta a simulação ao estado inicial
+        set_sensors(sensors: str) -> None:
+            escolhe o conjunto de sensores das redes neurais
+        pipe_ahead(xpos: int) -> int:
+            encontra o primeiro par de pipes que ainda não passou de uma
+            coordenada x
+        next_pipe() -> int:
+            encontra o primeiro par de pipes ainda não ultrapassado
+        gap_center(index: int) -> np.ndarray:
+            calcula o centro da abertura de um par de pipes
+        collide(indices: np.ndarray) -> np.ndarray:
+            verifica quais pássaros colidiram com o chão ou com os pipes
+        step(policy: Callable[[np.ndarray, np.ndarray], np.ndarray]) -> None:
+            avança toda a população em um quadro
+        is_over() -> bool:
+            indica se todos os pássaros morreram
+        lane_fitness() -> np.ndarray:
+            separa o fitness dos pássaros por faixa
+        genome_fitness(aggregation: Text = "mean") -> np.ndarray:
+            combina o fitness de cada genoma em todas as faixas
+    """
+
+    BIRD_XPOS: int = int(SCREEN_WIDTH / 3)
+    BIRD_START_YPOS: int = int(SCREEN_HEIGHT / 2)
+    FLY_VELOCITY: float = -15
+    FITNESS_PER_FRAME: float = 0.1
+    PIPE_SPAWN_XPOS: int = SCREEN_WIDTH * 2
+    PIPE_SLOTS: int = 2
+
+    def __init__(self, population_size: int, bird_shape: Shape,
+                 pipe_shape: Optional[Shape] = None,
+                 inverted_pipe_shape: Optional[Shape] = None,
+                 ground_shape: Optional[Shape] = None,
+                 collision: str = COLLISION_MODE,
+                 sensors: str = SENSORS,
+                 profiler: Optional[PhaseProfiler] = None) -> None:
+        """
+        Método de inicialização da classe Simulation.
+
+        Parâmetros
+        ----------
+            population_size: int
+                quantidade de pássaros simulados
+            bird_shape: Shape
+                máscara de colisão dos pássaros
+            pipe_shape: Shape, optional
+                máscara de colisão do pipe de baixo
+            inverted_pipe_shape: Shape, optional
+                máscara de colisão do pipe de cima
+            ground_shape: Shape, optional
+                máscara de colisão do chão
+            collision: str, optional
+                modo de colisão, "analytic" ou "mask"
+            sensors: str, optional
+                conjunto de sensores que forma as entradas das redes neurais
+            profiler: PhaseProfiler, optional
+                profiler que mede as fases de cada quadro. Quando omitido,
+                um profiler desligado é criado
+        """
+
+        if collision not in ("analytic", "mask"):
+            raise ValueError(f"Modo de colisão desconhecido: {collision}")
+
+        self.collision = collision
+        self.profiler = profiler or PhaseProfiler()
+        self.set_sensors(sensors)
+        self.bird_shape = bird_shape
+        self.pipe_shape = pipe_shape or Shape.rectangle(PIPE_WIDTH, PIPE_HEIGHT)
+        self.inverted_pipe_shape = inverted_pipe_shape or self.pipe_shape
+        self.ground_shape = ground_shape or Shape.rectangle(GROUND_WIDTH, GROUND_HEIGHT)
+        self.__bird_box = bird_shape.bounding_box()
+
+        self.reset(population_size)
+
+    def reset(self, population_size: int,
+              course: Union[Course, Sequence[Course], None] = None) -> None:
+        """
+        Método responsável por voltar a simulação ao estado inicial.
+
+        Parâmetros
+        ----------
+            population_size: int
+                quantidade de pássaros simulados em cada faixa
+            course: Union[Course, Sequence[Course]], optional
+                percurso com as aberturas dos pipes, ou uma lista de
+                percursos jogados ao mesmo tempo, um por faixa. Quando
+                omitido, um novo percurso aleatório é gerado
+        """
+
+        if course is None:
+            course = Course()
+
+        self.courses = [course] if isinstance(course, Course) else list(course)
+        self.course = self.courses[0]
+        self.lanes = len(self.courses)
+        self.speed = self.course.speed
+
+        # A posição dos pipes é compartilhada, então só a abertura pode
+        # variar entre as faixas
+        if any(course.speed != self.speed for course in self.courses):
+            raise ValueError("Todos os percursos devem ter a mesma velocidade")
+
+        self.__gaps = np.array([course.gap for course in self.courses], dtype=np.int64)
+        self.population_size = population_size
+        self.__pipes_created = 0
+
+        size = population_size * self.lanes
+
+        self.bird_lane = np.repeat(np.arange(self.lanes), population_size)
+        self.bird_ypos = np.full(size, self.BIRD_START_YPOS, dtype=np.int64)
+        self.bird_velocity = np.zeros(size, dtype=np.float64)
+        self.alive = np.ones(size, dtype=bool)
+        self.fitness = np.zeros(size, dtype=np.float64)
+        self.death_frame = np.full(size, -1, dtype=np.int64)
+
+        # Os pipes ficam em um buffer circular: o par que sai da tela tem o
+        # seu slot reaproveitado pelo novo par
+        self.pipe_xpos = np.zeros(self.PIPE_SLOTS, dtype=np.int64)
+        self.pipe_gap_top = np.zeros((self.PIPE_SLOTS, self.lanes), dtype=np.int64)
+        self.pipe_gap_bottom = np.zeros((self.PIPE_SLOTS, self.lanes), dtype=np.int64)
+        self.pipe_head = 0
+        self.__cursors = {}
+
+        for i in range(self.PIPE_SLOTS):
+            self.__add_pipes(SCREEN_WIDTH * i + 800)
+
+        self.ground_xpos = np.array([0, SCREEN_WIDTH], dtype=np.int64)
+
+        self.score = 0
+        self.frame = 0
+
+    def __add_pipes(self, xpos: int) -> None:
+        """
+        Método responsável por criar um novo par de pipes com a próxima
+        abertura do percurso de cada faixa, no slot do par mais antigo.
+
+        Parâmetros
+        ----------
+            xpos: int
+                posição x inicial dos pipes
+        """
+
+        size = np.array([course.size(self.__pipes_created) for course in self.courses])
+        slot = self.__pipes_created % self.PIPE_SLOTS
+        self.__pipes_created += 1
+
+        self.pipe_xpos[slot] = xpos
+        self.pipe_gap_bottom[slot] = SCREEN_HEIGHT - size
+        self.pipe_gap_top[slot] = SCREEN_HEIGHT - size - self.__gaps
+        self.pipe_head = self.__pipes_created % self.PIPE_SLOTS
+
+    def set_sensors(self, sensors: str) -> None:
+        """
+        Método responsável por escolher o conjunto de sensores que forma as
+        entradas das redes neurais.
+
+        Parâmetros
+        ----------
+            sensors: str
+                nome do conjunto de sensores, uma das chaves de `SENSOR_SETS`
+        """
+
+        validate_sensors(sensors)
+        self.sensors = sensors
+
+    def pipe_ahead(self, xpos: int) -> int:
+        """
+        Método responsável por encontrar o primeiro par de pipes cuja borda
+        direita ainda não passou da coordenada x informada. Como os pipes
+        só andam para a esquerda, a busca continua do slot encontrado na
+        consulta anterior da mesma coordenada, avançando no máximo alguns
+        slots por quadro.
+
+        Parâmetros
+        ----------
+            xpos: int
+                coordenada x consultada
+
+        Retorno
+        -------
+            Slot do par de pipes. Quando todos já passaram, o slot do par
+            mais novo
+        """
+
+        newest = (self.pipe_head - 1) % self.PIPE_SLOTS
+        slot = self.__cursors.get(xpos, self.pipe_head)
+
+        while slot != newest and self.pipe_xpos[slot] + PIPE_WIDTH <= xpos:
+            slot = (slot + 1) % self.PIPE_SLOTS
+
+        self.__cursors[xpos] = slot
+
+        return slot
+
+    def next_pipe(self) -> int:
+        """
+        Método responsável por encontrar o primeiro par de pipes que os
+        pássaros ainda não ultrapassaram.
+
+        Retorno
+        -------
+            Slot do par de pipes
+        """
+
+        return self.pipe_ahead(self.BIRD_XPOS)
+
+    def gap_center(self, index: int) -> np.ndarray:
+        """
+        Método responsável por calcular o centro da abertura de um par de
+        pipes em cada faixa.
+
+        Parâmetros
+        ----------
+            index: int
+                slot do par de pipes
+
+        Retorno
+        -------
+            Array com a coordenada y do centro da abertura de cada faixa
+        """
+
+        return (self.pipe_gap_bottom[index] + self.pipe_gap_top[index]) // 2
+
+    def __obstacles(self) -> List[tuple]:
+        """
+        Método que lista todos os obstáculos do cenário no quadro atual.
+
+        Retorno
+        -------
+            Lista de tuplas (máscara, x, y, faixa) com o chão e os pipes. O
+            chão, presente em todas as faixas, tem a faixa None
+        """
+
+        ground_ypos = SCREEN_HEIGHT - GROUND_HEIGHT
+        inverted_height = self.inverted_pipe_shape.height
+
+        obstacles = [
+            (self.ground_shape, xpos, ground_ypos, None)
+            for xpos in self.ground_xpos.tolist()
+        ]
+
+        for xpos, gap_top, gap_bottom in zip(self.pipe_xpos.tolist(),
+                                             self.pipe_gap_top,
+                                             self.pipe_gap_bottom):
+            for lane in range(self.lanes):
+                obstacles.append((self.pipe_shape, xpos, int(gap_bottom[lane]), lane))
+                obstacles.append((self.inverted_pipe_shape, xpos,
+                                  int(gap_top[lane]) - inverted_height, lane))
+
+        return obstacles
+
+    def __collide_analytic(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Método responsável por verificar quais pássaros colidiram usando
+        apenas a geometria conhecida do cenário: o retângulo do pássaro é
+        comparado com a altura do chão e com os limites da abertura do par
+        de pipes mais próximo, para todos os pássaros de uma só vez.
+
+        Parâmetros
+        ----------
+            indices: np.ndarray
+                índices dos pássaros vivos
+
+        Retorno
+        -------
+            Array booleano indicando os pássaros que colidiram
+        """
+
+        left, top, right, bottom = self.__bird_box
+        ypos = self.bird_ypos[indices]
+        lane = self.bird_lane[indices]
+
+        # Os blocos do chão cobrem toda a largura da tela
+        collided = ypos + bottom > SCREEN_HEIGHT - GROUND_HEIGHT
+
+        bird_left = self.BIRD_XPOS + left
+        bird_right = self.BIRD_XPOS + right
+
+        # Apenas o primeiro par de pipes que ainda não foi ultrapassado pode
+        # tocar os pássaros, já que todos estão na mesma coluna
+        slot = self.pipe_ahead(bird_left)
+        xpos = self.pipe_xpos[slot]
+
+        if bird_left < xpos + self.pipe_shape.width and xpos < bird_right:
+            gap_top = self.pipe_gap_top[slot, lane]
+            gap_bottom = self.pipe_gap_bottom[slot, lane]
+
+            collided |= (ypos + top < gap_top) | (ypos + bottom > gap_bottom)
+
+        return collided
+
+    def __collide_mask(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Método responsável por verificar quais pássaros colidiram com o chão
+        ou com algum pipe. Os retângulos são comparados de forma vetorial e
+        apenas os pássaros que tocam o retângulo de um obstáculo têm as
+        máscaras comparadas pixel a pixel.
+
+        Parâmetros
+        ----------
+            indices: np.ndarray
+                índices dos pássaros vivos
+
+        Retorno
+        -------
+            Array booleano indicando os pássaros que colidiram
+        """
+
+        shape = self.bird_shape
+        xpos = self.BIRD_XPOS
+        ypos = self.bird_ypos[indices]
+        lane = self.bird_lane[indices]
+
+        collided = np.zeros(len(indices), dtype=bool)
+
+        for obstacle, obstacle_xpos, obstacle_ypos, obstacle_lane in self.__obstacles():
+            # Todos os pássaros estão na mesma coluna
+            if (xpos >= obstacle_xpos + obstacle.width
+                    or obstacle_xpos >= xpos + shape.width):
+                continue
+
+            candidates = ~collided & (ypos < obstacle_ypos + obstacle.height) \
+                & (obstacle_ypos < ypos + shape.height)
+
+            # Os pipes só atingem os pássaros da própria faixa
+            if obstacle_lane is not None:
+                candidates &= lane == obstacle_lane
+
+            candidates = np.flatnonzero(candidates)
+
+            for i in candidates.tolist():
+                collided[i] = shape.overlap(xpos, int(ypos[i]), obstacle,
+                                            obstacle_xpos, obstacle_ypos)
+
+        return collided
+
+    def collide(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Método responsável por verificar quais pássaros colidiram com o chão
+        ou com os pipes, no modo de colisão da simulação.
+
+        Parâmetros
+        ----------
+            indices: np.ndarray
+                índices dos pássaros vivos
+
+        Retorno
+        -------
+            Array booleano indicando os pássaros que colidiram
+        """
+
+        if self.collision == "analytic":
+            return self.__collide_analytic(indices)
+
+        return self.__collide_mask(indices)
+
+    def step(self, policy: Callable[[np.ndarray, np.ndarray], np.ndarray]) -> None:
+        """
+        Método responsável por avançar a simulação em um quadro, seguindo a
+        mesma ordem do loop do jogo: troca dos pipes, movimento dos pássaros,
+        decisão das redes neurais, movimento do cenário e colisões.
+
+        Parâmetros
+        ----------
+            policy: Callable[[np.ndarray, np.ndarray], np.ndarray]
+                função que recebe os índices dos pássaros vivos e a matriz
+                com as entradas das redes neurais (uma linha por pássaro) e
+                retorna um array booleano indicando quais devem voar
+        """
+
+        profiler = self.profiler
+
+        with profiler.phase("physics"):
+            # Verifica se o pipe saiu da tela pela esquerda
+            if self.pipe_xpos[self.pipe_head] + PIPE_WIDTH <= 0:
+                self.score += 1
+                self.__add_pipes(self.PIPE_SPAWN_XPOS)
+
+            indices = np.flatnonzero(self.alive)
+
+            # Aplica a gravidade e o fitness a todos os pássaros vivos. A
+            # posição é truncada da mesma forma que o `pygame.Rect`
+            velocity = self.bird_velocity[indices] + GRAVITY_CONSTANT
+            ypos = np.trunc(self.bird_ypos[indices] + velocity).astype(np.int64)
+
+            self.fitness[indices] += self.FITNESS_PER_FRAME
+
+        # Monta as entradas das redes neurais
+        with profiler.phase("sensors"):
+            inputs = read_sensors(self, self.sensors, ypos, velocity, self.bird_lane[indices])
+
+        flaps = np.asarray(policy(indices, inputs), dtype=bool)
+
+        with profiler.phase("movement"):
+            # Aplica o voo
+            velocity[flaps] = self.FLY_VELOCITY
+
+            self.bird_velocity[indices] = velocity
+            self.bird_ypos[indices] = ypos
+
+            # Desloca o chão e os pipes para a esquerda
+            self.ground_xpos[self.ground_xpos + GROUND_WIDTH <= 0] = SCREEN_WIDTH
+            self.ground_xpos -= self.speed
+            self.pipe_xpos -= self.speed
+
+        # Remove os pássaros que colidiram ou sairam da tela
+        with profiler.phase("collision"):
+            dead = (ypos < 0) | (ypos > SCREEN_HEIGHT)
+            dead[~dead] = self.collide(indices[~dead])
+
+        self.frame += 1
+        self.alive[indices[dead]] = False
+        self.death_frame[indices[dead]] = self.frame
+
+    def is_over(self) -> bool:
+        """
+        Método que indica se todos os pássaros já morreram.
+
+        Retorno
+        -------
+            True se não restar nenhum pássaro vivo
+        """
+
+        return not self.alive.any()
+
+    def lane_fitness(self) -> np.ndarray:
+        """
+        Método responsável por separar o fitness dos pássaros por faixa.
+
+        Retorno
+        -------
+            Matriz com o fitness de cada pássaro, uma linha por faixa
+        """
+
+        return self.fitness.reshape(self.lanes, self.population_size)
+
+    def genome_fitness(self, aggregation: Text = "mean") -> np.ndarray:
+        """
+        Método responsável por combinar o fitness que cada genoma alcançou
+        em todas as faixas. Com uma única faixa, o resultado é o próprio
+        fitness dos pássaros.
+
+        Parâmetros
+        ----------
+            aggregation: Text, optional
+                forma de combinação, "mean" ou "min"
+
+        Retorno
+        -------
+            Array com o fitness de cada genoma
+        """
+
+        return aggregate_fitness(self.lane_fitness(), aggregation)
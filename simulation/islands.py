@@ -0,0 +1,553 @@
+import copy
+import queue
+import random
+import time
+import traceback
+from multiprocessing import Event, Process, Queue
+from typing import Any, Dict, List, Optional, Sequence, Text
+
+import neat
+
+from simulation.cache import NetworkCache
+from simulation.compiler import configure_genome
+from simulation.course import Course
+from simulation.engine import Shape, Simulation
+from simulation.parallel import evaluate_genomes
+from simulation.termination import TerminationPolicy
+from config import (
+    ISLANDS,
+    MIGRATION_INTERVAL,
+    MIGRANTS,
+    SENSORS,
+    EVAL_COURSES,
+    FITNESS_AGGREGATION,
+)
+
+
+class _MigrationReporter(neat.reporting.BaseReporter):
+    """
+    Reporter do NEAT que troca genomas entre as ilhas. A cada intervalo de
+    gerações os melhores genomas avaliados são enviados para a próxima ilha,
+    e os genomas recebidos substituem os filhos mais novos da população
+    seguinte, que é então dividida em espécies novamente. A troca não espera
+    as outras ilhas: os genomas que ainda não chegaram entram na próxima
+    migração.
+
+    Atributos
+    ---------
+        inbox: Queue
+            fila dos genomas recebidos
+        outbox: Queue
+            fila dos genomas enviados
+        interval: int
+            quantidade de gerações entre as migrações
+        migrants: int
+            quantidade de genomas enviados e recebidos em cada migração
+        reproduction: neat.DefaultReproduction
+            reprodução da população, que numera os genomas recebidos
+        species_set: neat.DefaultSpeciesSet
+            espécies da população
+        received: int
+            quantidade de genomas recebidos
+    """
+
+    def __init__(self, inbox: Queue, outbox: Queue, interval: int, migrants: int,
+                 reproduction: neat.DefaultReproduction,
+                 species_set: neat.DefaultSpeciesSet) -> None:
+        """
+        Método de inicialização da classe _MigrationReporter.
+
+        Parâmetros
+        ----------
+            inbox: Queue
+                fila dos genomas recebidos
+            outbox: Queue
+                fila dos genomas enviados
+            interval: int
+                quantidade de gerações entre as migrações
+            migrants: int
+                quantidade de genomas enviados em cada migração
+            reproduction: neat.DefaultReproduction
+                reprodução da população
+            species_set: neat.DefaultSpeciesSet
+                espécies da população
+        """
+
+        self.inbox = inbox
+        self.outbox = outbox
+        self.interval = interval
+        self.migrants = migrants
+        self.reproduction = reproduction
+        self.species_set = species_set
+        self.received = 0
+
+        self.__generation = 0
+
+    def __migrating(self) -> bool:
+        """
+        Método que indica se a geração atual termina com uma migração.
+
+        Retorno
+        -------
+            True se os genomas devem ser trocados nesta geração
+        """
+
+        return self.migrants > 0 and (self.__generation + 1) % self.interval == 0
+
+    def start_generation(self, generation: int) -> None:
+        """
+        Método chamado pelo NEAT no início de cada geração.
+
+        Parâmetros
+        ----------
+            generation: int
+                número da geração
+        """
+
+        self.__generation = generation
+
+    def post_evaluate(self, config: neat.Config, population: Dict[int, Any],
+                      species: neat.DefaultSpeciesSet, best_genome: Any) -> None:
+        """
+        Método chamado pelo NEAT após a avaliação, enviando cópias dos
+        melhores genomas para a próxima ilha.
+
+        Parâmetros
+        ----------
+            config: neat.Config
+                variável contendo a configuração do algoritimo
+            population: Dict[int, Any]
+                genomas da geração
+            species: neat.DefaultSpeciesSet
+                conjunto de espécies
+            best_genome: Any
+                melhor genoma da geração
+        """
+
+        if not self.__migrating():
+            return
+
+        best = sorted(population.values(), key=lambda genome: genome.fitness, reverse=True)
+        self.outbox.put([copy.deepcopy(genome) for genome in best[:self.migrants]])
+
+    def end_generation(self, config: neat.Config, population: Dict[int, Any],
+                       species_set: neat.DefaultSpeciesSet) -> None:
+        """
+        Método chamado pelo NEAT com a próxima geração já criada, colocando
+        nela os genomas recebidos das outras ilhas.
+
+        Parâmetros
+        ----------
+            config: neat.Config
+                variável contendo a configuração do algoritimo
+            population: Dict[int, Any]
+                população da próxima geração, alterada no lugar
+            species_set: neat.DefaultSpeciesSet
+                espécies da próxima geração
+        """
+
+        if not self.__migrating():
+            return
+
+        immigrants = []
+
+        while True:
+            try:
+                immigrants.extend(self.inbox.get_nowait())
+            except queue.Empty:
+                break
+
+        # Os elites são copiados com a chave original, então os filhos mais
+        # novos são os de maior chave
+        immigrants = immigrants[-self.migrants:]
+        replaced = sorted(population)[len(population) - len(immigrants):]
+
+        for key, genome in zip(replaced, immigrants):
+            del population[key]
+
+            genome.key = next(self.reproduction.genome_indexer)
+            genome.fitness = None
+            population[genome.key] = genome
+
+        if immigrants:
+            self.received += len(immigrants)
+            # Mesma geração usada pelo NEAT ao separar a população em espécies
+            self.species_set.speciate(config, population, self.__generation)
+
+
+class _IslandReporter(neat.reporting.BaseReporter):
+    """
+    Reporter do NEAT que envia as estatísticas de cada geração da ilha para
+    o coordenador.
+
+    Atributos
+    ---------
+        island: int
+            índice da ilha
+        results: Queue
+            fila das mensagens para o coordenador
+        solved: bool
+            indica se a ilha alcançou o fitness_threshold
+    """
+
+    def __init__(self, island: int, results: Queue) -> None:
+        """
+        Método de inicialização da classe _IslandReporter.
+
+        Parâmetros
+        ----------
+            island: int
+                índice da ilha
+            results: Queue
+                fila das mensagens para o coordenador
+        """
+
+        self.island = island
+        self.results = results
+        self.solved = False
+
+        self.__generation = 0
+        self.__start = 0.0
+
+    def start_generation(self, generation: int) -> None:
+        """
+        Método chamado pelo NEAT no início de cada geração.
+
+        Parâmetros
+        ----------
+            generation: int
+                número da geração
+        """
+
+        self.__generation = generation
+        self.__start = time.perf_counter()
+
+    def post_evaluate(self, config: neat.Config, population: Dict[int, Any],
+                      species: neat.DefaultSpeciesSet, best_genome: Any) -> None:
+        """
+        Método chamado pelo NEAT após a avaliação, enviando o resumo da
+        geração para o coordenador.
+
+        Parâmetros
+        ----------
+            config: neat.Config
+                variável contendo a configuração do algoritimo
+            population: Dict[int, Any]
+                genomas da geração
+            species: neat.DefaultSpeciesSet
+                conjunto de espécies
+            best_genome: Any
+                melhor genoma da geração
+        """
+
+        fitnesses = [genome.fitness for genome in population.values()]
+
+        self.results.put(("generation", self.island, {
+            "generation": self.__generation,
+            "best": best_genome.fitness,
+            "mean": sum(fitnesses) / len(fitnesses),
+            "species": len(species.species),
+            "size": len(population),
+            "seconds": time.perf_counter() - self.__start,
+        }))
+
+    def found_solution(self, config: neat.Config, generation: int, best: Any) -> None:
+        """
+        Método chamado pelo NEAT quando o fitness_threshold é alcançado.
+
+        Parâmetros
+        ----------
+            config: neat.Config
+                variável contendo a configuração do algoritimo
+            generation: int
+                número da geração
+            best: Any
+                melhor genoma da geração
+        """
+
+        self.solved = True
+
+
+def _run_island(island: int, config_file: Text, seed: int, generations: int,
+                inbox: Queue, outbox: Queue, results: Queue, stop: Event,
+                shapes: Dict[Text, Shape], options: Dict[Text, Any]) -> None:
+    """
+    Função executada no processo de cada ilha: cria uma população própria,
+    avalia as gerações sem interface e envia as estatísticas e o melhor
+    genoma para o coordenador.
+
+    Parâmetros
+    ----------
+        island: int
+            índice da ilha
+        config_file: Text
+            caminho do arquivo de configuração do NEAT da ilha
+        seed: int
+            semente da população e dos percursos da ilha
+        generations: int
+            quantidade máxima de gerações
+        inbox: Queue
+            fila dos genomas recebidos das outras ilhas
+        outbox: Queue
+            fila dos genomas enviados para a próxima ilha
+        results: Queue
+            fila das mensagens para o coordenador
+        stop: Event
+            sinaliza que alguma ilha alcançou o fitness_threshold
+        shapes: Dict[Text, Shape]
+            máscaras de colisão utilizadas pela simulação
+        options: Dict[Text, Any]
+            opções da avaliação, as mesmas para todas as ilhas
+    """
+
+    # Os genomas que não chegarem a ser lidos são descartados ao final
+    outbox.cancel_join_thread()
+
+    try:
+        random.seed(seed)
+        course_seeds = random.Random(seed)
+
+        config = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                             neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                             config_file)
+        configure_genome(config, options["sensors"])
+
+        simulation = Simulation(0, sensors=options["sensors"], **shapes)
+        cache = NetworkCache()
+        termination = options["termination"]
+        courses = None
+
+        if options["fixed_course"]:
+            courses = Course.suite(options["eval_courses"], seed)
+
+        def evaluate(genomes, config):
+            fitnesses = evaluate_genomes(
+                genomes, config, simulation,
+                courses or [Course(course_seeds.randrange(2 ** 32))
+                            for _ in range(options["eval_courses"])],
+                termination, cache, options["aggregation"],
+            )
+
+            for (_, genome), fitness in zip(genomes, fitnesses):
+                genome.fitness = fitness
+
+        population = neat.Population(config)
+        reporter = _IslandReporter(island, results)
+        migration = _MigrationReporter(
+            inbox, outbox, options["migration_interval"], options["migrants"],
+            population.reproduction, population.species,
+        )
+
+        population.add_reporter(reporter)
+        population.add_reporter(migration)
+
+        # Uma geração por vez, para atender o pedido de parada das outras
+        # ilhas
+        for _ in range(generations):
+            if stop.is_set():
+                break
+
+            population.run(evaluate, 1)
+
+            if reporter.solved:
+                stop.set()
+                break
+
+        results.put(("done", island, {
+            "genome": population.best_genome,
+            "generations": population.generation,
+            "received": migration.received,
+        }))
+    except Exception:
+        results.put(("error", island, traceback.format_exc()))
+
+
+class IslandModel:
+    """
+    Classe que coordena a evolução em ilhas: várias populações independentes,
+    cada uma em um processo, com a sua própria configuração e semente. Além
+    da avaliação, a especiação e a reprodução também são feitas em paralelo.
+    A cada `migration_interval` gerações, os melhores genomas de cada ilha
+    migram para a próxima, em anel. O coordenador recebe as estatísticas de
+    todas as ilhas e guarda o melhor genoma encontrado.
+
+    Atributos
+    ---------
+        islands: int
+            quantidade de ilhas
+        config_files: Sequence[Text]
+            arquivos de configuração das ilhas, repetidos em ordem quando há
+            mais ilhas do que arquivos
+        seeds: List[int]
+            semente de cada ilha
+        migration_interval: int
+            quantidade de gerações entre as migrações
+        migrants: int
+            quantidade de genomas enviados em cada migração
+        history: List[Dict[Text, Any]]
+            estatísticas de cada geração de cada ilha, na ordem de chegada
+        best_genome: neat.DefaultGenome
+            melhor genoma encontrado entre todas as ilhas
+
+    Métodos
+    -------
+        run(generations: int) -> neat.DefaultGenome:
+            executa a evolução e retorna o melhor genoma
+    """
+
+    def __init__(self, config_files: Sequence[Text], shapes: Dict[Text, Shape],
+                 islands: int = ISLANDS, seed: Optional[int] = None,
+                 migration_interval: int = MIGRATION_INTERVAL,
+                 migrants: int = MIGRANTS, sensors: Text = SENSORS,
+                 termination: Optional[TerminationPolicy] = None,
+                 eval_courses: int = EVAL_COURSES,
+                 aggregation: Text = FITNESS_AGGREGATION,
+                 fixed_course: bool = False) -> None:
+        """
+        Método de inicialização da classe IslandModel.
+
+        Parâmetros
+        ----------
+            config_files: Sequence[Text]
+                arquivos de configuração do NEAT das ilhas
+            shapes: Dict[Text, Shape]
+                máscaras de colisão utilizadas pela simulação
+            islands: int, optional
+                quantidade de ilhas
+            seed: int, optional
+                semente da primeira ilha. As outras usam as sementes
+                seguintes. Quando omitida, uma semente é sorteada
+            migration_interval: int, optional
+                quantidade de gerações entre as migrações
+            migrants: int, optional
+                quantidade de genomas enviados em cada migração
+            sensors: Text, optional
+                conjunto de sensores das redes neurais
+            termination: TerminationPolicy, optional
+                regras para encerrar cada avaliação antes do último pássaro
+                morrer
+            eval_courses: int, optional
+                quantidade de percursos jogados por cada genoma
+            aggregation: Text, optional
+                forma de combinar o fitness dos percursos
+            fixed_course: bool, optional
+                cada ilha joga sempre os mesmos percursos
+        """
+
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+
+        self.islands = islands
+        self.config_files = config_files
+        self.seeds = [seed + island for island in range(islands)]
+        self.migration_interval = migration_interval
+        self.migrants = migrants
+        self.history: List[Dict[Text, Any]] = []
+        self.best_genome = None
+
+        self.__shapes = shapes
+        self.__options = {
+            "sensors": sensors,
+            "termination": termination or TerminationPolicy(),
+            "eval_courses": eval_courses,
+            "aggregation": aggregation,
+            "fixed_course": fixed_course,
+            "migration_interval": migration_interval,
+            "migrants": migrants,
+        }
+
+    def run(self, generations: int) -> neat.DefaultGenome:
+        """
+        Método responsável por executar a evolução em todas as ilhas e
+        mostrar as estatísticas conforme elas chegam.
+
+        Parâmetros
+        ----------
+            generations: int
+                quantidade máxima de gerações de cada ilha
+
+        Retorno
+        -------
+            Melhor genoma encontrado entre todas as ilhas
+        """
+
+        results = Queue()
+        stop = Event()
+        inboxes = [Queue() for _ in range(self.islands)]
+
+        # As ilhas formam um anel, cada uma envia para a seguinte
+        processes = [
+            Process(target=_run_island, daemon=True, args=(
+                island, self.config_files[island % len(self.config_files)],
+                self.seeds[island], generations, inboxes[island],
+                inboxes[(island + 1) % self.islands], results, stop,
+                self.__shapes, self.__options,
+            ))
+            for island in range(self.islands)
+        ]
+
+        for process in processes:
+            process.start()
+
+        try:
+            running = self.islands
+
+            while running:
+                message, island, content = results.get()
+
+                if message == "generation":
+                    self.__report(island, content)
+                elif message == "done":
+                    running -= 1
+                    self.__finish(island, content)
+                else:
+                    raise RuntimeError(f"Erro na ilha {island}:\n{content}")
+
+            for process in processes:
+                process.join()
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+
+        return self.best_genome
+
+    def __report(self, island: int, stats: Dict[Text, Any]) -> None:
+        """
+        Método responsável por guardar e mostrar as estatísticas de uma
+        geração de uma ilha.
+
+        Parâmetros
+        ----------
+            island: int
+                índice da ilha
+            stats: Dict[Text, Any]
+                estatísticas da geração
+        """
+
+        self.history.append(dict(stats, island=island))
+
+        print("Island {0} - generation {generation}: best {best:.1f}, mean {mean:.1f}, "
+              "{species} species, {seconds:.2f}s".format(island, **stats))
+
+    def __finish(self, island: int, content: Dict[Text, Any]) -> None:
+        """
+        Método responsável por receber o resultado final de uma ilha e
+        atualizar o melhor genoma.
+
+        Parâmetros
+        ----------
+            island: int
+                índice da ilha
+            content: Dict[Text, Any]
+                melhor genoma e resumo da execução da ilha
+        """
+
+        genome = content["genome"]
+
+        print("Island {0} finished: {1} generations, best {2:.1f}, {3} genomes "
+              "received".format(island, content["generations"], genome.fitness,
+                                 content["received"]))
+
+        if self.best_genome is None or genome.fitness > self.best_genome.fitness:
+            self.best_genome = genome
@@ -0,0 +1,261 @@
+from typing import List, Sequence
+
+import numpy as np
+
+
+ACTIVATIONS: List[str] = ["tanh", "sigmoid", "relu", "identity"]
+
+
+def apply_activation(codes: np.ndarray, z: np.ndarray) -> np.ndarray:
+    """
+    Função responsável por aplicar as funções de ativação da biblioteca NEAT
+    de forma vetorial, utilizando as mesmas constantes de escala e limites.
+
+    Parâmetros
+    ----------
+        codes: np.ndarray
+            índice em `ACTIVATIONS` da função de ativação de cada neurônio
+        z: np.ndarray
+            valores agregados de cada neurônio
+
+    Retorno
+    -------
+        Array com a saída de cada neurônio
+    """
+
+    output = np.tanh(np.clip(2.5 * z, -60.0, 60.0))
+
+    # A tangente hiperbólica é a ativação configurada, as demais só são
+    # calculadas quando aparecem na camada
+    if codes.any():
+        sigmoid = 1.0 / (1.0 + np.exp(-np.clip(5.0 * z, -60.0, 60.0)))
+
+        output = np.where(codes == 1, sigmoid, output)
+        output = np.where(codes == 2, np.maximum(z, 0.0), output)
+        output = np.where(codes == 3, z, output)
+
+    return output
+
+
+class CompiledNetwork:
+    """
+    Classe que representa uma rede neural feed-forward já ordenada e
+    convertida em arrays. Os valores dos neurônios ficam em "slots": as
+    entradas ocupam os primeiros slots, seguidas das saídas e dos neurônios
+    ocultos.
+
+    Atributos
+    ---------
+        num_inputs: int
+            quantidade de entradas da rede
+        num_slots: int
+            quantidade total de slots de valores
+        output_slots: np.ndarray
+            slots das saídas da rede
+        layers: List[Dict[Text, np.ndarray]]
+            camadas na ordem de avaliação, cada uma com os arrays `nodes`,
+            `bias`, `response`, `activation`, `sources` e `weights`
+
+    Métodos
+    -------
+        activate(inputs: Sequence[float]) -> List[float]:
+            avalia a rede para uma única entrada
+    """
+
+    def __init__(self, num_inputs: int, num_slots: int,
+                 output_slots: Sequence[int], layers: List[dict]) -> None:
+        """
+        Método de inicialização da classe CompiledNetwork.
+
+        Parâmetros
+        ----------
+            num_inputs: int
+                quantidade de entradas da rede
+            num_slots: int
+                quantidade total de slots de valores
+            output_slots: Sequence[int]
+                slots das saídas da rede
+            layers: List[dict]
+                camadas na ordem de avaliação
+        """
+
+        self.num_inputs = num_inputs
+        self.num_slots = num_slots
+        self.output_slots = np.asarray(output_slots, dtype=np.int64)
+        self.layers = layers
+
+    def activate(self, inputs: Sequence[float]) -> List[float]:
+        """
+        Método responsável por avaliar a rede para uma única entrada, com a
+        mesma interface do `FeedForwardNetwork.activate`.
+
+        Parâmetros
+        ----------
+            inputs: Sequence[float]
+                valores de entrada da rede
+
+        Retorno
+        -------
+            Lista com os valores das saídas
+        """
+
+        outputs = BatchedNetwork([self]).activate(
+            np.zeros(1, dtype=np.int64), np.asarray([inputs], dtype=np.float64)
+        )
+
+        return outputs[0].tolist()
+
+
+class BatchedNetwork:
+    """
+    Classe responsável por avaliar as redes de toda uma geração em conjunto.
+    As camadas de mesma profundidade de todas as redes são empilhadas em
+    arrays preenchidos com zeros, de modo que cada quadro custa uma
+    multiplicação vetorial por profundidade, independente da quantidade de
+    pássaros.
+
+    Atributos
+    ---------
+        num_inputs: int
+            quantidade de entradas das redes
+        num_slots: int
+            quantidade de slots de valores, incluindo o slot de descarte
+        output_slots: np.ndarray
+            slots das saídas de cada rede
+        layers: List[Dict[Text, np.ndarray]]
+            camadas empilhadas por profundidade
+
+    Métodos
+    -------
+        activate(rows: np.ndarray, inputs: np.ndarray) -> np.ndarray:
+            avalia as redes das linhas informadas
+    """
+
+    def __init__(self, networks: Sequence[CompiledNetwork]) -> None:
+        """
+        Método de inicialização da classe BatchedNetwork.
+
+        Parâmetros
+        ----------
+            networks: Sequence[CompiledNetwork]
+                redes compiladas, uma por pássaro
+        """
+
+        self.num_inputs = networks[0].num_inputs if networks else 0
+
+        # O último slot recebe as saídas dos neurônios de preenchimento
+        scratch = max((net.num_slots for net in networks), default=self.num_inputs)
+        self.num_slots = scratch + 1
+
+        self.output_slots = np.zeros((len(networks), 0), dtype=np.int64)
+
+        if networks:
+            self.output_slots = np.stack([net.output_slots for net in networks])
+
+        depth = max((len(net.layers) for net in networks), default=0)
+        self.layers = [
+            self.__stack_layer(networks, d, scratch) for d in range(depth)
+        ]
+
+    @staticmethod
+    def __stack_layer(networks: Sequence[CompiledNetwork], depth: int,
+                      scratch: int) -> dict:
+        """
+        Método responsável por empilhar a camada de uma profundidade de todas
+        as redes em arrays de mesmo tamanho.
+
+        Parâmetros
+        ----------
+            networks: Sequence[CompiledNetwork]
+                redes compiladas, uma por pássaro
+            depth: int
+                profundidade da camada
+            scratch: int
+                slot onde os neurônios de preenchimento são escritos
+
+        Retorno
+        -------
+            Dicionário com os arrays da camada empilhada
+        """
+
+        layers = [
+            net.layers[depth] if depth < len(net.layers) else None
+            for net in networks
+        ]
+
+        width = max(len(layer["nodes"]) for layer in layers if layer is not None)
+        fan_in = max(
+            (layer["sources"].shape[1] for layer in layers if layer is not None),
+            default=0,
+        )
+
+        shape = (len(networks), width)
+        stacked = {
+            "nodes": np.full(shape, scratch, dtype=np.int64),
+            "bias": np.zeros(shape, dtype=np.float64),
+            "response": np.zeros(shape, dtype=np.float64),
+            "activation": np.zeros(shape, dtype=np.int64),
+            "sources": np.zeros(shape + (fan_in,), dtype=np.int64),
+            "weights": np.zeros(shape + (fan_in,), dtype=np.float64),
+        }
+
+        for i, layer in enumerate(layers):
+            if layer is None:
+                continue
+
+            size, links = layer["sources"].shape
+
+            for key in ("nodes", "bias", "response", "activation"):
+                stacked[key][i, :size] = layer[key]
+
+            stacked["sources"][i, :size, :links] = layer["sources"]
+            stacked["weights"][i, :size, :links] = layer["weights"]
+
+        stacked["mixed_activation"] = bool(stacked["activation"].any())
+
+        return stacked
+
+    def activate(self, rows: np.ndarray, inputs: np.ndarray) -> np.ndarray:
+        """
+        Método responsável por avaliar de uma só vez as redes das linhas
+        informadas. A soma das conexões é feita na mesma ordem do
+        `FeedForwardNetwork`, então as saídas só diferem dele pelo
+        arredondamento da tangente hiperbólica do NumPy.
+
+        Parâmetros
+        ----------
+            rows: np.ndarray
+                índices das redes que serão avaliadas
+            inputs: np.ndarray
+                entradas de cada rede, uma linha por índice
+
+        Retorno
+        -------
+            Matriz com as saídas de cada rede avaliada
+        """
+
+        count = len(rows)
+        batch = np.arange(count)[:, None]
+
+        values = np.zeros((count, self.num_slots), dtype=np.float64)
+        values[:, :self.num_inputs] = inputs
+
+        for layer in self.layers:
+            products = values[batch[:, :, None], layer["sources"][rows]] * layer["weights"][rows]
+
+            # Soma sequencial, na mesma ordem da função `sum` do Python
+            total = np.zeros(products.shape[:2], dtype=np.float64)
+
+            for k in range(products.shape[2]):
+                total += products[:, :, k]
+
+            z = layer["bias"][rows] + layer["response"][rows] * total
+
+            if layer["mixed_activation"]:
+                output = apply_activation(layer["activation"][rows], z)
+            else:
+                output = np.tanh(np.clip(2.5 * z, -60.0, 60.0))
+
+            values[batch, layer["nodes"][rows]] = output
+
+        return values[batch, self.output_slots[rows]]
@@ -0,0 +1,235 @@
+from multiprocessing import Pool
+from typing import Any, Dict, List, Optional, Sequence, Text, Tuple
+
+import neat
+
+from simulation.cache import NetworkCache
+from simulation.course import Course
+from simulation.engine import Shape, Simulation
+from simulation.network import BatchedNetwork
+from simulation.termination import TerminationPolicy
+from config import FITNESS_AGGREGATION, SENSORS
+
+
+# Estado de cada processo, preenchido uma única vez pelo `Pool`
+_worker: Dict[Text, object] = {}
+
+
+def _initialize_worker(config: neat.Config, shapes: Dict[Text, Shape],
+                       sensors: Text) -> None:
+    """
+    Função executada uma vez em cada processo para guardar a configuração
+    e criar a simulação e o cache de redes que serão reutilizados entre as
+    gerações.
+
+    Parâmetros
+    ----------
+        config: neat.Config
+            variável contendo a configuração do algoritimo
+        shapes: Dict[Text, Shape]
+            máscaras de colisão utilizadas pela simulação
+        sensors: Text
+            conjunto de sensores das redes neurais
+    """
+
+    _worker["config"] = config
+    _worker["simulation"] = Simulation(0, sensors=sensors, **shapes)
+    _worker["cache"] = NetworkCache()
+
+
+def evaluate_genomes(genomes: List[Tuple[int, neat.DefaultGenome]],
+                     config: neat.Config, simulation: Simulation,
+                     courses: Optional[Sequence[Course]] = None,
+                     termination: Optional[TerminationPolicy] = None,
+                     cache: Optional[NetworkCache] = None,
+                     aggregation: Text = FITNESS_AGGREGATION) -> List[float]:
+    """
+    Função responsável por jogar uma partida sem interface com os genomas
+    informados e calcular o fitness de cada um. Com vários percursos, todos
+    são jogados ao mesmo tempo, em faixas da mesma simulação, e o fitness de
+    cada percurso é combinado. Com um cache, apenas os genomas que ainda não
+    jogaram todos os percursos participam da partida.
+
+    Parâmetros
+    ----------
+        genomes: List[Tuple[int, neat.DefaultGenome]]
+            genomas que serão avaliados
+        config: neat.Config
+            variável contendo a configuração do algoritimo
+        simulation: Simulation
+            simulação que será reiniciada para a partida
+        courses: Sequence[Course], optional
+            percursos que serão jogados. Quando omitido, um único percurso
+            aleatório é jogado
+        termination: TerminationPolicy, optional
+            regras para encerrar a partida antes do último pássaro morrer
+        cache: NetworkCache, optional
+            redes compiladas e resultados das gerações anteriores
+        aggregation: Text, optional
+            forma de combinar o fitness dos percursos, "mean" ou "min"
+
+    Retorno
+    -------
+        Lista com o fitness de cada genoma, na mesma ordem recebida
+    """
+
+    cache = cache or NetworkCache()
+    courses = courses or [Course()]
+    termination = termination or TerminationPolicy()
+
+    # O fitness só pode ser reaproveitado quando não depende dos outros
+    # pássaros da partida
+    reuse = termination.independent()
+    results = [
+        cache.combined_fitness(genome, courses, aggregation, termination) if reuse else None
+        for _, genome in genomes
+    ]
+    pending = [i for i, fitness in enumerate(results) if fitness is None]
+
+    if not pending:
+        return results
+
+    network = BatchedNetwork([cache.network(genomes[i][1], config) for i in pending])
+
+    # Cada faixa repete os mesmos genomas, na mesma ordem. Voa se a saida
+    # for maior que o threshold
+    policy = lambda indices, inputs: network.activate(
+        indices % len(pending), inputs,
+    )[:, 0] > 0.5
+
+    simulation.reset(len(pending), courses)
+
+    while not termination.should_stop(simulation, aggregation):
+        simulation.step(policy)
+
+    termination.finalize(simulation)
+
+    for i, fitness in zip(pending, simulation.genome_fitness(aggregation).tolist()):
+        results[i] = fitness
+
+    if reuse:
+        for course, lane in zip(courses, simulation.lane_fitness().tolist()):
+            for i, fitness in zip(pending, lane):
+                cache.store(genomes[i][1], course, fitness, termination)
+
+    return results
+
+
+def _evaluate_shard(genomes: List[Tuple[int, neat.DefaultGenome]],
+                    settings: List[Dict[Text, Any]],
+                    termination: Optional[TerminationPolicy],
+                    aggregation: Text) -> List[float]:
+    """
+    Função executada nos processos para avaliar uma parte da população.
+
+    Parâmetros
+    ----------
+        genomes: List[Tuple[int, neat.DefaultGenome]]
+            parte da população que será avaliada pelo processo
+        settings: List[Dict[Text, Any]]
+            parâmetros dos percursos, os mesmos para todos os processos
+        termination: TerminationPolicy, optional
+            regras para encerrar a partida antes do último pássaro morrer
+        aggregation: Text
+            forma de combinar o fitness dos percursos
+
+    Retorno
+    -------
+        Lista com o fitness de cada genoma
+    """
+
+    return evaluate_genomes(genomes, _worker["config"], _worker["simulation"],
+                            [Course(**course) for course in settings], termination,
+                            _worker["cache"], aggregation)
+
+
+class ParallelEvaluator:
+    """
+    Classe responsável por dividir a população entre vários processos, cada
+    um com a sua própria simulação sem interface. Todos os processos jogam a
+    mesma sequência de pipes, então o resultado é igual ao de uma única
+    partida com a população inteira. A exceção são as regras de término que
+    dependem dos outros pássaros (elite e fitness_threshold), aplicadas
+    separadamente em cada processo.
+
+    Atributos
+    ---------
+        workers: int
+            quantidade de processos utilizados na avaliação
+
+    Métodos
+    -------
+        evaluate(genomes: List[Tuple[int, neat.DefaultGenome]],
+                 config: neat.Config, courses: Optional[Sequence[Course]] = None,
+                 termination: Optional[TerminationPolicy] = None,
+                 aggregation: Text = FITNESS_AGGREGATION) -> None:
+            calcula o fitness de todos os genomas da geração
+        close() -> None:
+            finaliza os processos
+    """
+
+    def __init__(self, workers: int, config: neat.Config,
+                 shapes: Dict[Text, Shape], sensors: Text = SENSORS) -> None:
+        """
+        Método de inicialização da classe ParallelEvaluator.
+
+        Parâmetros
+        ----------
+            workers: int
+                quantidade de processos utilizados na avaliação
+            config: neat.Config
+                variável contendo a configuração do algoritimo
+            shapes: Dict[Text, Shape]
+                máscaras de colisão utilizadas pela simulação
+            sensors: Text, optional
+                conjunto de sensores das redes neurais
+        """
+
+        self.workers = workers
+        self.__pool = Pool(workers, _initialize_worker, (config, shapes, sensors))
+
+    def evaluate(self, genomes: List[Tuple[int, neat.DefaultGenome]],
+                 config: neat.Config, courses: Optional[Sequence[Course]] = None,
+                 termination: Optional[TerminationPolicy] = None,
+                 aggregation: Text = FITNESS_AGGREGATION) -> None:
+        """
+        Método com a mesma assinatura do `eval_genomes`, responsável por
+        distribuir os genomas entre os processos e juntar os resultados.
+
+        Parâmetros
+        ----------
+            genomes: List[Tuple[int, neat.DefaultGenome]]
+                genomas que serão testados na geração corrente
+            config: neat.Config
+                variável contendo a configuração do algoritimo
+            courses: Sequence[Course], optional
+                percursos da geração. Quando omitido, um único percurso
+                aleatório é gerado
+            termination: TerminationPolicy, optional
+                regras para encerrar a partida antes do último pássaro morrer
+            aggregation: Text, optional
+                forma de combinar o fitness dos percursos, "mean" ou "min"
+        """
+
+        # Os mesmos percursos para toda a geração, enviados apenas pelos
+        # parâmetros, sem as aberturas geradas
+        settings = [course.settings() for course in courses or [Course()]]
+        size = -(-len(genomes) // self.workers)
+
+        shards = [genomes[i:i + size] for i in range(0, len(genomes), size)]
+        results = self.__pool.starmap(
+            _evaluate_shard,
+            [(shard, settings, termination, aggregation) for shard in shards],
+        )
+
+        for shard, fitnesses in zip(shards, results):
+            for (_, genome), fitness in zip(shard, fitnesses):
+                genome.fitness = fitness
+
+    def close(self) -> None:
+        """
+        Método responsável por finalizar os processos.
+        """
+
+        self.__pool.close()
+        self.__pool.join()
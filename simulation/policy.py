@@ -0,0 +1,183 @@
+from typing import Text
+
+import numpy as np
+
+from simulation.network import ACTIVATIONS, BatchedNetwork, CompiledNetwork
+from simulation.sensors import validate_sensors
+
+
+class Policy:
+    """
+    Classe que representa a rede de um genoma exportada para um arquivo
+    `.npz`, pronta para jogar sem a biblioteca NEAT. As camadas da rede
+    compilada são concatenadas na ordem de avaliação: os arrays dos
+    neurônios ficam em sequência, camada após camada, e as conexões de cada
+    camada são guardadas linha a linha, com a largura da sua maior entrada.
+    Carregar uma política é apenas ler esses arrays e fatiá-los.
+
+    Atributos
+    ---------
+        FORMAT_VERSION: int
+            versão do formato do arquivo
+        network: CompiledNetwork
+            rede compilada do genoma
+        sensors: Text
+            conjunto de sensores que forma as entradas da rede
+        genome_key: int
+            chave do genoma exportado
+        fitness: float
+            fitness do genoma no treinamento
+
+    Métodos
+    -------
+        decide(inputs: np.ndarray) -> np.ndarray:
+            decide, para cada linha de entradas, se o pássaro voa
+        save(filename: Text) -> None:
+            salva a política em um arquivo `.npz`
+        load(filename: Text) -> Policy:
+            carrega uma política salva
+    """
+
+    FORMAT_VERSION: int = 1
+
+    def __init__(self, network: CompiledNetwork, sensors: Text,
+                 genome_key: int = -1, fitness: float = 0.0) -> None:
+        """
+        Método de inicialização da classe Policy.
+
+        Parâmetros
+        ----------
+            network: CompiledNetwork
+                rede compilada do genoma
+            sensors: Text
+                conjunto de sensores que forma as entradas da rede
+            genome_key: int, optional
+                chave do genoma exportado
+            fitness: float, optional
+                fitness do genoma no treinamento
+        """
+
+        validate_sensors(sensors)
+
+        self.network = network
+        self.sensors = sensors
+        self.genome_key = int(genome_key)
+        self.fitness = float(fitness or 0.0)
+
+        self.__batched = BatchedNetwork([network])
+
+    def decide(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Método responsável por avaliar a rede para várias entradas de uma só
+        vez, com o mesmo critério usado no treinamento.
+
+        Parâmetros
+        ----------
+            inputs: np.ndarray
+                entradas da rede, uma linha por pássaro
+
+        Retorno
+        -------
+            Array booleano indicando os pássaros que devem voar
+        """
+
+        inputs = np.atleast_2d(np.asarray(inputs, dtype=np.float64))
+        output = self.__batched.activate(np.zeros(len(inputs), dtype=np.int64), inputs)
+
+        # Voa se a saida for maior que o threshold
+        return output[:, 0] > 0.5
+
+    def save(self, filename: Text) -> None:
+        """
+        Método responsável por salvar a política em um arquivo `.npz` sem
+        compressão, que contém apenas arrays numéricos e de texto.
+
+        Parâmetros
+        ----------
+            filename: Text
+                caminho do arquivo
+        """
+
+        layers = self.network.layers
+        concatenate = lambda key, dtype: np.concatenate(
+            [layer[key].ravel() for layer in layers] or [np.zeros(0)],
+        ).astype(dtype)
+
+        np.savez(
+            filename,
+            version=np.int64(self.FORMAT_VERSION),
+            sensors=np.str_(self.sensors),
+            activations=np.array(ACTIVATIONS),
+            genome_key=np.int64(self.genome_key),
+            fitness=np.float64(self.fitness),
+            num_inputs=np.int64(self.network.num_inputs),
+            num_slots=np.int64(self.network.num_slots),
+            output_slots=self.network.output_slots.astype(np.int64),
+            layer_sizes=np.array([len(layer["nodes"]) for layer in layers], dtype=np.int64),
+            layer_fan_in=np.array(
+                [layer["sources"].shape[1] for layer in layers], dtype=np.int64,
+            ),
+            nodes=concatenate("nodes", np.int64),
+            bias=concatenate("bias", np.float64),
+            response=concatenate("response", np.float64),
+            activation=concatenate("activation", np.int64),
+            sources=concatenate("sources", np.int64),
+            weights=concatenate("weights", np.float64),
+        )
+
+    @classmethod
+    def load(cls, filename: Text) -> "Policy":
+        """
+        Método responsável por carregar uma política salva, remontando as
+        camadas da rede a partir dos arrays concatenados.
+
+        Parâmetros
+        ----------
+            filename: Text
+                caminho do arquivo
+
+        Retorno
+        -------
+            Política carregada
+        """
+
+        with np.load(filename, allow_pickle=False) as data:
+            if int(data["version"]) != cls.FORMAT_VERSION:
+                raise ValueError(f"Versão de política não suportada: {int(data['version'])}")
+
+            # Os índices das ativações precisam ter o mesmo significado
+            activations = data["activations"].tolist()
+
+            if activations != ACTIVATIONS[:len(activations)]:
+                raise ValueError("Funções de ativação incompatíveis com a rede compilada")
+
+            sizes = data["layer_sizes"].tolist()
+            fan_ins = data["layer_fan_in"].tolist()
+            arrays = {key: data[key] for key in (
+                "nodes", "bias", "response", "activation", "sources", "weights",
+            )}
+
+            layers = []
+            node_start = link_start = 0
+
+            for size, fan_in in zip(sizes, fan_ins):
+                node_end = node_start + size
+                link_end = link_start + size * fan_in
+
+                layer = {
+                    key: arrays[key][node_start:node_end]
+                    for key in ("nodes", "bias", "response", "activation")
+                }
+                layer["sources"] = arrays["sources"][link_start:link_end].reshape(size, fan_in)
+                layer["weights"] = arrays["weights"][link_start:link_end].reshape(size, fan_in)
+
+                layers.append(layer)
+                node_start, link_start = node_end, link_end
+
+            network = CompiledNetwork(
+                int(data["num_inputs"]), int(data["num_slots"]),
+                data["output_slots"], layers,
+            )
+
+            return cls(network, str(data["sensors"]), int(data["genome_key"]),
+                       float(data["fitness"]))
@@ -0,0 +1,140 @@
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, List, Text
+
+import numpy as np
+
+
+# Contexto vazio compartilhado pelas fases quando o profiler está desligado,
+# evitando criar um objeto a cada medição
+_DISABLED = nullcontext()
+
+
+class PhaseProfiler:
+    """
+    Classe responsável por medir o tempo de cada fase do loop do jogo,
+    quadro a quadro. As medições são acumuladas até o fim da geração, quando
+    podem ser resumidas em estatísticas e histogramas.
+
+    Atributos
+    ---------
+        HISTOGRAM_BINS: np.ndarray
+            limites, em segundos, das faixas dos histogramas
+        enabled: bool
+            indica se as fases estão sendo medidas
+        samples: Dict[Text, List[float]]
+            duração de cada ocorrência de cada fase
+
+    Métodos
+    -------
+        phase(name: Text) -> ContextManager:
+            mede o tempo do bloco de código
+        add(name: Text, seconds: float) -> None:
+            registra uma medição feita fora do gerenciador de contexto
+        summary() -> Dict[Text, Dict[Text, Any]]:
+            resume as medições da geração
+        reset() -> None:
+            descarta as medições acumuladas
+    """
+
+    HISTOGRAM_BINS: np.ndarray = np.logspace(-7, 0, 15)
+
+    def __init__(self, enabled: bool = False) -> None:
+        """
+        Método de inicialização da classe PhaseProfiler.
+
+        Parâmetros
+        ----------
+            enabled: bool, optional
+                indica se as fases devem ser medidas
+        """
+
+        self.enabled = enabled
+        self.samples = {}
+
+    @contextmanager
+    def __measure(self, name: Text) -> Iterator[None]:
+        """
+        Método que mede o tempo de execução do bloco de código.
+
+        Parâmetros
+        ----------
+            name: Text
+                nome da fase
+        """
+
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def phase(self, name: Text):
+        """
+        Método responsável por medir uma fase com o comando `with`. Quando o
+        profiler está desligado nenhum tempo é medido.
+
+        Parâmetros
+        ----------
+            name: Text
+                nome da fase
+
+        Retorno
+        -------
+            Gerenciador de contexto da medição
+        """
+
+        if not self.enabled:
+            return _DISABLED
+
+        return self.__measure(name)
+
+    def add(self, name: Text, seconds: float) -> None:
+        """
+        Método responsável por registrar a duração de uma fase.
+
+        Parâmetros
+        ----------
+            name: Text
+                nome da fase
+            seconds: float
+                duração medida em segundos
+        """
+
+        self.samples.setdefault(name, []).append(seconds)
+
+    def summary(self) -> Dict[Text, Dict[Text, Any]]:
+        """
+        Método responsável por resumir as medições da geração.
+
+        Retorno
+        -------
+            Dicionário com a contagem, o total, a média, os percentis e o
+            histograma de cada fase
+        """
+
+        summary = {}
+
+        for name, samples in self.samples.items():
+            values = np.asarray(samples)
+            histogram, _ = np.histogram(values, self.HISTOGRAM_BINS)
+
+            summary[name] = {
+                "count": len(values),
+                "total": float(values.sum()),
+                "mean": float(values.mean()),
+                "p50": float(np.percentile(values, 50)),
+                "p95": float(np.percentile(values, 95)),
+                "max": float(values.max()),
+                "histogram": histogram.tolist(),
+            }
+
+        return summary
+
+    def reset(self) -> None:
+        """
+        Método responsável por descartar as medições acumuladas.
+        """
+
+        self.samples = {}
@@ -0,0 +1,314 @@
+from typing import Callable, Dict, List, Optional, Sequence, Text
+
+import numpy as np
+
+from simulation.course import Course
+from simulation.engine import Simulation
+from config import GAME_SPEED, PIPE_GAP
+
+
+class Episode:
+    """
+    Classe que representa uma partida gravada de forma compacta: a semente
+    do percurso, os quadros em que cada pássaro voou e o quadro em que cada
+    um morreu. Como a simulação é determinística, as ações bastam para
+    reconstruir a partida inteira sem executar as redes neurais.
+
+    Atributos
+    ---------
+        seed: int
+            semente do percurso jogado
+        frames: int
+            quantidade de quadros simulados na partida
+        death_frames: np.ndarray
+            quadro em que cada pássaro morreu, -1 para os sobreviventes
+        fitness: np.ndarray
+            fitness final de cada pássaro
+        flap_birds: np.ndarray
+            pássaro de cada voo registrado
+        flap_frames: np.ndarray
+            quadro de cada voo registrado
+        genome_keys: np.ndarray
+            chave do genoma de cada pássaro
+        gap: int
+            altura da abertura entre os pipes do percurso
+        speed: int
+            velocidade do percurso
+        spread: float
+            variação das aberturas do percurso
+
+    Métodos
+    -------
+        course() -> Course:
+            recria o percurso jogado
+        flaps(bird: int) -> np.ndarray:
+            recupera os quadros em que um pássaro voou
+        policy(simulation: Simulation, birds: Optional[Sequence[int]] = None) -> Callable:
+            cria a política que repete as ações gravadas
+        save(filename: Text) -> None:
+            salva o episódio em um arquivo `.npz` comprimido
+        load(filename: Text) -> Episode:
+            carrega um episódio salvo
+    """
+
+    def __init__(self, seed: int, frames: int, death_frames: np.ndarray,
+                 fitness: np.ndarray, flap_birds: np.ndarray,
+                 flap_frames: np.ndarray, genome_keys: np.ndarray,
+                 gap: int = PIPE_GAP, speed: int = GAME_SPEED,
+                 spread: float = 1.0) -> None:
+        """
+        Método de inicialização da classe Episode.
+
+        Parâmetros
+        ----------
+            seed: int
+                semente do percurso jogado
+            frames: int
+                quantidade de quadros simulados na partida
+            death_frames: np.ndarray
+                quadro em que cada pássaro morreu
+            fitness: np.ndarray
+                fitness final de cada pássaro
+            flap_birds: np.ndarray
+                pássaro de cada voo registrado
+            flap_frames: np.ndarray
+                quadro de cada voo registrado
+            genome_keys: np.ndarray
+                chave do genoma de cada pássaro
+            gap: int, optional
+                altura da abertura entre os pipes do percurso
+            speed: int, optional
+                velocidade do percurso
+            spread: float, optional
+                variação das aberturas do percurso
+        """
+
+        self.seed = int(seed)
+        self.frames = int(frames)
+        self.death_frames = death_frames
+        self.fitness = fitness
+        self.flap_birds = flap_birds
+        self.flap_frames = flap_frames
+        self.genome_keys = genome_keys
+        self.gap = int(gap)
+        self.speed = int(speed)
+        self.spread = float(spread)
+
+    def __len__(self) -> int:
+        """
+        Método que retorna a quantidade de pássaros da partida.
+        """
+
+        return len(self.death_frames)
+
+    def course(self) -> Course:
+        """
+        Método responsável por recriar o percurso jogado na partida, com a
+        mesma dificuldade.
+
+        Retorno
+        -------
+            Percurso da partida
+        """
+
+        return Course(self.seed, gap=self.gap, speed=self.speed, spread=self.spread)
+
+    def flaps(self, bird: int) -> np.ndarray:
+        """
+        Método responsável por recuperar os quadros em que um pássaro voou.
+
+        Parâmetros
+        ----------
+            bird: int
+                índice do pássaro na partida
+
+        Retorno
+        -------
+            Array com os quadros dos voos, em ordem
+        """
+
+        return self.flap_frames[self.flap_birds == bird]
+
+    def policy(self, simulation: Simulation,
+               birds: Optional[Sequence[int]] = None) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+        """
+        Método responsável por criar a política que repete as ações gravadas
+        em uma nova simulação. Os pássaros escolhidos ocupam as primeiras
+        posições da simulação, na ordem informada.
+
+        Parâmetros
+        ----------
+            simulation: Simulation
+                simulação que reproduzirá a partida
+            birds: Sequence[int], optional
+                pássaros reproduzidos. Quando omitido, todos são reproduzidos
+
+        Retorno
+        -------
+            Função com a mesma assinatura da política da simulação
+        """
+
+        birds = np.arange(len(self)) if birds is None else np.asarray(birds)
+
+        # Converte o índice de cada pássaro da partida para a nova simulação
+        rows = np.full(len(self), -1, dtype=np.int64)
+        rows[birds] = np.arange(len(birds))
+
+        selected = rows[self.flap_birds] >= 0
+        frames = self.flap_frames[selected]
+        flap_rows = rows[self.flap_birds[selected]]
+
+        # Agrupa os voos por quadro
+        order = np.argsort(frames, kind="stable")
+        unique, starts = np.unique(frames[order], return_index=True)
+        table: Dict[int, np.ndarray] = dict(
+            zip(unique.tolist(), np.split(flap_rows[order], starts[1:]))
+        )
+
+        def replay(indices: np.ndarray, inputs: np.ndarray) -> np.ndarray:
+            flapping = table.get(simulation.frame)
+
+            if flapping is None:
+                return np.zeros(len(indices), dtype=bool)
+
+            return np.isin(indices, flapping)
+
+        return replay
+
+    def save(self, filename: Text) -> None:
+        """
+        Método responsável por salvar o episódio em um arquivo `.npz`
+        comprimido.
+
+        Parâmetros
+        ----------
+            filename: Text
+                caminho do arquivo
+        """
+
+        np.savez_compressed(
+            filename,
+            seed=np.uint64(self.seed),
+            frames=np.int64(self.frames),
+            death_frames=self.death_frames.astype(np.int32),
+            fitness=self.fitness,
+            flap_birds=self.flap_birds.astype(np.int32),
+            flap_frames=self.flap_frames.astype(np.int32),
+            genome_keys=self.genome_keys.astype(np.int64),
+            gap=np.int64(self.gap),
+            speed=np.int64(self.speed),
+            spread=np.float64(self.spread),
+        )
+
+    @classmethod
+    def load(cls, filename: Text) -> "Episode":
+        """
+        Método responsável por carregar um episódio salvo.
+
+        Parâmetros
+        ----------
+            filename: Text
+                caminho do arquivo
+
+        Retorno
+        -------
+            Episódio carregado
+        """
+
+        with np.load(filename) as data:
+            return cls(**{key: data[key] for key in data.files})
+
+
+class ActionRecorder:
+    """
+    Classe que envolve a política da simulação para registrar os voos de
+    cada pássaro, sem alterar as decisões.
+
+    Atributos
+    ---------
+        simulation: Simulation
+            simulação gravada
+
+    Métodos
+    -------
+        episode(genome_keys: Optional[Sequence[int]] = None) -> Episode:
+            monta o episódio com as ações registradas
+    """
+
+    def __init__(self, simulation: Simulation,
+                 policy: Callable[[np.ndarray, np.ndarray], np.ndarray]) -> None:
+        """
+        Método de inicialização da classe ActionRecorder.
+
+        Parâmetros
+        ----------
+            simulation: Simulation
+                simulação gravada, já reiniciada para a partida
+            policy: Callable[[np.ndarray, np.ndarray], np.ndarray]
+                política que decide quais pássaros voam
+        """
+
+        self.simulation = simulation
+
+        self.__policy = policy
+        self.__birds: List[np.ndarray] = []
+        self.__frames: List[np.ndarray] = []
+
+    def __call__(self, indices: np.ndarray, inputs: np.ndarray) -> np.ndarray:
+        """
+        Método que executa a política e registra os pássaros que voaram.
+
+        Parâmetros
+        ----------
+            indices: np.ndarray
+                índices dos pássaros vivos na simulação
+            inputs: np.ndarray
+                entradas das redes neurais, uma linha por pássaro
+
+        Retorno
+        -------
+            Array booleano indicando os pássaros que devem voar
+        """
+
+        flaps = np.asarray(self.__policy(indices, inputs), dtype=bool)
+        flapping = indices[flaps]
+
+        if len(flapping):
+            self.__birds.append(flapping)
+            self.__frames.append(np.full(len(flapping), self.simulation.frame))
+
+        return flaps
+
+    def episode(self, genome_keys: Optional[Sequence[int]] = None) -> Episode:
+        """
+        Método responsável por montar o episódio com as ações registradas.
+
+        Parâmetros
+        ----------
+            genome_keys: Sequence[int], optional
+                chave do genoma de cada pássaro
+
+        Retorno
+        -------
+            Episódio da partida
+        """
+
+        simulation = self.simulation
+        course = simulation.course
+        empty = np.zeros(0, dtype=np.int64)
+
+        if genome_keys is None:
+            genome_keys = np.arange(len(simulation.alive))
+
+        return Episode(
+            course.seed,
+            simulation.frame,
+            simulation.death_frame.copy(),
+            simulation.fitness.copy(),
+            np.concatenate(self.__birds) if self.__birds else empty,
+            np.concatenate(self.__frames) if self.__frames else empty,
+            np.asarray(genome_keys),
+            course.gap,
+            course.speed,
+            course.spread,
+        )
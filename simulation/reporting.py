@@ -0,0 +1,98 @@
+import json
+from typing import Any, Dict, Text
+
+import neat
+
+from simulation.profiling import PhaseProfiler
+
+
+class ProfilingReporter(neat.reporting.BaseReporter):
+    """
+    Reporter do NEAT que mostra, ao fim de cada avaliação, quanto tempo cada
+    fase do loop consumiu e guarda o histórico de todas as gerações.
+
+    Atributos
+    ---------
+        profiler: PhaseProfiler
+            profiler utilizado pelo jogo
+        history: List[Dict[Text, Dict[Text, Any]]]
+            resumo de cada geração
+
+    Métodos
+    -------
+        save(filename: Text) -> None:
+            salva o histórico em um arquivo JSON
+    """
+
+    def __init__(self, profiler: PhaseProfiler) -> None:
+        """
+        Método de inicialização da classe ProfilingReporter.
+
+        Parâmetros
+        ----------
+            profiler: PhaseProfiler
+                profiler utilizado pelo jogo
+        """
+
+        self.profiler = profiler
+        self.history = []
+
+    def start_generation(self, generation: int) -> None:
+        """
+        Método chamado pelo NEAT no início de cada geração.
+
+        Parâmetros
+        ----------
+            generation: int
+                número da geração
+        """
+
+        self.profiler.reset()
+
+    def post_evaluate(self, config: neat.Config, population: Dict[int, Any],
+                      species: Any, best_genome: neat.DefaultGenome) -> None:
+        """
+        Método chamado pelo NEAT após a avaliação, mostrando o tempo de
+        cada fase da geração. As porcentagens são relativas à fase "frame",
+        que engloba todas as outras.
+
+        Parâmetros
+        ----------
+            config: neat.Config
+                variável contendo a configuração do algoritimo
+            population: Dict[int, Any]
+                genomas da geração
+            species: Any
+                conjunto de espécies
+            best_genome: neat.DefaultGenome
+                melhor genoma da geração
+        """
+
+        summary = self.profiler.summary()
+        self.history.append(summary)
+
+        total = summary.get("frame", {}).get("total") or 1.0
+
+        print("Phase timing (total / mean / p95):")
+
+        for name, phase in sorted(summary.items(), key=lambda item: -item[1]["total"]):
+            print("    {0:<12} {1:8.3f}s {2:10.1f}us {3:10.1f}us {4:6.1%}".format(
+                name, phase["total"], phase["mean"] * 1e6, phase["p95"] * 1e6,
+                phase["total"] / total,
+            ))
+
+    def save(self, filename: Text) -> None:
+        """
+        Método responsável por salvar o histórico em um arquivo JSON.
+
+        Parâmetros
+        ----------
+            filename: Text
+                caminho do arquivo
+        """
+
+        with open(filename, "w") as output:
+            json.dump({
+                "bins": PhaseProfiler.HISTOGRAM_BINS.tolist(),
+                "generations": self.history,
+            }, output, indent=4)
@@ -0,0 +1,112 @@
+from typing import Callable, Dict, Text, Tuple
+
+import numpy as np
+
+from config import PIPE_WIDTH, SCREEN_HEIGHT, SCREEN_WIDTH
+
+
+# Conjuntos de sensores disponíveis. O "classic" reproduz as entradas do
+# jogo original, incluindo o cálculo do centro do pássaro e o uso do par de
+# pipes mais antigo mesmo depois de ultrapassado
+SENSOR_SETS: Dict[Text, Tuple[Text, ...]] = {
+    "classic": ("bird_center", "gap_center"),
+    "rich": ("bird_ypos", "velocity", "pipe_distance", "gap_top", "gap_bottom"),
+}
+
+
+def _bird_center(simulation, ypos: np.ndarray, velocity: np.ndarray,
+                 pipe: int, lane: np.ndarray) -> np.ndarray:
+    return (ypos + simulation.bird_shape.height) // 2
+
+
+def _gap_center(simulation, ypos: np.ndarray, velocity: np.ndarray,
+                pipe: int, lane: np.ndarray) -> np.ndarray:
+    return simulation.gap_center(simulation.pipe_head)[lane]
+
+
+def _bird_ypos(simulation, ypos: np.ndarray, velocity: np.ndarray,
+               pipe: int, lane: np.ndarray) -> np.ndarray:
+    return (ypos + simulation.bird_shape.height / 2) / SCREEN_HEIGHT
+
+
+def _velocity(simulation, ypos: np.ndarray, velocity: np.ndarray,
+              pipe: int, lane: np.ndarray) -> np.ndarray:
+    return velocity / abs(simulation.FLY_VELOCITY)
+
+
+def _pipe_distance(simulation, ypos: np.ndarray, velocity: np.ndarray,
+                   pipe: int, lane: np.ndarray) -> float:
+    return (simulation.pipe_xpos[pipe] - simulation.BIRD_XPOS) / SCREEN_WIDTH
+
+
+def _gap_top(simulation, ypos: np.ndarray, velocity: np.ndarray,
+             pipe: int, lane: np.ndarray) -> np.ndarray:
+    return simulation.pipe_gap_top[pipe, lane] / SCREEN_HEIGHT
+
+
+def _gap_bottom(simulation, ypos: np.ndarray, velocity: np.ndarray,
+                pipe: int, lane: np.ndarray) -> np.ndarray:
+    return simulation.pipe_gap_bottom[pipe, lane] / SCREEN_HEIGHT
+
+
+# Cada sensor recebe a simulação, a posição e a velocidade dos pássaros
+# vivos, o slot do próximo par de pipes e a faixa de cada pássaro, e retorna um
+# valor por pássaro ou um único valor compartilhado por todos
+_SENSORS: Dict[Text, Callable[..., np.ndarray]] = {
+    "bird_center": _bird_center,
+    "gap_center": _gap_center,
+    "bird_ypos": _bird_ypos,
+    "velocity": _velocity,
+    "pipe_distance": _pipe_distance,
+    "gap_top": _gap_top,
+    "gap_bottom": _gap_bottom,
+}
+
+
+def validate_sensors(name: Text) -> None:
+    """
+    Função responsável por verificar se o conjunto de sensores existe.
+
+    Parâmetros
+    ----------
+        name: Text
+            nome do conjunto de sensores
+    """
+
+    if name not in SENSOR_SETS:
+        raise ValueError(f"Conjunto de sensores desconhecido: {name}")
+
+
+def read_sensors(simulation, name: Text, ypos: np.ndarray,
+                 velocity: np.ndarray, lane: np.ndarray) -> np.ndarray:
+    """
+    Função responsável por calcular, de uma só vez, as entradas das redes
+    neurais de todos os pássaros vivos.
+
+    Parâmetros
+    ----------
+        simulation: Simulation
+            simulação em andamento
+        name: Text
+            nome do conjunto de sensores
+        ypos: np.ndarray
+            posição y dos pássaros vivos
+        velocity: np.ndarray
+            velocidade vertical dos pássaros vivos
+        lane: np.ndarray
+            faixa dos pássaros vivos, que define as aberturas dos pipes
+
+    Retorno
+    -------
+        Matriz com as entradas, uma linha por pássaro
+    """
+
+    sensors = SENSOR_SETS[name]
+    pipe = simulation.next_pipe()
+
+    inputs = np.empty((len(ypos), len(sensors)), dtype=np.float64)
+
+    for column, sensor in enumerate(sensors):
+        inputs[:, column] = _SENSORS[sensor](simulation, ypos, velocity, pipe, lane)
+
+    return inputs
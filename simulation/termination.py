@@ -0,0 +1,154 @@
+from typing import Hashable, Optional, Text
+
+from simulation.engine import Simulation
+from config import FITNESS_AGGREGATION
+
+
+class TerminationPolicy:
+    """
+    Classe responsável por decidir quando a avaliação de uma geração pode
+    terminar antes de todos os pássaros morrerem. Sem nenhum limite
+    configurado a partida segue até o último pássaro, como no jogo original.
+
+    Atributos
+    ---------
+        max_frames: int
+            quantidade máxima de quadros da avaliação
+        max_pipes: int
+            quantidade máxima de pipes ultrapassados na avaliação
+        fitness_threshold: float
+            fitness que encerra o treinamento do NEAT. A avaliação termina
+            assim que o fitness combinado de algum genoma o alcança, pois o
+            resultado do critério `max` já está garantido
+        elite_count: int
+            a avaliação termina quando restarem essa quantidade de pássaros
+            ou menos. Exige `max_frames`, até onde o fitness dos
+            sobreviventes é extrapolado
+
+    Métodos
+    -------
+        should_stop(simulation: Simulation,
+                    aggregation: Text = FITNESS_AGGREGATION) -> bool:
+            indica se a avaliação pode terminar
+        finalize(simulation: Simulation) -> None:
+            ajusta o fitness dos pássaros que sobreviveram
+        independent() -> bool:
+            indica se o fitness de cada pássaro depende apenas do seu genoma
+        key() -> Hashable:
+            identifica os limites que alteram o fitness de cada pássaro
+    """
+
+    def __init__(self, max_frames: Optional[int] = None,
+                 max_pipes: Optional[int] = None,
+                 fitness_threshold: Optional[float] = None,
+                 elite_count: int = 0) -> None:
+        """
+        Método de inicialização da classe TerminationPolicy.
+
+        Parâmetros
+        ----------
+            max_frames: int, optional
+                quantidade máxima de quadros da avaliação
+            max_pipes: int, optional
+                quantidade máxima de pipes ultrapassados
+            fitness_threshold: float, optional
+                fitness que encerra a avaliação assim que alcançado
+            elite_count: int, optional
+                quantidade de sobreviventes que encerra a avaliação
+        """
+
+        # Sem um horizonte, os sobreviventes seriam ordenados apenas pelo
+        # quadro em que a avaliação foi interrompida
+        if elite_count and max_frames is None:
+            raise ValueError("O critério de elite exige um limite de quadros")
+
+        self.max_frames = max_frames
+        self.max_pipes = max_pipes
+        self.fitness_threshold = fitness_threshold
+        self.elite_count = elite_count
+
+    def should_stop(self, simulation: Simulation,
+                    aggregation: Text = FITNESS_AGGREGATION) -> bool:
+        """
+        Método responsável por verificar se a avaliação pode terminar no
+        quadro atual.
+
+        Parâmetros
+        ----------
+            simulation: Simulation
+                simulação em andamento
+            aggregation: Text, optional
+                forma de combinar o fitness dos percursos, a mesma usada no
+                fitness dos genomas
+
+        Retorno
+        -------
+            True se a avaliação pode terminar
+        """
+
+        if simulation.is_over():
+            return True
+
+        if self.max_frames is not None and simulation.frame >= self.max_frames:
+            return True
+
+        if self.max_pipes is not None and simulation.score >= self.max_pipes:
+            return True
+
+        if self.elite_count and simulation.alive.sum() <= self.elite_count:
+            return True
+
+        # Com vários percursos, o que encerra o treinamento é o fitness
+        # combinado do genoma, e não o de um único pássaro
+        if self.fitness_threshold is not None:
+            return simulation.genome_fitness(aggregation).max() >= self.fitness_threshold
+
+        return False
+
+    def finalize(self, simulation: Simulation) -> None:
+        """
+        Método responsável por extrapolar o fitness dos pássaros que ainda
+        estavam vivos quando a avaliação foi interrompida. Com um limite de
+        quadros, os sobreviventes recebem o fitness que acumulariam até esse
+        limite. Sem ele, eles mantêm o fitness atual, que já é o maior da
+        geração.
+
+        Parâmetros
+        ----------
+            simulation: Simulation
+                simulação interrompida
+        """
+
+        if self.max_frames is None:
+            return
+
+        remaining = max(self.max_frames - simulation.frame, 0)
+        simulation.fitness[simulation.alive] += remaining * simulation.FITNESS_PER_FRAME
+
+    def independent(self) -> bool:
+        """
+        Método responsável por indicar se o fitness de cada pássaro depende
+        apenas do seu genoma e do percurso, ou seja, se o resultado de uma
+        avaliação pode ser reaproveitado em outra partida no mesmo percurso.
+        O critério de elite e o fitness_threshold dependem dos outros
+        pássaros, pois interrompem a partida de todos eles.
+
+        Retorno
+        -------
+            True se o fitness não depende dos outros pássaros
+        """
+
+        return not self.elite_count and self.fitness_threshold is None
+
+    def key(self) -> Hashable:
+        """
+        Método responsável por identificar os limites que alteram o fitness
+        de cada pássaro, de modo que resultados obtidos com limites
+        diferentes não sejam confundidos.
+
+        Retorno
+        -------
+            Tupla com os limites de quadros e de pipes
+        """
+
+        return self.max_frames, self.max_pipes
@@ -0,0 +1,98 @@
+from typing import Dict, Optional, Text, Tuple
+
+import pygame
+from pygame.mask import Mask
+from pygame.surface import Surface
+
+
+# Superfícies e máscaras já carregadas, indexadas pelas transformações
+_images: Dict[tuple, Surface] = {}
+_masks: Dict[tuple, Mask] = {}
+
+
+def get_image(name: Text, size: Optional[Tuple[int, int]] = None,
+              flip: bool = False, convert: bool = False) -> Surface:
+    """
+    Função responsável por carregar uma imagem da pasta `assets` uma única
+    vez para cada combinação de tamanho, orientação e conversão. A mesma
+    superfície é compartilhada por todos os sprites, então ela não deve ser
+    alterada.
+
+    Parâmetros
+    ----------
+        name: Text
+            nome do arquivo da imagem, sem a extensão
+        size: Tuple[int, int], optional
+            tamanho para o qual a imagem será redimensionada
+        flip: bool, optional
+            inverte a imagem verticalmente
+        convert: bool, optional
+            converte a imagem para o formato da tela, o que exige uma janela
+            (ou o driver `dummy`) já criada
+
+    Retorno
+    -------
+        Superfície com a imagem transformada
+    """
+
+    key = (name, size, flip, convert)
+
+    if key not in _images:
+        if flip:
+            image = pygame.transform.flip(get_image(name, size, False, convert), False, True)
+        elif size is not None:
+            image = pygame.transform.scale(get_image(name, None, False, convert), size)
+        else:
+            image = pygame.image.load(f"assets/{name}.png")
+
+            if convert:
+                image = image.convert_alpha()
+
+        _images[key] = image
+
+    return _images[key]
+
+
+def get_mask(name: Text, size: Optional[Tuple[int, int]] = None,
+             flip: bool = False) -> Mask:
+    """
+    Função responsável por gerar a máscara de bits de uma imagem uma única
+    vez para cada combinação de tamanho e orientação.
+
+    Parâmetros
+    ----------
+        name: Text
+            nome do arquivo da imagem, sem a extensão
+        size: Tuple[int, int], optional
+            tamanho para o qual a imagem será redimensionada
+        flip: bool, optional
+            inverte a imagem verticalmente
+
+    Retorno
+    -------
+        Máscara de bits 2D compartilhada
+    """
+
+    key = (name, size, flip)
+
+    if key not in _masks:
+        _masks[key] = pygame.mask.from_surface(get_image(name, size, flip))
+
+    return _masks[key]
+
+
+def invalidate(name: Optional[Text] = None) -> None:
+    """
+    Função responsável por descartar as imagens e máscaras guardadas, por
+    exemplo quando o display é recriado ou um arquivo é alterado.
+
+    Parâmetros
+    ----------
+        name: Text, optional
+            nome da imagem que será descartada. Quando omitido, todo o cache
+            é descartado
+    """
+
+    for cache in (_images, _masks):
+        for key in [key for key in cache if name is None or key[0] == name]:
+            del cache[key]
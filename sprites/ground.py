@@ -1,66 +1,65 @@
 import pygame
-from pygame.sprite import Sprite
+from pygame.sprite import DirtySprite
+
+from sprites.assets import get_image
 
-from sprites.utils import is_horizontal_off_screen
 from config import (
-    GAME_SPEED,
+    SCREEN_WIDTH,
     SCREEN_HEIGHT,
     GROUND_WIDTH,
     GROUND_HEIGHT,
-    SCREEN_WIDTH,
 )
 
 
-class Ground(Sprite):
+class Ground(DirtySprite):
     """
-    Classe que representa o sprite do chão, lidando com o movimento.
+    Classe que representa o sprite do chão como uma faixa contínua. A imagem
+    do chão é repetida duas vezes em uma única superfície e apenas a janela
+    visível dela é desenhada, deslizando conforme o jogo avança.
 
     Atributos
     ---------
         image: pygame.Surface
-            objeto do pygame que representa a imagem do chão
-        mask: pygame.mask.Mask
-            objeto do pygame que representa a máscaras de bits 2D do chão
+            faixa com duas cópias da imagem do chão
+        source_rect: pygame.Rect
+            janela da faixa que aparece na tela
         rect: pygame.Rect
             objeto do pygame que armazena as cordenadas retangulares do chão
 
     Métodos
     -------
-        update() -> None:
+        update(offset: int) -> None:
             controlar como vai ocorrer a atualização do chão
     """
 
-    def __init__(self, xpos: int) -> None:
+    def __init__(self) -> None:
         """
-        Método de inicialização da classe Ground, gerenciando os sprites
-        do chão.
-
-        Parâmetros
-        ----------
-            xpos: int
-                posição em x onde o chão deve ser colocado inicialmente
+        Método de inicialização da classe Ground, montando a faixa do chão.
         """
 
-        Sprite.__init__(self)
+        DirtySprite.__init__(self)
 
-        self.image = pygame.image.load("assets/base.png")
-        self.image = pygame.transform.scale(self.image, (GROUND_WIDTH, GROUND_HEIGHT))
+        tile = get_image("base", (GROUND_WIDTH, GROUND_HEIGHT), convert=True)
 
-        self.mask = pygame.mask.from_surface(self.image)
-        self.rect = self.image.get_rect()
+        self.image = pygame.Surface((2 * GROUND_WIDTH, GROUND_HEIGHT)).convert()
+        self.image.blit(tile, (0, 0))
+        self.image.blit(tile, (GROUND_WIDTH, 0))
 
-        # posiciona o chão corretamente na tela
-        self.rect[0] = xpos
-        self.rect[1] = SCREEN_HEIGHT - GROUND_HEIGHT
+        self.source_rect = pygame.Rect(0, 0, SCREEN_WIDTH, GROUND_HEIGHT)
+        self.rect = pygame.Rect(0, SCREEN_HEIGHT - GROUND_HEIGHT, SCREEN_WIDTH, GROUND_HEIGHT)
 
-    def update(self) -> None:
+        # Está sempre em movimento, então é redesenhado a cada quadro
+        self.dirty = 2
+
+    def update(self, offset: int) -> None:
         """
         Método para controlar como vai ocorrer a atualização do chão,
-        incluindo deslocamento lateral e sensação de continuidade.
-        """
-
-        if is_horizontal_off_screen(self):
-            self.rect[0] = SCREEN_WIDTH
+        deslizando a janela visível da faixa.
 
-        self.rect[0] -= GAME_SPEED
+        Parâmetros
+        ----------
+            offset: int
+                deslocamento total do chão desde o início da partida
+        """
 
+        self.source_rect[0] = offset % GROUND_WIDTH
@@ -0,0 +1,73 @@
+from typing import Text, Tuple
+
+import pygame
+from pygame.sprite import DirtySprite
+
+
+class Label(DirtySprite):
+    """
+    Classe que representa um texto fixo na tela. A imagem só é renderizada
+    novamente, e o sprite só é redesenhado, quando o texto muda.
+
+    Atributos
+    ---------
+        FONT_SIZE: int
+            tamanho da fonte utilizada
+        COLOR: Tuple[int, int, int]
+            cor do texto
+        text: Text
+            texto mostrado
+        image: pygame.Surface
+            objeto do pygame que representa o texto renderizado
+        rect: pygame.Rect
+            objeto do pygame que armazena as cordenadas retangulares do texto
+
+    Métodos
+    -------
+        set_text(text: Text) -> None:
+            troca o texto mostrado
+    """
+
+    FONT_SIZE: int = 28
+    COLOR: Tuple[int, int, int] = (255, 255, 255)
+
+    def __init__(self, xpos: int, ypos: int, text: Text = "") -> None:
+        """
+        Método de inicialização da classe Label.
+
+        Parâmetros
+        ----------
+            xpos: int
+                coordenada x do canto esquerdo do texto
+            ypos: int
+                coordenada y do topo do texto
+            text: Text, optional
+                texto inicial
+        """
+
+        DirtySprite.__init__(self)
+
+        self.__font = pygame.font.Font(None, self.FONT_SIZE)
+        self.__position = (xpos, ypos)
+
+        self.text = None
+        self.set_text(text)
+
+    def set_text(self, text: Text) -> None:
+        """
+        Método para trocar o texto mostrado. Nada é feito quando o texto
+        não muda.
+
+        Parâmetros
+        ----------
+            text: Text
+                novo texto
+        """
+
+        if text == self.text:
+            return
+
+        self.text = text
+        self.image = self.__font.render(text, True, self.COLOR)
+        self.rect = self.image.get_rect(topleft=self.__position)
+        self.dirty = 1
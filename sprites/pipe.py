@@ -1,24 +1,24 @@
-from random import randint
 from typing import Tuple
 
-import pygame
-from pygame.sprite import Sprite
+from pygame.sprite import DirtySprite
 
+from sprites.assets import get_image, get_mask
 from config import (
-    GAME_SPEED,
-    SCREEN_HEIGHT,
     SCREEN_HEIGHT,
     PIPE_HEIGHT,
     PIPE_WIDTH,
-    PIPE_GAP,
 )
 
-class Pipe(Sprite):
+class Pipe(DirtySprite):
     """
-    Classe que representa o sprite do pipe, lidando com o movimento.
+    Classe que representa o sprite do pipe. O movimento é calculado pela
+    simulação e apenas copiado para o sprite, que é reposicionado quando a
+    simulação reaproveita o slot do seu par de pipes.
 
     Atributos
     ---------
+        inverted: bool
+            indica se o pipe é o de cima, invertido
         image: pygame.Surface
             objeto do pygame que representa a imagem do pipe
         mask: pygame.mask.Mask
@@ -28,10 +28,12 @@ class Pipe(Sprite):
 
     Métodos
     -------
-        update() -> None:
+        update(xpos: int) -> None:
             controla como vai ocorrer a atualização do pipe
-        get_random_pipes(xpos: int) -> Tuple[Pipe, Pipe]:
-            gera pipes com a abertura em um ponto aleatório
+        place(xpos: int, ysize: int) -> None:
+            reposiciona o pipe com uma nova altura
+        get_pipes(xpos: int, gap_top: int, gap_bottom: int) -> Tuple[Pipe, Pipe]:
+            gera pipes com a abertura no ponto indicado pela simulação
     """
 
     def __init__(self, inverted: bool, xpos: int, ysize: int) -> None:
@@ -49,49 +51,76 @@ class Pipe(Sprite):
                 altura total do pipe em pixels
         """
 
-        Sprite.__init__(self)
+        DirtySprite.__init__(self)
+
+        # Está sempre em movimento, então é redesenhado a cada quadro
+        self.dirty = 2
 
-        self.image = pygame.image.load("assets/pipe-green.png").convert_alpha()
-        self.image = pygame.transform.scale(self.image, (PIPE_WIDTH, PIPE_HEIGHT))
+        size = (PIPE_WIDTH, PIPE_HEIGHT)
 
-        self.mask = pygame.mask.from_surface(self.image)
+        # A imagem e a máscara são compartilhadas entre todos os pipes
+        self.inverted = inverted
+        self.image = get_image("pipe-green", size, inverted, convert=True)
+        self.mask = get_mask("pipe-green", size)
         self.rect = self.image.get_rect()
 
+        self.place(xpos, ysize)
+
+    def place(self, xpos: int, ysize: int) -> None:
+        """
+        Método responsável por reposicionar o pipe, sem recriar o sprite,
+        com a altura visível indicada.
+
+        Parâmetros
+        ----------
+            xpos: int
+                posição x do pipe
+            ysize: int
+                altura total do pipe em pixels
+        """
+
         self.rect[0] = xpos
         self.rect[1] = SCREEN_HEIGHT - ysize
 
-        # verifica se é necessário inverter o pipe, então gira a imagem em 180
-        if inverted:
-            self.image = pygame.transform.flip(self.image, False, True)
+        # verifica se é necessário inverter o pipe, usando a imagem girada
+        if self.inverted:
             self.rect[1] = - (self.rect[3] - ysize)
 
-    def update(self):
+    def update(self, xpos: int) -> None:
         """
         Método para controlar como vai ocorrer a atualização do pipe,
-        incluindo deslocamento lateral e sensação de continuidade.
+        copiando o deslocamento lateral calculado pela simulação.
+
+        Parâmetros
+        ----------
+            xpos: int
+                posição x do pipe na simulação
         """
 
-        self.rect[0] -= GAME_SPEED
+        self.rect[0] = xpos
 
     @classmethod
-    def get_random_pipes(cls, xpos: int) -> Tuple["Pipe", "Pipe"]:
+    def get_pipes(cls, xpos: int, gap_top: int,
+                  gap_bottom: int) -> Tuple["Pipe", "Pipe"]:
         """
         Método responsável por gerar dois pipes, um normal e outro invertido
-        com uma abertura em um ponto aleatório entre eles.
+        com a abertura entre as coordenadas informadas.
 
         Parâmetros
         ----------
             xpos: int
                 parâmetro que indica a posição inicial em x dos pipes
+            gap_top: int
+                coordenada y do início da abertura
+            gap_bottom: int
+                coordenada y do fim da abertura
 
         Retorno
         -------
             Tupla contendo duas instâncias da classe Pipe
         """
 
-        size = randint(100, 400)
-
         return (
-            cls(False, xpos, size),
-            cls(True, xpos, SCREEN_HEIGHT - size - PIPE_GAP)
+            cls(False, xpos, SCREEN_HEIGHT - gap_bottom),
+            cls(True, xpos, gap_top)
         )
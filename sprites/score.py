@@ -1,8 +1,9 @@
 from typing import List, Any
 
 import pygame
-from pygame.sprite import Sprite
+from pygame.sprite import DirtySprite, Sprite
 
+from sprites.assets import get_image
 from config import SCORE_TEXT_SCALE
 
 
@@ -24,6 +25,8 @@ class Digit(Sprite):
 
     Métodos
     -------
+        set_value(value: str) -> None:
+            troca o dígito mostrado pelo sprite
         set_position(xpos: int, ypos: int) -> None:
             atualiza a posição do dígito na tela
     """
@@ -43,13 +46,22 @@ class Digit(Sprite):
 
         Sprite.__init__(self)
 
-        self.image = pygame.image.load(f"assets/{value}.png")
-        self.image = pygame.transform.scale(
-            self.image, (self.DIGIT_WIDTH, self.DIGIT_HEIGHT)
-        )
-
+        self.set_value(value)
         self.rect = self.image.get_rect()
 
+    def set_value(self, value: str) -> None:
+        """
+        Método para trocar o dígito mostrado, reaproveitando o sprite. As
+        imagens dos dez dígitos são carregadas uma única vez pelo cache.
+
+        Parâmetros
+        ----------
+            value: str
+                string representando o novo dígito
+        """
+
+        self.image = get_image(value, (self.DIGIT_WIDTH, self.DIGIT_HEIGHT))
+
     def set_position(self, xpos: int, ypos: int) -> None:
         """
         Método para atualizar a posição do dígito na tela.
@@ -68,12 +80,16 @@ class Digit(Sprite):
 
 class Score:
     """
-    Classe que representa o sprite de um dígito.
+    Classe que representa o score mostrado na tela. Os sprites dos dígitos
+    são reaproveitados e só são reposicionados quando o valor muda.
 
     Atributos
     ---------
         DIGITS_GAP: int
             espaçamento entre os digitos na tela
+        sprite: pygame.sprite.DirtySprite
+            sprite com os dígitos já juntos, marcado para ser redesenhado
+            apenas quando o valor muda. Disponível somente no modo composto
 
     Métodos
     -------
@@ -87,7 +103,8 @@ class Score:
 
     DIGITS_GAP: int = 5
 
-    def __init__(self, score_value: int, xpos: int, ypos: int) -> None:
+    def __init__(self, score_value: int, xpos: int, ypos: int,
+                 composed: bool = False) -> None:
         """
         Método de inicialização da classe Score.
 
@@ -99,10 +116,21 @@ class Score:
                 coordenada x do centro do score na tela
             ypos: int
                 coordenada y do centro do score na tela
+            composed: bool, optional
+                junta os dígitos em uma única superfície, desenhada com uma
+                só chamada de `blit`
         """
 
         self.__xpos = xpos
         self.__ypos = ypos
+        self.__composed = composed
+
+        self.__value = None
+        self.__digits = []
+        self.__digits_group = pygame.sprite.Group()
+        self.__surface = None
+        self.__surface_rect = None
+        self.sprite = DirtySprite() if composed else None
 
         self.update_score(score_value)
 
@@ -119,7 +147,7 @@ class Score:
                 coordenada y do centro do score na tela
         """
 
-        reference = self.__digits_group.sprites()[0]
+        reference = self.__digits[0]
 
         total_digits = len(self.__digits)
         start_position = xpos - (
@@ -127,15 +155,36 @@ class Score:
         )
 
         # Define a posição de cada um dos dígtos na tela
-        for i, sprite in enumerate(self.__digits_group.sprites()):
+        for i, sprite in enumerate(self.__digits):
             sprite.set_position(
                 start_position + i * (sprite.rect[2] + self.DIGITS_GAP),
                 ypos
             )
 
+    def __compose(self) -> None:
+        """
+        Método responsável por desenhar todos os dígitos em uma única
+        superfície, que é reaproveitada até o valor mudar.
+        """
+
+        rects = [digit.rect for digit in self.__digits]
+        bounds = rects[0].unionall(rects[1:])
+
+        self.__surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+
+        for digit in self.__digits:
+            self.__surface.blit(digit.image, digit.rect.move(-bounds[0], -bounds[1]))
+
+        self.__surface_rect = bounds
+
+        self.sprite.image = self.__surface
+        self.sprite.rect = bounds
+        self.sprite.dirty = 1
+
     def update_score(self, value: int) -> None:
         """
-        Método responsável por atualizar o valor do score.
+        Método responsável por atualizar o valor do score. Nada é refeito
+        quando o valor não muda.
 
         Parâmetros
         ----------
@@ -143,18 +192,30 @@ class Score:
                 novo valor para o score
         """
 
-        self.__digits = list(str(value))
-        self.__digits_group = pygame.sprite.Group()
+        if value == self.__value:
+            return
 
-        # Instancia cada um dos dígitos que serão colocados na tela
-        for value in self.__digits:
-            self.__digits_group.add(
-                Digit(value)
-            )
+        self.__value = value
+        characters = str(value)
+
+        # Reaproveita os sprites existentes e cria apenas os que faltam
+        for digit, character in zip(self.__digits, characters):
+            digit.set_value(character)
+
+        for character in characters[len(self.__digits):]:
+            self.__digits.append(Digit(character))
+
+        del self.__digits[len(characters):]
+
+        self.__digits_group.empty()
+        self.__digits_group.add(self.__digits)
 
         # Posiciona dígito a dígito na tela
         self.__set_digits_position(self.__xpos, self.__ypos)
 
+        if self.__composed:
+            self.__compose()
+
     def update(self, *args: Any, **kwargs: Any) -> None:
         """
         Método para garantir que a interface do grupo seja mantida com o método
@@ -169,4 +230,7 @@ class Score:
         update.
         """
 
+        if self.__composed:
+            return [surface.blit(self.__surface, self.__surface_rect)]
+
         return self.__digits_group.draw(surface)
@@ -1,5 +1,17 @@
+from typing import Dict, Text
+
+from pygame.mask import Mask
 from pygame.sprite import Sprite
 
+from simulation.engine import Shape
+from sprites.assets import get_mask
+from config import (
+    GROUND_HEIGHT,
+    GROUND_WIDTH,
+    PIPE_HEIGHT,
+    PIPE_WIDTH,
+)
+
 
 def is_horizontal_off_screen(sprite: Sprite) -> bool:
     """
@@ -13,3 +25,51 @@ def is_horizontal_off_screen(sprite: Sprite) -> bool:
     """
 
     return (sprite.rect[0] + sprite.rect[2]) <= 0
+
+
+def mask_to_shape(mask: Mask) -> Shape:
+    """
+    Função responsável por converter a máscara de bits do pygame na máscara
+    de colisão utilizada pela simulação.
+
+    Parâmetros
+    ----------
+        mask: Mask
+            máscara de bits 2D gerada pelo pygame
+    """
+
+    width, height = mask.get_size()
+    rows = []
+
+    for y in range(height):
+        bits = 0
+
+        for x in range(width):
+            if mask.get_at((x, y)):
+                bits |= 1 << x
+
+        rows.append(bits)
+
+    return Shape(width, height, rows)
+
+
+def load_shapes() -> Dict[Text, Shape]:
+    """
+    Função responsável por carregar as máscaras de colisão dos sprites sem
+    precisar de uma janela aberta, para que a simulação possa rodar em
+    processos sem interface.
+
+    Retorno
+    -------
+        Dicionário com as máscaras no formato dos parâmetros da `Simulation`
+    """
+
+    pipe_shape = mask_to_shape(get_mask("pipe-green", (PIPE_WIDTH, PIPE_HEIGHT)))
+
+    # O sprite do pipe invertido gira apenas a imagem, mantendo a máscara
+    return {
+        "bird_shape": mask_to_shape(get_mask("bluebird-upflap")),
+        "pipe_shape": pipe_shape,
+        "inverted_pipe_shape": pipe_shape,
+        "ground_shape": mask_to_shape(get_mask("base", (GROUND_WIDTH, GROUND_HEIGHT))),
+    }